@@ -1,56 +1,77 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import logging
 import pygame
+from contextlib import nullcontext
+from threading import Thread
 from SaveGame import SaveGame
 from models.Bodies.PlayerBody import PlayerBody
 from models.Level.Level1 import Level1
 from models.Level.Level2 import Level2
 from views._ScreenHolder import _ScreenHolder
+from views.DirtyRenderer import DirtyRenderer
 from views.PauseScreen import PauseScreen
-from constants import COLORS, PLAYER_SIZE, ANTIALIASING, DEBUG
+from views.StatsOverlay import StatsOverlay
+from constants import COLORS, PLAYER_SIZE, DEBUG, PREBUILD_LEVELS
 
 
 class Game:
-    def __init__(self, screen, scr_size, managers, saved_state_name: str = None):
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(self, screen, scr_size, managers, saved_state_name: str = None, event_source=None):
         """ This is the general manager game class. It has the main functions and attributes which rule above
         all the rest.
 
         :param screen:
         :param scr_size:
-        :param saved_state_name: """
+        :param saved_state_name:
+        :param event_source: Callable returning the input events for every frame (pygame's event queue if None) """
         # Main game attributes
         self._screen = screen
         self._scrSize = scr_size
         self._managers = managers
-        self._font = pygame.font.SysFont('Calibri', 25, True, False)
+        self._eventSource = pygame.event.get if event_source is None else event_source
+        self._font = managers.font.get_font('Calibri', 25, True)
         # Endgame (also a truly brutal Megadeth album)
         self.gameOver = False
         self.quit_all = False
         # GAME OVER text
-        self.gOverText = [self._font.render(_("GAME OVER"), ANTIALIASING, COLORS['WHITE']),
-                          self._font.render(_("Want to try again?"), ANTIALIASING, COLORS['WHITE']),
-                          self._font.render(_("Yes / No"), ANTIALIASING, COLORS['WHITE'])]
+        render = managers.localization.render
+        self.gOverText = [render(self._font, _("GAME OVER"), COLORS['WHITE']),
+                          render(self._font, _("Want to try again?"), COLORS['WHITE']),
+                          render(self._font, _("Yes / No"), COLORS['WHITE'])]
         self._pause = _ScreenHolder()
         self._save = _ScreenHolder()
+        self._frozenFrame = None            # Game frame shown behind the pause or save screens while they're open
+        # Frame statistics overlay
+        self._statsOverlay = StatsOverlay(screen, managers.stats, managers.font.get_font('Calibri', 16, True))\
+            if DEBUG and managers.stats is not None else None
         # Game loading
         saved_state = saved_state_name if saved_state_name is None else SaveGame.load_file(saved_state_name)
         # Player
         self.player = PlayerBody(COLORS['RED'], PLAYER_SIZE, PLAYER_SIZE, managers, saved_state)
-        # Levels
-        self.levels = {"Doom Valley": Level1(screen, scr_size, managers, self.player, DEBUG),
-                       "The RING": Level2(screen, scr_size, managers, self.player, DEBUG)}
-        self._init_player_location(saved_state, self.player, self.levels)
+        # Levels: they're built only when they're entered for the first time
+        self.levels = {"Doom Valley": Level1, "The RING": Level2}
+        self._nextLevels = {"Doom Valley": "The RING"}      # Level ID -> Level the player travels to from it
+        self._builtLevels = {}                              # Level ID -> Level instance
+        self._prebuilds = {}                                # Level ID -> Thread preloading its map in background
+        self._preloads = {}                                 # Level ID -> Its preloaded map and tile grid
+        self._level = None
+        # Level ID -> Item cells taken on it, for the levels loaded from the game file or already left
+        self._takenItems = {} if saved_state is None else dict(saved_state.get('TakenItems', {}))
+        self._init_player_location(saved_state, self.player)
         # We activate the music in the current level
         self._level.set_theme()
 
     # ---------- Public Methods ----------------------
     def event_handler(self):
+        events = self._eventSource()
         if self._pause.flag:
-            return self._handle_screen_events(self._pause, self._pause_screen_cleaning)
+            return self._handle_screen_events(self._pause, self._pause_screen_cleaning, events)
         elif self._save.flag:
-            return self._handle_screen_events(self._save, self._save_screen_cleaning)
+            return self._handle_screen_events(self._save, self._save_screen_cleaning, events)
         else:
-            return self._handle_game_screen_events()
+            return self._handle_game_screen_events(events)
 
     def run_logic(self):
         if not self.gameOver:
@@ -68,56 +89,158 @@ class Game:
                         self.gameOver = True
                     else:
                         self._managers.sound.stop_music()
-                        self._level = self.levels['The RING']
-                        self.player.rect.x = self._level.levelInit[0]
-                        self.player.rect.y = self._level.levelInit[1]
-                        self.player.plainLevel = self._level.plainLevel
+                        self._enter_level(self._nextLevels[self._level.ID])
                         # We activate the music in the current level
                         self._level.set_theme()
 
-    def display_frame(self):
-        """ This function displays all graphic resources and effects """
-        self._screen.fill(COLORS['GREY'])                   # BLACK
+    def display_frame(self, alpha: float = 1.0):
+        """ This function displays all graphic resources and effects
+
+        :param alpha: Progress between the latest two logic updates, for drawing the level smoothly """
+        # The pause screen is drawn over the game frame frozen when it was opened, repainting only what changes
+        if self._pause.flag and not self.gameOver:
+            rects = self._pause.screen.display()
+            if self._statsOverlay is None:
+                DirtyRenderer.present(rects)
+            else:
+                self._statsOverlay.display()
+                self._pause.screen.invalidate()
+                pygame.display.flip()
+            return
+
         # Checks if the player still lives on
         if self.gameOver:
+            self._screen.fill(COLORS['GREY'])               # BLACK
             self._screen.blit(self.gOverText[0], [(self._scrSize[0] / 2) - 45, self._scrSize[1] / 2 - 50])
             self._screen.blit(self.gOverText[1], [(self._scrSize[0] / 2) - 70, self._scrSize[1] / 2 - 25])
             self._screen.blit(self.gOverText[2], [(self._scrSize[0] / 2) - 50, self._scrSize[1] / 2 + 50])
-        else:
-            self._level.display()
-            # This logic allows us to cover our game screen with the pause screen,
+        elif self._save.flag:
+            # This logic allows us to cover our game screen with the save screen,
             # stopping all mechanics and events in game except those who are involved in the
-            # pause screen logic flow, but also letting us to see a static impression of the
-            # game behind the pause screen.
-            if self._pause.flag:
-                self._pause.screen.display()
-            elif self._save.flag:
-                self._save.screen.display()
+            # save screen logic flow, but also letting us to see a static impression of the
+            # game behind the save screen, frozen when it was opened.
+            self._screen.blit(self._frozenFrame, (0, 0))
+            self._save.screen.display()
+        else:
+            self._screen.fill(COLORS['GREY'])               # BLACK
+            self._level.display(alpha)
+        if self._statsOverlay is not None:
+            self._statsOverlay.display()
         # --- This is 'update' for pygame library
         pygame.display.flip()
 
+    def step(self, n_frames: int = 1, render: bool = True) -> bool:
+        """ Runs a number of frames as fast as the CPU allows, without keeping the frame rate. Meant for headless
+        runs, where input comes from a scripted event source.
+
+        :param n_frames: Frames to run
+        :param render: Displays every frame if True
+        :return: True if the game asked for a scene switch (the remaining frames are not run); False otherwise """
+        stats = self._managers.stats
+        for frame in range(n_frames):
+            if stats is not None:
+                stats.begin_frame()
+            with self._phase('events'):
+                switch = self.event_handler()
+            with self._phase('logic'):
+                self.run_logic()
+            if render:
+                with self._phase('display'):
+                    self.display_frame()
+            if stats is not None:
+                stats.end_frame()
+            if switch:
+                return True
+
+        return False
+
+    def unload(self):
+        """ Unloads every level built so far, the current one included, and closes the maps preloaded for levels
+        never entered (after waiting for any preload still running). Call it when the game is left, as the levels
+        hold shared images and their map files """
+        for prebuild in self._prebuilds.values():
+            prebuild.join()
+        self._prebuilds.clear()
+        for level_file, tile_grid in self._preloads.values():
+            level_file.close()
+        self._preloads.clear()
+        for level in self._builtLevels.values():
+            level.unload()
+        self._builtLevels.clear()
+        self._level = None
+
     def quit_game(self):
         self._managers.sound.panic()
         self.quit_all = True
         return True
 
     # ---------- Internal Methods ----------------------
-    def _init_player_location(self, saved_state: dict, player, levels: dict):
+    def _phase(self, name: str):
+        """ :return: A context timing a frame phase, if there's a stats manager """
+        return nullcontext() if self._managers.stats is None else self._managers.stats.phase(name)
+
+    def _init_player_location(self, saved_state: dict, player):
         if saved_state is not None:
             # You've a game saved, so you start in the level and position stored
-            self._level = levels[saved_state['Level']['ID']]
+            self._enter_level(saved_state['Level']['ID'])
             player.rect.x = saved_state['Level']['PositionX']
             player.rect.y = saved_state['Level']['PositionY']
         else:
             # Don't have a game file? You start where everyone does (We respect and support equality)
-            self._level = levels['Doom Valley']
-            player.rect.x = self._level.levelInit[0]
-            player.rect.y = self._level.levelInit[1]
+            self._enter_level('Doom Valley')
+
+    def _enter_level(self, level_id: str):
+        """ Leaves the current level, unloading it (but remembering its taken items), and places the player at the
+        beginning of another one. The map of the level the player may travel to from there starts being read in the
+        background.
+
+        :param level_id: The entered level """
+        if self._level is not None:
+            self._takenItems[self._level.ID] = self._level.taken_cells()
+            self._level.unload()
+            del self._builtLevels[self._level.ID]
+
+        self._level = self._get_level(level_id)
+        self._level.take_items(self._takenItems.get(level_id, ()))
+        self.player.rect.x = self._level.levelInit[0]
+        self.player.rect.y = self._level.levelInit[1]
+        self.player.plainLevel = self._level.plainLevel
+        self.player.fallLimit = self._level.fallLimit
+
+        next_level = self._nextLevels.get(level_id)
+        if PREBUILD_LEVELS and next_level is not None and next_level not in self._builtLevels \
+                and next_level not in self._prebuilds:
+            prebuild = Thread(target=self._preload_level, args=(next_level,), name=f"Preload {next_level}",
+                              daemon=True)
+            self._prebuilds[next_level] = prebuild
+            prebuild.start()
 
-        player.plainLevel = self._level.plainLevel
+    def _get_level(self, level_id: str):
+        """ :return: The asked level, building it now if it wasn't (waiting for its map preload if it's running) """
+        prebuild = self._prebuilds.pop(level_id, None)
+        if prebuild is not None:
+            prebuild.join()
 
-    def _handle_screen_events(self, screen_holder: _ScreenHolder, callback):
-        if screen_holder.screen.event_handler():
+        if level_id not in self._builtLevels:
+            self._builtLevels[level_id] = self._build_level(level_id)
+
+        return self._builtLevels[level_id]
+
+    def _build_level(self, level_id: str):
+        # Levels are always built on the main thread, as they create surfaces and take the player in
+        return self.levels[level_id](self._screen, self._scrSize, self._managers, self.player, DEBUG,
+                                     self._preloads.pop(level_id, None))
+
+    def _preload_level(self, level_id: str):
+        """ Reads the map of a level in the background: no pygame work happens here """
+        try:
+            self._preloads[level_id] = self.levels[level_id].preload()
+        except Exception:
+            # It will be read again when the level is entered, reporting the error then
+            self.LOGGER.exception(f"Level '{level_id}' couldn't be preloaded")
+
+    def _handle_screen_events(self, screen_holder: _ScreenHolder, callback, events: list):
+        if screen_holder.screen.event_handler(events):
             if screen_holder.screen.quit_all:
                 return self.quit_game()
             elif screen_holder.screen.resume:
@@ -129,12 +252,23 @@ class Game:
     def _save_screen_cleaning(self):
         self._level.player.saveFlag = False
         self._save = _ScreenHolder()
+        self._frozenFrame = None
 
     def _pause_screen_cleaning(self):
         self._pause = _ScreenHolder()
+        self._frozenFrame = None
+
+    def _freeze_frame(self) -> pygame.Surface:
+        """ Draws the current game frame once, to keep it behind a screen opened over the game
+
+        :return: The frozen frame """
+        self._screen.fill(COLORS['GREY'])
+        self._level.display()
+        self._frozenFrame = self._screen.copy()
+        return self._frozenFrame
 
-    def _handle_game_screen_events(self):
-        for event in pygame.event.get():
+    def _handle_game_screen_events(self, events: list):
+        for event in events:
             if event.type == pygame.QUIT:
                 return self.quit_game()
             if event.type == pygame.KEYDOWN:
@@ -149,11 +283,15 @@ class Game:
                 if event.key == pygame.K_DOWN:
                     self.player.direction.down = True
                 if event.key == pygame.K_p:
-                    screen = PauseScreen(self._screen, self._scrSize, self._managers, self._level.player)
+                    screen = PauseScreen(self._screen, self._scrSize, self._managers, self._level.player,
+                                         self._freeze_frame())
                     self._pause = _ScreenHolder(screen, True)
                 if event.key == pygame.K_TAB:
                     if self._level.player.saveFlag:
-                        self._save = _ScreenHolder(SaveGame(self._screen, self._scrSize, self._level), True)
+                        self._freeze_frame()
+                        screen = SaveGame(self._screen, self._scrSize, self._managers, self._level,
+                                          self._takenItems)
+                        self._save = _ScreenHolder(screen, True)
 
             if event.type == pygame.KEYUP:
                 if event.key == pygame.K_LEFT:
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pygame
+from os import environ
+from constants import SCR_HEIGHT, SCR_WIDTH
+
+""" Tools for running the game on machines with no display nor sound device, such as test or benchmark ones.
+    Frames are run through the 'step' methods in 'Game' and '_LevelBase', as fast as the CPU allows, and the
+    player input comes from a script instead of pygame's event queue:
+
+        screen = init_headless(managers)
+        script = ScriptedInput().hold(0, 120, pygame.K_RIGHT)
+        game = Game(screen, (SCR_WIDTH, SCR_HEIGHT), managers, event_source=script)
+        game.step(1000) """
+
+
+def init_headless(managers=None, scr_size=(SCR_WIDTH, SCR_HEIGHT), lang: str = "en"):
+    """ Starts pygame over SDL's dummy video and audio drivers
+
+    :param managers: The game manager container, which gets its managers ready if given
+    :param scr_size: The (invisible) screen size
+    :param lang: The game language
+    :return: A display instance """
+    environ['SDL_VIDEODRIVER'] = 'dummy'
+    environ['SDL_AUDIODRIVER'] = 'dummy'
+    pygame.init()
+    screen = pygame.display.set_mode(scr_size)
+    if managers is not None:
+        from PrimalRing import set_managers
+        set_managers(managers)
+        managers.localization.set_lang(lang)
+
+    return screen
+
+
+class ScriptedInput:
+    def __init__(self):
+        """ Input events source which replays a frame-by-frame script of key presses and releases """
+        self.frame = 0                  # Next frame asking for events
+        self._script = {}               # Frame -> Events
+
+    def press(self, frame: int, key: int):
+        self._add(frame, pygame.event.Event(pygame.KEYDOWN, key=key))
+        return self
+
+    def release(self, frame: int, key: int):
+        self._add(frame, pygame.event.Event(pygame.KEYUP, key=key))
+        return self
+
+    def hold(self, start: int, end: int, key: int):
+        """ Keeps a key pressed from the start frame until the end one """
+        return self.press(start, key).release(end, key)
+
+    def quit(self, frame: int):
+        self._add(frame, pygame.event.Event(pygame.QUIT))
+        return self
+
+    def __call__(self) -> list:
+        """ :return: The events scripted for the current frame """
+        events = self._script.pop(self.frame, [])
+        self.frame += 1
+        return events
+
+    def _add(self, frame: int, event):
+        self._script.setdefault(frame, []).append(event)
@@ -2,14 +2,18 @@
 # -*- coding: utf-8 -*-
 import pygame
 import logging
+from time import perf_counter
 from views.Title.TitleScreen import TitleScreen
 from views.Splash.SplashScreen import SplashScreen
 from managers import managers
+from managers.AnimationManager import AnimationManager
+from managers.FontManager import FontManager
 from managers.ImageManager import ImageManager
 from managers.SoundManager import SoundManager
+from managers.StatsManager import StatsManager
 from Game import Game
 from SaveGame import SaveGame
-from constants import SCR_HEIGHT, SCR_WIDTH, COLORS, FPS, FULL_SCREEN
+from constants import SCR_HEIGHT, SCR_WIDTH, COLORS, FPS, FULL_SCREEN, MAX_CATCH_UP, TICK_RATE
 
 """ This is the main game file, where all classes and functions are
     called from. Now it's a tiny file, but we're on developing, so
@@ -59,12 +63,36 @@ def configuration_preset(config, screen_size, managers):
 
 def set_game_window(img_manager: ImageManager):
     pygame.display.set_caption("Primal Ring")
-    icon = img_manager.load_image('Coin_Frames/coin.png')
-    icon.set_colorkey(COLORS['WHITE'])
+    icon = img_manager.load_image('Coin_Frames/coin.png', COLORS['WHITE'])
     pygame.display.set_icon(icon)
     pygame.mouse.set_visible(False)
 
 
+def set_managers(managers):
+    """ Gets the game sound, image, animation, font & stats managers ready (a display mode must be set already) """
+    managers.sound = SoundManager()
+    managers.image = ImageManager()
+    managers.animation = AnimationManager(managers.image)
+    managers.font = FontManager()
+    managers.stats = StatsManager()
+
+
+def run_logic_steps(scene, lag: float, step: float) -> tuple:
+    """ Runs as many fixed logic updates as the elapsed time asks for
+
+    :param scene: The current scene
+    :param lag: Elapsed time not simulated yet, in seconds
+    :param step: Time simulated by every logic update, in seconds
+    :return: The time left for the next frame and the run update count """
+    steps = 0
+    while lag >= step and steps < MAX_CATCH_UP:
+        scene.run_logic()
+        lag -= step
+        steps += 1
+    # Time the logic can't catch up with is dropped, so a slow frame doesn't turn into a spiral of slower ones
+    return min(lag, step), steps
+
+
 def main():
     """ Here is where all actions run together """
     pygame.init()
@@ -73,8 +101,7 @@ def main():
     # Setting game window's size
     screen_measurements = (SCR_WIDTH, SCR_HEIGHT)
     # We get the game sound & image managers
-    managers.sound = SoundManager()
-    managers.image = ImageManager()
+    set_managers(managers)
     # Here, we set many configuration properties, depending on our config file or a group of defined values
     # in case the config file is missing
     config = SaveGame.load_config()
@@ -84,16 +111,29 @@ def main():
     done = False
     # Used to manage how fast the screen updates
     clock = pygame.time.Clock()
+    # The logic runs on fixed steps, whatever the frame rate is
+    step = 1 / TICK_RATE
+    lag = step
+    last_time = perf_counter()
     # Scene pointer
     current_scene = SplashScreen(screen, screen_measurements, managers)
     # ---------------- MAIN LOOP -----------------
     while not done:
+        now = perf_counter()
+        lag += now - last_time
+        last_time = now
+        managers.stats.begin_frame()
         # 1st step: Handling events
-        switch = current_scene.event_handler()
+        with managers.stats.phase('events'):
+            switch = current_scene.event_handler()
         # 2nd step: Running game logic
-        current_scene.run_logic()
-        # 3rd step: Displaying all
-        current_scene.display_frame()
+        with managers.stats.phase('logic'):
+            lag, steps = run_logic_steps(current_scene, lag, step)
+        managers.stats.count('Logic steps', steps)
+        # 3rd step: Displaying all, in between the latest two logic updates
+        with managers.stats.phase('display'):
+            current_scene.display_frame(lag / step)
+        managers.stats.end_frame()
         # 4th step: Evaluating scene switching
         if switch:
             if isinstance(current_scene, SplashScreen) and current_scene.endSplash:
@@ -110,11 +150,13 @@ def main():
                 elif current_scene.flags['Quit']:
                     done = True
             elif isinstance(current_scene, Game) and not current_scene.quit_all:
+                # The levels are unloaded before the game is dropped
+                current_scene.unload()
                 current_scene = TitleScreen(screen, screen_measurements, managers, config)
                 current_scene.set_theme()
             else:
                 done = True
-        # --- Limit to 60 frames per second
+        # --- Limit the render frame rate
         clock.tick(FPS)
 
     pygame.quit()
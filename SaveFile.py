@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import io
+import pickle
+import struct
+import zlib
+
+
+class SaveFile:
+    """ Binary game file. A fixed header (magic, format version, flags, payload CRC-32 and size) is followed by the
+    payload, zlib compressed when that makes it smaller. The payload is a sequence of tagged sections, each one
+    prefixed by its tag and size, so readers skip the sections they don't know and new sections (such as one more
+    level's taken items) are just appended:
+
+        PLYR    Player statistics and location
+        ITEM    Item cells taken on a level (one section per level)
+
+    Files from before this format (pickled dicts) are still read, through an unpickler which refuses anything but
+    plain data. """
+    MAGIC = b'PRSV'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHHII')           # Magic, version, flags, payload CRC-32, payload size
+    SECTION = struct.Struct('<4sI')             # Tag, size
+    STRING = struct.Struct('<H')                # UTF-8 size, followed by the string bytes
+    # Life, max life, energy, max energy, coins, max wallet, position X, position Y
+    PLAYER_STATS = struct.Struct('<8i')
+    CELL = struct.Struct('<HH')                 # Column, row
+    COUNT = struct.Struct('<I')
+    # Sections
+    PLAYER = b'PLYR'
+    TAKEN_ITEMS = b'ITEM'
+    # Flags
+    COMPRESSED = 0x1
+
+    # ---------- Public Methods --------------------------
+    @classmethod
+    def encode(cls, player_status: dict, compress: bool = True) -> bytes:
+        """ Builds a game file
+
+        :param player_status: Player statistics, as gathered by the save game dialog; its optional 'TakenItems'
+                              entry holds the item cells taken on every level (level ID -> [(column, row)])
+        :param compress: Compresses the payload if that makes it smaller
+        :return: The game file content """
+        level = player_status['Level']
+        stats = cls.PLAYER_STATS.pack(*player_status['Life'], *player_status['Energy'], *player_status['Coins'],
+                                      level['PositionX'], level['PositionY'])
+        sections = [cls._section(cls.PLAYER, stats + cls._string(player_status['Name']) + cls._string(level['ID']))]
+        for level_id, cells in player_status.get('TakenItems', {}).items():
+            cells = sorted(cells)
+            sections.append(cls._section(cls.TAKEN_ITEMS, b''.join(
+                [cls._string(level_id), cls.COUNT.pack(len(cells)), *(cls.CELL.pack(*cell) for cell in cells)])))
+
+        payload, flags = b''.join(sections), 0
+        if compress:
+            compressed = zlib.compress(payload)
+            if len(compressed) < len(payload):
+                payload, flags = compressed, cls.COMPRESSED
+
+        return cls.HEADER.pack(cls.MAGIC, cls.VERSION, flags, zlib.crc32(payload), len(payload)) + payload
+
+    @classmethod
+    def decode(cls, data: bytes) -> dict:
+        """ Reads a game file, whatever its format is
+
+        :param data: The game file content
+        :return: The player statistics, as given to 'encode'
+        :raise ValueError: If the file is damaged or it isn't a game file """
+        if not data.startswith(cls.MAGIC):
+            return cls.migrate(data)
+
+        sections = cls.sections(data)
+        if cls.PLAYER not in sections:
+            raise ValueError("The game file has no player section")
+
+        try:
+            status = cls._player(sections[cls.PLAYER][0])
+            status['TakenItems'] = dict(cls._taken_items(section) for section in sections.get(cls.TAKEN_ITEMS, ()))
+        except (struct.error, UnicodeDecodeError) as error:
+            raise ValueError(f"The game file is damaged: {error}") from error
+        return status
+
+    @classmethod
+    def sections(cls, data: bytes) -> dict:
+        """ Checks a game file and splits its payload
+
+        :param data: The game file content
+        :return: Section tag -> Section bodies, in file order
+        :raise ValueError: If the file is damaged or it's from a newer game version """
+        if len(data) < cls.HEADER.size:
+            raise ValueError("The game file is truncated")
+
+        magic, version, flags, checksum, size = cls.HEADER.unpack_from(data)
+        payload = data[cls.HEADER.size:]
+        if magic != cls.MAGIC:
+            raise ValueError("It isn't a game file")
+        if version > cls.VERSION:
+            raise ValueError(f"The game file version ({version}) is newer than this game's one ({cls.VERSION})")
+        if len(payload) != size or zlib.crc32(payload) != checksum:
+            raise ValueError("The game file is damaged")
+
+        sections, offset = {}, 0
+        try:
+            if flags & cls.COMPRESSED:
+                payload = zlib.decompress(payload)
+            while offset < len(payload):
+                tag, size = cls.SECTION.unpack_from(payload, offset)
+                offset += cls.SECTION.size
+                sections.setdefault(tag, []).append(payload[offset:offset + size])
+                offset += size
+        except (struct.error, zlib.error) as error:
+            raise ValueError(f"The game file is damaged: {error}") from error
+
+        return sections
+
+    @classmethod
+    def migrate(cls, data: bytes) -> dict:
+        """ Reads a game file saved before this format, as a pickled dict
+
+        :param data: The old game file content
+        :return: The player statistics
+        :raise ValueError: If the file isn't an old game file either, or its data is damaged """
+        try:
+            status = cls._PlainUnpickler(io.BytesIO(data)).load()
+        except (pickle.UnpicklingError, EOFError, ValueError, TypeError) as error:
+            raise ValueError(f"It isn't a game file: {error}") from error
+
+        if not isinstance(status, dict) or not {'Name', 'Life', 'Energy', 'Coins', 'Level'} <= status.keys():
+            raise ValueError("It isn't a game file")
+
+        # Old files were never checked, so nothing in them is trusted before it's played or upgraded
+        level, taken_items = status['Level'], status.setdefault('TakenItems', {})
+        if not isinstance(status['Name'], str) or \
+                not all(cls._is_ints(status[key], 2) for key in ('Life', 'Energy', 'Coins')):
+            raise ValueError("The game file has damaged player statistics")
+        if not isinstance(level, dict) or not isinstance(level.get('ID'), str) or \
+                not cls._is_ints((level.get('PositionX'), level.get('PositionY')), 2):
+            raise ValueError("The game file has a damaged player location")
+        if not isinstance(taken_items, dict) or \
+                not all(isinstance(level_id, str) and isinstance(cells, (list, tuple, set)) and
+                        all(cls._is_ints(cell, 2) for cell in cells) for level_id, cells in taken_items.items()):
+            raise ValueError("The game file has damaged taken items")
+
+        return status
+
+    # ---------- Internal Methods --------------------------
+    @classmethod
+    def _section(cls, tag: bytes, body: bytes) -> bytes:
+        return cls.SECTION.pack(tag, len(body)) + body
+
+    @classmethod
+    def _string(cls, text: str) -> bytes:
+        encoded = text.encode('utf-8')
+        return cls.STRING.pack(len(encoded)) + encoded
+
+    @classmethod
+    def _read_string(cls, body: bytes, offset: int) -> tuple:
+        """ :return: The string at an offset and the offset right after it """
+        size, = cls.STRING.unpack_from(body, offset)
+        offset += cls.STRING.size
+        return body[offset:offset + size].decode('utf-8'), offset + size
+
+    @classmethod
+    def _player(cls, body: bytes) -> dict:
+        life, max_life, energy, max_energy, coins, max_wallet, x, y = cls.PLAYER_STATS.unpack_from(body)
+        name, offset = cls._read_string(body, cls.PLAYER_STATS.size)
+        level_id, offset = cls._read_string(body, offset)
+        return {"Name": name,
+                "Life": [life, max_life],
+                "Energy": [energy, max_energy],
+                "Coins": [coins, max_wallet],
+                "Level": {'ID': level_id, 'PositionX': x, 'PositionY': y}}
+
+    @staticmethod
+    def _is_ints(values, count: int) -> bool:
+        """ :return: True if the values are a list or tuple of that many integers """
+        return isinstance(values, (list, tuple)) and len(values) == count and \
+            all(isinstance(value, int) for value in values)
+
+    @classmethod
+    def _taken_items(cls, body: bytes) -> tuple:
+        """ :return: The level ID and its taken item cells """
+        level_id, offset = cls._read_string(body, 0)
+        count, = cls.COUNT.unpack_from(body, offset)
+        offset += cls.COUNT.size
+        return level_id, [tuple(cell) for cell in cls.CELL.iter_unpack(body[offset:offset + count * cls.CELL.size])]
+
+    # ---------- Helpers --------------------------
+    class _PlainUnpickler(pickle.Unpickler):
+        """ Unpickler for old game files: they only hold plain data (dicts, lists, strings and numbers), which
+        never needs any global, so any global asked for is refused instead of being imported """
+        def find_class(self, module: str, name: str):
+            raise pickle.UnpicklingError(f"Forbidden global in a game file: {module}.{name}")
@@ -1,53 +1,64 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import pygame
-from pygame import Surface, font
-import pickle
+from pygame import Surface
 import json
 import logging
+import os
+from contextlib import suppress
 from os import walk
-from constants import COLORS, SURFACE_MID_ALPHA, ANTIALIASING, ROOT
+from tempfile import mkstemp
+from threading import Thread
+from SaveFile import SaveFile
+from constants import COLORS, SURFACE_MID_ALPHA, ROOT
 
 
 class SaveGame:
     LOGGER = logging.getLogger(__name__)
     SAVE_DIR = f'{ROOT}/saves/'
+    TEMP_EXTENSION = '.tmp'
 
-    def __init__(self, screen, scr_size, level, debug: bool = False):
+    def __init__(self, screen, scr_size, managers, level, taken_items: dict = None, debug: bool = False):
         """ This class will display the save game dialog and provide a set of load/save game tools
 
         :param screen: A reference for the main screen
         :param scr_size: The screen size (Default: 600 * 800)
+        :param managers: The game manager container
         :param level: A reference to the level and its statistics
+        :param taken_items: Item cells taken on the other levels, kept along with the current level ones
+                            (level ID -> [(column, row)])
         :param debug: Flag for debugging into the game
         """
         # ------ Attributes -----------------------
         self.quit_all = self.resume = False
         self.screen = screen
         self.level = level
+        self.takenItems = {} if taken_items is None else taken_items
         self.debug = debug
         # Setting a plane, transparent background
         self.background = Surface([scr_size[0], scr_size[1] / 4])
         self.bounds = [0, self.background.get_height() * 3]
         self.background.set_alpha(SURFACE_MID_ALPHA)
         # Setting the text font for the save menu
-        self.font = font.SysFont('Calibri', 25, True, False)
+        self.font = managers.font.get_font('Calibri', 25, True)
         # Save interface text (will include images on next versions)
-        self.game_saved = False
+        self.game_saved = False             # Set by the save worker once the game file is on disk
+        self.save_failed = False            # Set by the save worker if the game file couldn't be written
+        self._saver = None                  # Save worker thread
+        render = managers.localization.render
         self.saveText = [
-            self.font.render(_("Looking at this glittering spot fills you with det... "),
-                             ANTIALIASING, COLORS['WHITE']),
-            self.font.render(_("oh, wait, we don't want to be accused of plagiarism!"),
-                             ANTIALIASING, COLORS['WHITE']),
-            self.font.render(_("Do you want to save your game? Y: Yes; N: No"), ANTIALIASING, COLORS['WHITE']),
-            self.font.render(_("Game saved!"), ANTIALIASING, COLORS['WHITE'])]
+            render(self.font, _("Looking at this glittering spot fills you with det... "), COLORS['WHITE']),
+            render(self.font, _("oh, wait, we don't want to be accused of plagiarism!"), COLORS['WHITE']),
+            render(self.font, _("Do you want to save your game? Y: Yes; N: No"), COLORS['WHITE']),
+            render(self.font, _("Game saved!"), COLORS['WHITE']),
+            render(self.font, _("The game couldn't be saved"), COLORS['WHITE'])]
 
         if self.debug:
             pass
 
     # --------------- MAIN FLOW ---------------------
-    def event_handler(self):
-        for event in pygame.event.get():
+    def event_handler(self, events: list = None):
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 self.quit_all = True
                 return True
@@ -60,10 +71,9 @@ class SaveGame:
                 elif event.key == pygame.K_DOWN:
                     pass
                 elif event.key == pygame.K_y:  # 's' key
-                    self.save_file()
-                    # Game saved (Pfffiuuuu... what a relief)
-                    self.resume = True
-                    return True
+                    # The dialog keeps open until the game is saved (Pfffiuuuu... what a relief)
+                    if self._saver is None:
+                        self.save_file()
 
         return False
 
@@ -75,33 +85,71 @@ class SaveGame:
         self.screen.blit(self.background, self.bounds)
         self.screen.blit(self.saveText[0], [self.bounds[0] + 10, self.bounds[1] + 10])
         self.screen.blit(self.saveText[1], [self.bounds[0] + 10, self.bounds[1] + 35])
-        self.screen.blit(self.saveText[2], [self.bounds[0] + 10, self.bounds[1] + 60])
+        if self.game_saved:
+            self.screen.blit(self.saveText[3], [self.bounds[0] + 10, self.bounds[1] + 60])
+        elif self.save_failed:
+            self.screen.blit(self.saveText[4], [self.bounds[0] + 10, self.bounds[1] + 60])
+        else:
+            self.screen.blit(self.saveText[2], [self.bounds[0] + 10, self.bounds[1] + 60])
         if self.debug:
             pass
 
-    def save_file(self):
-        """ It gathers all game statistics we need to save and pushes them into a game file. Phew, that was close... """
+    def save_file(self) -> Thread:
+        """ It gathers all game statistics we need to save and pushes them into a game file. Phew, that was close...
+        The statistics are gathered right now, but the file is written by a background worker, so the game never
+        waits for the disk; 'game_saved' or 'save_failed' tell when it's done.
+
+        :return: The save worker thread """
+        # The game file keeps the items taken on every level, not only on the current one
+        taken_items = dict(self.takenItems)
+        taken_items[self.level.ID] = self.level.taken_cells()
         player_status = {"Name": self.level.player.name,
                          "Life": [self.level.player.life, self.level.player.maxLife],
                          "Energy": [self.level.player.energy, self.level.player.maxEnergy],
                          "Coins": [self.level.player.coins, self.level.player.maxWallet],
                          "Level": {'ID': self.level.ID,
-                                   'PositionX': self.level.player.rect.x + abs(self.level.reference[0].rect.x),
-                                   'PositionY': self.level.player.rect.y + abs(self.level.reference[0].rect.y)}}
+                                   'PositionX': self.level.player.rect.x,
+                                   'PositionY': self.level.player.rect.y},
+                         "TakenItems": taken_items}
+
+        self.game_saved = self.save_failed = False
+        # Not a daemon: quitting the game right after saving still waits for the file to be written
+        saver = Thread(target=self._save_worker, args=(f'{self.SAVE_DIR}{self.level.player.name}.sv', player_status),
+                       name='SaveGame')
+        # The worker clears '_saver' once it's done, which may happen before this method returns
+        self._saver = saver
+        saver.start()
+        return saver
+
+    @classmethod
+    def write_atomically(cls, file_path: str, data: bytes) -> None:
+        """ Writes a file so it's either fully replaced or left untouched, even if the game crashes meanwhile:
+        the data goes into a temporary file in the same folder, which is flushed to the disk and then renamed
 
+        :param file_path: The written file path
+        :param data: The whole file content """
+        directory = os.path.dirname(file_path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temp_path = mkstemp(prefix=f'{os.path.basename(file_path)}.', suffix=cls.TEMP_EXTENSION,
+                                        dir=directory)
         try:
-            with open(f'{self.SAVE_DIR}{self.level.player.name}.sv', "wb") as game_file:
-                pickle.dump(player_status, game_file)
-                self.LOGGER.info("Game saved successfully!")
-        except FileNotFoundError as fnf:
-            self.LOGGER.error(f"It seems there's a conflict with the saving directory: {fnf}")
-        except OSError as ose:
-            # We reach this if it's been some kind of issue while opening the file (maybe it has some restrictions,
-            # or a wild byte has broken into the filesystem and it's plundering). In any case, you can't open the
-            # file.
-            self.LOGGER.error(f"It seems there's a conflict with the saving directory: {ose}")
-        except pickle.PicklingError as pe:
-            self.LOGGER.error(f"The game couldn't be saved: {pe}")
+            with open(descriptor, 'wb') as temp_file:
+                temp_file.write(data)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, file_path)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+        # The rename itself is only durable once the folder entry reaches the disk (where folders can be synced)
+        if hasattr(os, 'O_DIRECTORY'):
+            folder = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(folder)
+            finally:
+                os.close(folder)
 
     @classmethod
     def load_file(cls, name: str):
@@ -111,11 +159,12 @@ class SaveGame:
         :param name: The game file's name
         :return: Your requested game data if succeed; None otherwise
         """
+        file_path = f'{cls.SAVE_DIR}{name}.sv'
         try:
-            with open(f'{cls.SAVE_DIR}{name}.sv', "rb") as game_file:
-                game_data = pickle.load(game_file)
-                cls.LOGGER.info(f"Game loaded successfully!")
-                return game_data
+            with open(file_path, "rb") as game_file:
+                data = game_file.read()
+            game_data = SaveFile.decode(data)
+            cls.LOGGER.info(f"Game loaded successfully!")
         except FileNotFoundError as fnf:
             # This exception can be reached if the user is playing a new game, or if anyone has messed up
             # with the save file and it's missing from its expected place.
@@ -125,8 +174,12 @@ class SaveGame:
             # or a wild byte has broken into the filesystem and it's plundering). In any case, you can't open the
             # file.
             cls.LOGGER.warning(f"Game couldn't be loaded: {ose}")
-        except pickle.UnpicklingError as pickle_err:
-            cls.LOGGER.error(f"Bad format file: {pickle_err.args}")
+        except ValueError as value_err:
+            cls.LOGGER.error(f"Bad format file: {value_err}")
+        else:
+            if not data.startswith(SaveFile.MAGIC):
+                cls._upgrade_file(file_path, game_data)
+            return game_data
 
     @classmethod
     def load_files(cls):
@@ -135,7 +188,9 @@ class SaveGame:
             files = []
             for save in walk(cls.SAVE_DIR):
                 for s in save[2]:
-                    files.append(s)
+                    # Leftovers of interrupted saves aren't games
+                    if not s.endswith(cls.TEMP_EXTENSION):
+                        files.append(s)
 
             if len(files) > 0:
                 cls.LOGGER.info(f"Game files loaded successfully!")
@@ -182,3 +237,32 @@ class SaveGame:
             # or a wild byte has broken into the filesystem and it's plundering). In any case, you can't open the
             # file.
             cls.LOGGER.warning(f"SO error: {ose}")
+
+    # --------------- METHODS ---------------------
+    def _save_worker(self, file_path: str, player_status: dict):
+        try:
+            self.write_atomically(file_path, SaveFile.encode(player_status))
+            self.LOGGER.info("Game saved successfully!")
+            self.game_saved = True
+        except OSError as ose:
+            # We reach this if it's been some kind of issue while writing the file (maybe the folder has some
+            # restrictions, or the disk is full). In any case, the previous game file is still there.
+            self.LOGGER.error(f"It seems there's a conflict with the saving directory: {ose}")
+            self.save_failed = True
+        except Exception:
+            # Nothing may stop the worker silently: the dialog would wait for it forever
+            self.LOGGER.exception("The game couldn't be saved")
+            self.save_failed = True
+        finally:
+            # The game can be saved again
+            self._saver = None
+
+    @classmethod
+    def _upgrade_file(cls, file_path: str, game_data: dict):
+        """ Rewrites a game file saved before the current format """
+        try:
+            cls.write_atomically(file_path, SaveFile.encode(game_data))
+            cls.LOGGER.info(f"Game file upgraded to version {SaveFile.VERSION}")
+        except Exception:
+            # The old file is still readable, so it will be upgraded some other time; loading it goes on anyway
+            cls.LOGGER.exception("Game file couldn't be upgraded")
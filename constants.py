@@ -14,12 +14,39 @@ SLIDER = (10, 30)                                           # X and Y slider con
 TICKER = {'Canvas': 16, 'Fill': 12}                         # Tick box dimensions
 # ------------ Pause Screen Attributes ---------------
 SURFACE_MID_ALPHA = 127                                     # Background's alpha value
+# ------------------ Logic updates -------------------
+FPS = 60                                                    # Render frame rate cap
+TICK_RATE = 60                                              # Logic updates per second
+TICK_SCALE = 60 / TICK_RATE                                 # Per-update quantities are tuned at 60 updates per
+                                                            # second: speeds are scaled by it, accelerations by its
+                                                            # square and update counts divided by it. Positions are
+                                                            # whole pixels, so speeds under half a pixel per update
+                                                            # are lost: keep the rate close to 60
+MAX_CATCH_UP = 5                                            # Logic updates run at most on a single frame
+FADE_STEP = 2 * TICK_SCALE                                  # Opacity change on every fading logic update
+CURSOR_SPEED = 1 * TICK_SCALE                               # Title cursor wiggling velocity
 # --------------------- BODIES -----------------------
 # --------------------- Player -----------------------
 PLAYER_SIZE = 40                                            # X and Y player's size
-MAX_FALL_VELOCITY = 10                                      # Player maximum fall velocity
+MAX_FALL_VELOCITY = 10 * TICK_SCALE                         # Player maximum fall velocity
+PLAYER_SPEED = 3 * TICK_SCALE                               # Player walking velocity
+JUMP_VELOCITY = 10 * TICK_SCALE                             # Player upward velocity when a jump starts
+AIRBORNE_VELOCITY = 0.7 * TICK_SCALE                        # Fall velocity the player is taken off the ground from
+# ------------------ Other bodies --------------------
+PLATFORM_SPEED = 1 * TICK_SCALE                             # Moving platforms velocity
+LAVA_BOUNCE = 5 * TICK_SCALE                                # Upward velocity of the player burnt by lava
+HOLE_PULL = 2 * TICK_SCALE                                  # Pixels a hole drags the player in on every update
 # ---------------------- Floor -----------------------
 FLOOR_SIZE = 50                                             # X and Y floor's size
+# ---------------------- Level -----------------------
+CHUNK_TILES = 16                                            # X and Y static tiles baked into a single chunk
+CHUNK_COLORKEY = [0xFF, 0x00, 0xFF]                         # Transparent color for the empty chunk spots
+CULL_MARGIN = 100                                           # Distance beyond the view where bodies are still active
+SNOW_FLAKES = 50                                            # Snow flakes falling on the snowy levels
+SNOW_FALL = 1 * TICK_SCALE                                  # Snow flakes fall velocity
+SNOW_DRIFT = 0.3 * TICK_SCALE                               # Snow flakes side to side sway
+SNOW_SWAY = 0.05 * TICK_SCALE                               # Snow flakes sway phase change, in radians per update
+STREAM_MARGIN = 400                                         # Distance beyond the view where level chunks are built
 # ---------------------- ITEMS -----------------------
 COIN_SIZE = 30                                              # X and Y coin's size
 LIFE_POWER_UP_SIZE = 40                                     # X and Y life power-up's size
@@ -32,8 +59,12 @@ COLORS = {'BLACK': [0x00, 0x00, 0x00],                      # Hex for black
           'GREEN': [0x00, 0xFF, 0x00],                      # Hex for green
           'BLUE': [0x00, 0x00, 0xFF],                       # Hex for blue
           'ORANGE': [0xFF, 0xFF, 0x00]}                     # Hex for orange
-FPS = 60                                                    # General FPS value
-GRAVITY = 0.35                                              # Gravity for all bodies
+GRAVITY = 0.35 * TICK_SCALE ** 2                            # Gravity for all bodies
+ANIMATION_DELAY = max(1, round(3 / TICK_SCALE))             # Logic updates every animation frame is shown for
 ANTIALIASING = True                                         # Smoothing text fonts
 DEBUG = False                                               # Reveals hidden statistics and more
+STATS_WINDOW = 300                                          # Latest frames kept for the frame statistics
+TEXT_CACHE_SIZE = 256                                       # Rendered texts kept by the localization manager
+PREBUILD_LEVELS = True                                      # Reads the next level map while the current one is played
 ROOT = path.dirname(path.realpath(sys.argv[0]))             # Root game path
+LEVEL_DIR = f'{ROOT}/resources/levels/'                     # Compiled level maps
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import logging
+import weakref
+from threading import RLock
+from constants import ANIMATION_DELAY, COLORS
+
+
+class AnimationManager:
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(self, image_manager):
+        """ Registry for the tile animations. All bodies showing the same animation share a single clock and a
+        single list of pre-colorkeyed frames, so advancing an animation costs the same for one tile or for a
+        hundred of them. Animations follow the image manager ownership: they're dropped when their owner is released
+        or garbage collected.
+
+        :param image_manager: The image manager, which loads all animation frames """
+        self._image = image_manager
+        self._animations = {}           # (Frames origin, frame count) -> Animation
+        self._owners = weakref.WeakKeyDictionary()      # Owner -> (Frames origin, frame count) keys it holds
+        self._unowned = set()           # (Frames origin, frame count) keys loaded without an owner
+        self._lock = RLock()
+
+    class Animation:
+        def __init__(self, frames: list, delay: int = ANIMATION_DELAY):
+            """ A sequence of frames with its own clock
+
+            :param frames: Animation frame surfaces
+            :param delay: Logic updates every frame is shown for """
+            self.frames = frames
+            self.index = 0
+            self.delay = delay
+            # Logic updates the current frame has been shown for
+            self.refresh = 0
+
+        @property
+        def frame(self):
+            """ :return: The current frame surface """
+            return self.frames[self.index]
+
+        def update(self) -> None:
+            self.refresh += 1
+            if self.refresh >= self.delay:
+                # We switch the current tile to next in a concrete sequence
+                self.index = self.index + 1 if self.index < len(self.frames) - 1 else 0
+                # We reset the refresh state
+                self.refresh = 0
+
+    # ------------- Public Methods -------------
+    def get(self, origin: str, quantity: int = 1):
+        """ Gets a shared animation, loading its frames on its first request. All frames come with a black
+        transparent color.
+
+        :param origin: The tile folder and image name in the format '{folder}/{image}'
+        :param quantity: Count of tiles for the animation
+        :return: The shared animation """
+        key = (origin, quantity)
+        with self._lock:
+            held = self._held(self._image.owner)
+            if key not in held:
+                # Loading the frames takes their image references for the current owner too
+                frames = [self._image.load_image(f'{origin}{i + 1}.png', COLORS['BLACK']) for i in range(quantity)]
+                if key not in self._animations:
+                    self._animations[key] = AnimationManager.Animation(frames)
+                held.add(key)
+
+            return self._animations[key]
+
+    def update(self) -> None:
+        """ Advances every animation once """
+        # Levels may be built on other threads meanwhile
+        for animation in tuple(self._animations.values()):
+            animation.update()
+
+    def release(self, owner) -> None:
+        """ Drops the animations only used by an owner
+
+        :param owner: The owner to release """
+        if owner is None:
+            return
+
+        with self._lock:
+            held = self._owners.pop(owner, None)
+            if held is not None:
+                self._drop(held)
+
+    # ------------- Internal Methods -------------
+    def _held(self, owner) -> set:
+        """ :return: The animation keys held by an owner """
+        if owner is None:
+            return self._unowned
+
+        held = self._owners.get(owner)
+        if held is None:
+            # Owners are only weakly referenced: one which is never released drops its animations when it's collected
+            held = self._owners[owner] = set()
+            weakref.finalize(owner, self._drop, held)
+        return held
+
+    def _drop(self, held: set) -> None:
+        """ Drops the animations only used by a released (or collected) owner
+
+        :param held: The animation keys held by the owner; it's emptied, so they're never dropped twice """
+        with self._lock:
+            # A collected owner may still be listed while its finalizer runs
+            others = [keys for keys in tuple(self._owners.values()) if keys is not held]
+            for key in held.difference(self._unowned, *others):
+                del self._animations[key]
+            held.clear()
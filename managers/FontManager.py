@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import logging
+from dataclasses import dataclass
+from threading import RLock
+from timeit import default_timer
+from pygame import font
+from constants import ROOT
+
+
+class FontManager:
+    LOGGER = logging.getLogger(__name__)
+    FILE_EXTENSIONS = ('.ttf', '.otf')
+
+    def __init__(self, font_dir: str = f'{ROOT}/resources/fonts/'):
+        """ Loads and shares every font in game. System fonts are looked up and font files are parsed only once
+        per face, size and style; later requests get the same font object back. It can be shared between threads.
+
+        :param font_dir: The font resources folder """
+        self._fontDir = font_dir
+        self._cache = {}            # (Face, size, bold, italic) -> Font
+        self._lock = RLock()
+        self.stats = FontManager.CacheStats()
+
+    @dataclass
+    class CacheStats:
+        hits: int = 0               # Requests served from the cache (warm)
+        misses: int = 0             # Requests which needed a lookup (cold)
+        coldTime: float = 0         # Seconds spent on cold requests
+        warmTime: float = 0         # Seconds spent on warm requests
+
+        def cold_mean(self) -> float:
+            """ :return: Mean seconds per cold request """
+            return self.coldTime / self.misses if self.misses else 0
+
+        def warm_mean(self) -> float:
+            """ :return: Mean seconds per warm request """
+            return self.warmTime / self.hits if self.hits else 0
+
+    # ------------- Public Methods -------------
+    def get_font(self, face: str, size: int, bold: bool = False, italic: bool = False):
+        """ Gets a font from the cache, resolving it only on its first request. The returned font is shared,
+        so don't change its style: ask for it here instead.
+
+        :param face: A font file name, relative to the font resources folder, or a system font name
+        :param size: Font size
+        :param bold: Bold style
+        :param italic: Italic style
+        :return: The shared font """
+        start = default_timer()
+        key = (face, size, bold, italic)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                cached = self._cache[key] = self._load(face, size, bold, italic)
+                self.stats.misses += 1
+                self.stats.coldTime += default_timer() - start
+                self.LOGGER.debug(f"Font {key} loaded in {default_timer() - start:.4f} s")
+            else:
+                self.stats.hits += 1
+                self.stats.warmTime += default_timer() - start
+
+        return cached
+
+    # ------------- Internal Methods -------------
+    def _load(self, face: str, size: int, bold: bool, italic: bool):
+        if not face.lower().endswith(self.FILE_EXTENSIONS):
+            return font.SysFont(face, size, bold, italic)
+
+        loaded = font.Font(f'{self._fontDir}{face}', size)
+        loaded.set_bold(bold)
+        loaded.set_italic(italic)
+        return loaded
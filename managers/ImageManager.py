@@ -1,15 +1,150 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import logging
-from pygame import image
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import local, RLock
+from pygame import image, Surface
 from constants import ROOT
 
 
 class ImageManager:
     LOGGER = logging.getLogger(__name__)
 
-    def __init__(self):
-        self._imageDir = f'{ROOT}/resources/images/'
+    def __init__(self, image_dir: str = f'{ROOT}/resources/images/'):
+        """ Loads and shares every image in game. Each asset is decoded only once and kept into a keyed cache;
+        levels (or any other owner) take references on the images they load, so the cache can evict them as soon
+        as their last owner releases them or is garbage collected. Images loaded without an owner stay cached until
+        the game ends.
+        It can be shared between threads: every thread loads for its own owner.
 
-    def load_image(self, image_name):
-        return image.load(f'{self._imageDir}/{image_name}').convert()
+        :param image_dir: The image resources folder """
+        self._imageDir = image_dir
+        self._cache = {}            # (Image name, colorkey) or ((width, height), color) -> Surface
+        self._refs = {}             # (Image name, colorkey) -> How many owners hold it
+        self._owners = weakref.WeakKeyDictionary()      # Owner -> (Image name, colorkey) keys it holds
+        self._unowned = set()       # (Image name, colorkey) keys loaded without an owner
+        self._local = local()       # Owner for the incoming loads, per thread
+        self._lock = RLock()
+        self.stats = ImageManager.CacheStats()
+
+    @dataclass
+    class CacheStats:
+        hits: int = 0               # Loads served from the cache
+        misses: int = 0             # Loads which needed a decode
+        evictions: int = 0          # Images dropped after their last owner's release
+        bytes: int = 0              # Pixel bytes currently held in the cache
+
+    # ------------- Public Methods -------------
+    @property
+    def owner(self):
+        """ :return: The owner for the incoming loads (None if they're unowned) """
+        return getattr(self._local, 'owner', None)
+
+    def load_image(self, image_name: str, colorkey: [] = None):
+        """ Gets an image from the cache, decoding it only on its first request. The returned surface is shared,
+        so don't modify it: ask for the colorkey here instead of setting it afterwards.
+
+        :param image_name: The image path, relative to the image resources folder
+        :param colorkey: Transparent color for the image (None for an opaque one)
+        :return: The shared image surface """
+        key = (image_name, None if colorkey is None else tuple(colorkey))
+        with self._lock:
+            surface = self._cache.get(key)
+            if surface is None:
+                self.stats.misses += 1
+                surface = image.load(f'{self._imageDir}/{image_name}').convert()
+                if colorkey is not None:
+                    surface.set_colorkey(colorkey)
+                self._cache[key] = surface
+                self.stats.bytes += self._surface_bytes(surface)
+            else:
+                self.stats.hits += 1
+
+            self._acquire(key, self.owner)
+        return surface
+
+    def plain_surface(self, color: [], width: int, height: int):
+        """ Gets a surface filled with a plain color, creating it only on its first request. It's shared by every
+        body alike and referenced by the current owner, just like the loaded images, so don't draw on it.
+
+        :param color: The fill color
+        :param width: Surface width
+        :param height: Surface height
+        :return: The shared surface """
+        key = ((width, height), tuple(color))
+        with self._lock:
+            surface = self._cache.get(key)
+            if surface is None:
+                self.stats.misses += 1
+                surface = self._cache[key] = Surface([width, height])
+                surface.fill(color)
+                self.stats.bytes += self._surface_bytes(surface)
+            else:
+                self.stats.hits += 1
+
+            self._acquire(key, self.owner)
+        return surface
+
+    @contextmanager
+    def owned_by(self, owner):
+        """ All images loaded inside this context are referenced by the given owner
+
+        :param owner: Any object supporting weak references, usually a level """
+        previous = self.owner
+        self._local.owner = owner
+        try:
+            yield self
+        finally:
+            self._local.owner = previous
+
+    def release(self, owner) -> None:
+        """ Drops all image references held by an owner, evicting those images nobody else uses
+
+        :param owner: The owner to release """
+        if owner is None:
+            return
+
+        with self._lock:
+            held = self._owners.pop(owner, None)
+            if held is not None:
+                self._drop(held)
+
+        self.LOGGER.debug(f"Image cache after release: {self.stats}")
+
+    def ref_count(self, image_name: str, colorkey: [] = None) -> int:
+        """ :return: How many owners are holding the requested image """
+        return self._refs.get((image_name, None if colorkey is None else tuple(colorkey)), 0)
+
+    # ------------- Internal Methods -------------
+    def _acquire(self, key, owner):
+        if owner is None:
+            held = self._unowned
+        else:
+            held = self._owners.get(owner)
+            if held is None:
+                # Owners are only weakly referenced: one which is never released drops its images when it's collected
+                held = self._owners[owner] = set()
+                weakref.finalize(owner, self._drop, held)
+
+        if key not in held:
+            held.add(key)
+            self._refs[key] = self._refs.get(key, 0) + 1
+
+    def _drop(self, held: set):
+        """ Drops the image references of a released (or collected) owner, evicting those images nobody else uses
+
+        :param held: The image keys held by the owner; it's emptied, so they're never dropped twice """
+        with self._lock:
+            for key in held:
+                self._refs[key] -= 1
+                if not self._refs[key]:
+                    del self._refs[key]
+                    self.stats.bytes -= self._surface_bytes(self._cache.pop(key))
+                    self.stats.evictions += 1
+            held.clear()
+
+    @staticmethod
+    def _surface_bytes(surface) -> int:
+        return surface.get_pitch() * surface.get_height()
@@ -1,31 +1,126 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import builtins
 import gettext
 import logging
-from constants import ROOT
+from collections import OrderedDict
+from dataclasses import dataclass
+from os import listdir, path
+from constants import ROOT, ANTIALIASING, TEXT_CACHE_SIZE
 
 
 class LocalizationManager:
     LOGGER = logging.getLogger(__name__)
+    DOMAIN = 'PrimalRing'
 
-    def __init__(self):
+    def __init__(self, localization_dir: str = f"{ROOT}/resources/localization",
+                 text_cache_size: int = TEXT_CACHE_SIZE):
         """
-        This manager handles all involving in-game translations
+        This manager handles all involving in-game translations, and keeps the latest rendered texts, so screens
+        rebuilt in the same language don't rasterize them again. Languages are found by their catalog files
+        ('<lang>/LC_MESSAGES/PrimalRing_<lang>.mo'), but a catalog is only read when its language is set.
+
+        :param localization_dir: The localization resources folder
+        :param text_cache_size: Rendered texts kept
         """
-        localization_route = f"{ROOT}/resources/localization"
-        try:
-            print(localization_route)
-            self.lang_dict = {
-                "en": gettext.translation("PrimalRing_en", localization_route, languages=["en"]),
-                "es": gettext.translation("PrimalRing_es", localization_route, languages=["es_ES"])
-            }
-        except FileNotFoundError as fnfex:
-            print(fnfex.strerror)
-            print(localization_route)
+        self.lang = None                    # Installed language code
+        self._localizationDir = localization_dir
+        self._languages = None              # Language code -> Catalog file path, once they're found
+        self._catalogs = {}                 # Language code -> Loaded catalog
+        self._texts = OrderedDict()         # (Language, text, font, color, antialias) -> Surface, oldest first
+        self._textCacheSize = text_cache_size
+        self.textStats = LocalizationManager.CacheStats()
+
+    @dataclass
+    class CacheStats:
+        hits: int = 0               # Renders served from the cache
+        misses: int = 0             # Renders which needed the font renderer
+        evictions: int = 0          # Least recently used texts dropped
+
+        def hit_rate(self) -> float:
+            """ :return: Share of renders served from the cache """
+            requests = self.hits + self.misses
+            return self.hits / requests if requests else 0
+
+    @property
+    def languages(self) -> dict:
+        """ :return: Every language with a catalog, as language code -> catalog file path """
+        if self._languages is None:
+            self._languages = {}
+            try:
+                for lang in sorted(listdir(self._localizationDir)):
+                    catalog = path.join(self._localizationDir, lang, 'LC_MESSAGES', f'{self.DOMAIN}_{lang}.mo')
+                    if path.isfile(catalog):
+                        self._languages[lang] = catalog
+            except OSError as ose:
+                self.LOGGER.error(f"Translations folder unavailable: {ose}")
+
+        return self._languages
 
     def set_lang(self, lang_code: str) -> None:
+        """ Installs a language's translations as the '_' builtin, loading its catalog if it isn't loaded yet
+
+        :param lang_code: The language code """
         try:
             self.LOGGER.info(f"Translating to \"{lang_code}\"")
-            self.lang_dict[lang_code].install()
+            builtins._ = self._load(lang_code).__getitem__
+            self.lang = lang_code
+        except KeyError:
+            self.LOGGER.error(f"There isn't any translation for \"{lang_code}\"")
         except IOError as ie:
             self.LOGGER.error(f"Error at loading translation: {ie}")
+
+    def unload(self, lang_code: str) -> bool:
+        """ Drops a loaded catalog, which will be read again if its language is set later
+
+        :param lang_code: The language code
+        :return: True if the catalog was dropped; False if it isn't loaded or it's the installed one """
+        if lang_code == self.lang or lang_code not in self._catalogs:
+            return False
+
+        del self._catalogs[lang_code]
+        return True
+
+    def render(self, font, text: str, color: [], antialias: bool = ANTIALIASING):
+        """ Renders a text, or gets it from the cache if it was rendered lately. The returned surface is shared,
+        so don't modify it.
+
+        :param font: The text font
+        :param text: The text, usually a message already translated with '_'
+        :param color: Text color
+        :param antialias: Smooths the text if True
+        :return: The shared text surface """
+        key = (self.lang, text, font, tuple(color), antialias)
+        surface = self._texts.get(key)
+        if surface is not None:
+            self.textStats.hits += 1
+            self._texts.move_to_end(key)
+            return surface
+
+        self.textStats.misses += 1
+        surface = self._texts[key] = font.render(text, antialias, color)
+        if len(self._texts) > self._textCacheSize:
+            self._texts.popitem(last=False)
+            self.textStats.evictions += 1
+
+        return surface
+
+    # ------------- Internal Methods -------------
+    def _load(self, lang_code: str) -> dict:
+        catalog = self._catalogs.get(lang_code)
+        if catalog is None:
+            with open(self.languages[lang_code], 'rb') as catalog_file:
+                translations = gettext.GNUTranslations(catalog_file)
+            # Only singular messages are translated in game; the header entry ('') is left out
+            catalog = LocalizationManager._Catalog((message, translation)
+                                                   for message, translation in translations._catalog.items()
+                                                   if isinstance(message, str) and message)
+            self._catalogs[lang_code] = catalog
+
+        return catalog
+
+    # ------------- Helpers -------------
+    class _Catalog(dict):
+        """ Message -> Translation lookup; messages without a translation are given back as they are """
+        def __missing__(self, message: str) -> str:
+            return message
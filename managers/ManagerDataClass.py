@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+from .AnimationManager import AnimationManager
+from .FontManager import FontManager
 from .ImageManager import ImageManager
 from .LocalizationManager import LocalizationManager
 from .SoundManager import SoundManager
+from .StatsManager import StatsManager
 from dataclasses import dataclass
 
 
 @dataclass
 class ManagerDataClass:
+    animation: AnimationManager = None
+    font: FontManager = None
     image: ImageManager = None
     localization: LocalizationManager = None
     sound: SoundManager = None
+    stats: StatsManager = None
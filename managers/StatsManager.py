@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import logging
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from timeit import default_timer
+from constants import STATS_WINDOW
+
+
+class StatsManager:
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(self, window: int = STATS_WINDOW):
+        """ Frame instrumentation: it records how long every phase of every frame takes (events, logic,
+        display...) plus a set of per-frame counters, such as sprite counts, keeping the latest frames only
+
+        :param window: Frames kept for the statistics """
+        self._frames = deque(maxlen=window)
+        self._current = None            # Frame being recorded
+        self._start = 0                 # Current frame's starting time
+        self._lastStart = None          # Previous frame's starting time
+
+    @dataclass
+    class FrameRecord:
+        phases: dict = field(default_factory=dict)      # Phase name -> Seconds
+        counters: dict = field(default_factory=dict)    # Counter name -> Value
+        time: float = 0                                 # Seconds spent on the frame phases
+        interval: float = 0                             # Seconds since the previous frame started
+
+    # ------------- Public Methods -------------
+    def begin_frame(self) -> None:
+        self._start = default_timer()
+        self._current = StatsManager.FrameRecord()
+        if self._lastStart is not None:
+            self._current.interval = self._start - self._lastStart
+        self._lastStart = self._start
+
+    @contextmanager
+    def phase(self, name: str):
+        """ Times a frame phase (nothing is recorded outside a frame)
+
+        :param name: The phase name """
+        start = default_timer()
+        try:
+            yield
+        finally:
+            if self._current is not None:
+                self._current.phases[name] = self._current.phases.get(name, 0) + default_timer() - start
+
+    def count(self, name: str, value) -> None:
+        """ Sets a counter for the current frame (nothing is recorded outside a frame) """
+        if self._current is not None:
+            self._current.counters[name] = value
+
+    def end_frame(self) -> None:
+        if self._current is not None:
+            self._current.time = sum(self._current.phases.values())
+            self._frames.append(self._current)
+            self._current = None
+
+    @property
+    def frames(self) -> list:
+        """ :return: The latest frame records, from the oldest to the newest """
+        return list(self._frames)
+
+    def fps(self) -> float:
+        intervals = [frame.interval for frame in self._frames if frame.interval > 0]
+        return len(intervals) / sum(intervals) if intervals else 0
+
+    def percentile(self, percent: float) -> float:
+        """ :return: Frame time below which the given percent of the latest frames falls, in seconds """
+        times = sorted(frame.time for frame in self._frames)
+        if not times:
+            return 0
+
+        return times[min(len(times) - 1, max(0, round(percent / 100 * len(times)) - 1))]
+
+    def summary(self) -> dict:
+        """ :return: FPS, frame time percentiles, mean phase times and the latest counters """
+        frames = self._frames
+        phases = {}
+        for frame in frames:
+            for name, seconds in frame.phases.items():
+                phases[name] = phases.get(name, 0) + seconds / len(frames)
+
+        return {'fps': self.fps(),
+                'p50': self.percentile(50), 'p95': self.percentile(95), 'p99': self.percentile(99),
+                'phases': phases,
+                'counters': dict(frames[-1].counters) if frames else {}}
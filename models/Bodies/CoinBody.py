@@ -6,6 +6,9 @@ from constants import COLORS
 
 
 class CoinBody(_BodyBase):
+    __slots__ = ()
+    name = "Coin"
+
     def __init__(self, color: [], width: int, height: int, managers: ManagerDataClass):
         """ Class for coins
 
@@ -13,10 +16,8 @@ class CoinBody(_BodyBase):
         :param width:
         :param height: """
         super().__init__(color, width, height, managers)
-        self.name = "Coin"
-        self.image = self._managers.image.load_image("Coin_Frames/coin.png")
         # We set a transparent color for the image
-        self.image.set_colorkey(COLORS['WHITE'])
+        self.image = self._managers.image.load_image("Coin_Frames/coin.png", COLORS['WHITE'])
 
     def react(self, player):
         if player.coins < player.maxWallet:
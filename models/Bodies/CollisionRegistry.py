@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+class CollisionRegistry:
+    """ Responses of the player against everything it may collide with, keyed by body type (for sprites) or by tile
+    ID (for the level tile grid). Every key registers one handler per axis, called as 'handler(player, rect, body)',
+    where 'rect' is the collided area and 'body' the collided sprite (None for tiles). Body types without any own
+    handler take their closest registered base type's ones. """
+    X = 0
+    Y = 1
+    _registered = ({}, {})          # Per axis: Body type or tile ID -> Handler (None if it doesn't respond)
+    _resolved = ({}, {})            # Per axis: Any key already asked -> Its handler
+
+    @classmethod
+    def register(cls, key, on_x=None, on_y=None) -> None:
+        """ Sets the responses against a body type or tile ID
+
+        :param key: Body type or tile ID
+        :param on_x: Handler for the horizontal collisions (None for no response)
+        :param on_y: Handler for the vertical collisions (None for no response) """
+        for registered, handler in zip(cls._registered, (on_x, on_y)):
+            registered[key] = handler
+        cls._clear()
+
+    @classmethod
+    def register_reaction(cls, body_type) -> None:
+        """ Responds against a body type on both axes through its own 'react' method
+
+        :param body_type: The body type """
+        cls.register(body_type, cls._react, cls._react)
+
+    @classmethod
+    def unregister(cls, key) -> None:
+        for registered in cls._registered:
+            registered.pop(key, None)
+        cls._clear()
+
+    @classmethod
+    def handler(cls, key, axis: int):
+        """ :return: The handler for a body type or tile ID on an axis (None if it doesn't respond) """
+        resolved = cls._resolved[axis]
+        try:
+            return resolved[key]
+        except KeyError:
+            registered = cls._registered[axis]
+            handler = None
+            for base in key.__mro__ if isinstance(key, type) else (key,):
+                if base in registered:
+                    handler = registered[base]
+                    break
+
+            resolved[key] = handler
+            return handler
+
+    # ---------- Internal Methods --------------------------
+    @classmethod
+    def _clear(cls):
+        for resolved in cls._resolved:
+            resolved.clear()
+
+    @staticmethod
+    def _react(player, rect, body):
+        body.react(player)
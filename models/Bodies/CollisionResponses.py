@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .CollisionRegistry import CollisionRegistry
+from .FloorBody import FloorBody
+from .HoleBody import HoleBody
+from .LavaBody import LavaBody
+from .PlatformBody import PlatformBody
+from .SavePointBody import SavePointBody
+
+""" Player responses against every body type, registered all at once. PlayerBody imports this module, so they're
+    there however the player is imported. Responses against the level tile IDs are registered by the level side,
+    along with the tile grid. """
+
+CollisionRegistry.register(FloorBody, FloorBody.push_x, FloorBody.push_y)
+CollisionRegistry.register(HoleBody, HoleBody.suck_x, HoleBody.suck_y)
+CollisionRegistry.register(PlatformBody, PlatformBody.push_x, PlatformBody.push_y)
+CollisionRegistry.register_reaction(LavaBody)
+CollisionRegistry.register_reaction(SavePointBody)
@@ -5,6 +5,9 @@ from managers import ImageManager
 
 
 class FloorBody(_BodyBase):
+    __slots__ = ('toggle',)
+    name = "Floor"
+
     def __init__(self, color: [], width: int, height: int, image_manager: ImageManager):
         """ Class for ground floor tiles
 
@@ -12,29 +15,33 @@ class FloorBody(_BodyBase):
         :param width:
         :param height: """
         super().__init__(color, width, height, image_manager)
-        self.name = "Floor"
         self.toggle = True
 
     def react(self, player):
-        # X checking
-        if self.toggle:
-            dist = player.rect.centerx - self.rect.centerx
-            if 45 > dist > 0:
-                # Moving to the left
-                player.rect.left = self.rect.right
-            elif -45 < dist < 0:
-                # Moving to the right
-                player.rect.right = self.rect.left
-        # Y checking
-        else:
-            dist = player.rect.centery - self.rect.centery
-            if -45 < dist < 0:
-                # Wall under the player
-                player.stop_fall()
-                player.rect.bottom = self.rect.top
-            elif 45 > dist > 0:
-                # Wall upon the player
-                player.stop_y()
-                player.rect.top = self.rect.bottom
-
+        # X checking, then Y checking
+        (self.push_x if self.toggle else self.push_y)(player, self.rect)
         self.toggle = not self.toggle
+
+    @staticmethod
+    def push_x(player, rect, body=None):
+        """ Pushes the player horizontally out of a floor """
+        dist = player.rect.centerx - rect.centerx
+        if 45 > dist > 0:
+            # Moving to the left
+            player.rect.left = rect.right
+        elif -45 < dist < 0:
+            # Moving to the right
+            player.rect.right = rect.left
+
+    @staticmethod
+    def push_y(player, rect, body=None):
+        """ Pushes the player vertically out of a floor """
+        dist = player.rect.centery - rect.centery
+        if -45 < dist < 0:
+            # Wall under the player
+            player.stop_fall()
+            player.rect.bottom = rect.top
+        elif 45 > dist > 0:
+            # Wall upon the player
+            player.stop_y()
+            player.rect.top = rect.bottom
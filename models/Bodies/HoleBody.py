@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from ._BodyBase import _BodyBase
+from constants import HOLE_PULL
 
 
 class HoleBody(_BodyBase):
+    __slots__ = ()
+    name = "Hole"
+
     def __init__(self, color: [], width: int, height: int, managers, img_tag: str = None):
         """ Class for hole tiles
 
@@ -12,13 +16,26 @@ class HoleBody(_BodyBase):
         :param height:
         :param managers: """
         super().__init__(color, width, height, managers)
-        self.name = "Hole"
         if img_tag is not None:
             self.image = self._managers.image.load_image(f'plain_hole/{img_tag}.png')
 
     def react(self, player):
-        if player.distance(self.rect) < self.rect.width * 0.75:
-            if player.rect.y > self.rect.y:
-                player.rect.y -= 2
-            elif player.rect.y < self.rect.y:
-                player.rect.y += 2
+        self.suck_y(player, self.rect)
+
+    @staticmethod
+    def suck_x(player, rect, body=None):
+        """ Drags the player horizontally into a hole, when it's close enough """
+        if player.distance_squared(rect) < (rect.width * 0.75) ** 2:
+            if player.rect.x > rect.x:
+                player.rect.x -= HOLE_PULL
+            elif player.rect.x < rect.x:
+                player.rect.x += HOLE_PULL
+
+    @staticmethod
+    def suck_y(player, rect, body=None):
+        """ Drags the player vertically into a hole, when it's close enough """
+        if player.distance_squared(rect) < (rect.width * 0.75) ** 2:
+            if player.rect.y > rect.y:
+                player.rect.y -= HOLE_PULL
+            elif player.rect.y < rect.y:
+                player.rect.y += HOLE_PULL
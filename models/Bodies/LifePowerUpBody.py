@@ -5,6 +5,9 @@ from constants import COLORS
 
 
 class LifePowerUpBody(_BodyBase):
+    __slots__ = ()
+    name = "LifePowerUp"
+
     def __init__(self, color: [], width: int, height: int, managers):
         """ Class for life power-ups
 
@@ -12,10 +15,8 @@ class LifePowerUpBody(_BodyBase):
         :param width:
         :param height: """
         super().__init__(color, width, height, managers)
-        self.name = "LifePowerUp"
-        self.image = self._managers.image.load_image('LifePowerUp.png')
         # We set a transparent color for the image
-        self.image.set_colorkey(COLORS['WHITE'])
+        self.image = self._managers.image.load_image('LifePowerUp.png', COLORS['WHITE'])
 
     def react(self, player):
         player.maxLife += 50
@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from ._BodyBase import _BodyBase
+from constants import PLATFORM_SPEED
 
 
 class PlatformBody(_BodyBase):
+    __slots__ = ('initPoint', 'maxRun', 'axis')
+    name = "Platform"
+    dynamic = True
+    always_update = True
+
     def __init__(self, color: [], width: int, height: int, image_manager, init_point, axis: str = 'X'):
         """ This block is so bored about being on the same point that he's going to move
 
@@ -13,9 +19,8 @@ class PlatformBody(_BodyBase):
         :param init_point:
         :param axis: """
         super().__init__(color, width, height, image_manager)
-        self.name = "Platform"
         self.initPoint = init_point
-        self.velX = self.velY = 1
+        self.velX = self.velY = PLATFORM_SPEED
         # Movement limit
         self.maxRun = 50
         self.axis = axis
@@ -44,3 +49,23 @@ class PlatformBody(_BodyBase):
 
     def react(self, player):
         pass
+
+    @staticmethod
+    def push_x(player, rect, body=None):
+        """ Stops the player against a platform side, when it's moving towards it """
+        # Moving to the right
+        if player.velX > 0:
+            player.rect.right = rect.left - 0.5
+        # Moving to the left
+        elif player.velX < 0:
+            player.rect.left = rect.right + 0.5
+
+    @staticmethod
+    def push_y(player, rect, body=None):
+        """ Lands the player on a platform, or stops its jump under it """
+        if player.velY > 0:
+            player.stop_fall()
+            player.rect.bottom = rect.top - 2
+        elif player.velY < 0:
+            player.stop_y()
+            player.rect.top = rect.bottom + 2
@@ -1,19 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from math import sqrt
-from pygame.sprite import spritecollide
-from .HoleBody import HoleBody
-from .FloorBody import FloorBody
-from .LavaBody import LavaBody
-from .PlatformBody import PlatformBody
-from .SavePointBody import SavePointBody
+from .CollisionRegistry import CollisionRegistry
+from . import CollisionResponses     # Registers the player responses against every body type
 from models.Bodies._BodyBase import _BodyBase
 from managers import ManagerDataClass
-from constants import GRAVITY, MAX_FALL_VELOCITY
+from constants import AIRBORNE_VELOCITY, GRAVITY, JUMP_VELOCITY, MAX_FALL_VELOCITY, PLAYER_SPEED
 from dataclasses import dataclass
 
 
 class PlayerBody(_BodyBase):
+    __slots__ = ('name', 'life', 'maxLife', 'energy', 'maxEnergy', 'coins', 'maxWallet', 'maxFallVelocity',
+                 'saveFlag', 'plainLevel', 'fallLimit', 'direction', 'jumping', 'isDead')
+
     def __init__(self, color: [], width: int, height: int, managers: ManagerDataClass, save_file=None):
         """ Class for the player character (It will extend from _AnimatedBlock in a future; Still lacks tiles)
 
@@ -44,6 +43,7 @@ class PlayerBody(_BodyBase):
         self.maxFallVelocity = MAX_FALL_VELOCITY    # A limit to gravity acceleration
         self.saveFlag = False                       # Enable/Disable saving feature
         self.plainLevel = False                     # Enable/Disable horizontal gravity
+        self.fallLimit = 900                        # Deepest point the player can fall down before dying
         self.direction = self.Direction()
         self.jumping = False                        # Jumping state flag
         self.isDead = False                         # Living state flag
@@ -56,18 +56,23 @@ class PlayerBody(_BodyBase):
         right: bool = False
 
     # ---------- Public Methods --------------------------
-    def update(self, solid: [], weak: []):
+    def update(self, solid, weak, tiles=None):
+        """ Moves the player and solves its collisions
+
+        :param solid: Spatial group of solid bodies
+        :param weak: Spatial group of weak bodies, dropped once touched
+        :param tiles: Tile grid of the static level tiles (None if there's no one) """
         if self.saveFlag:
             self.saveFlag = False
 
         self._calc_vel()
-        self._do_horizontal_checking(solid, weak)
-        self._do_vertical_checking(solid, weak)
+        self._do_horizontal_checking(solid, weak, tiles)
+        self._do_vertical_checking(solid, weak, tiles)
 
         if not self.plainLevel:
             self.fall()
 
-        self.isDead = self.life <= 0 or self.rect.y > 900
+        self.isDead = self.life <= 0 or self.rect.y > self.fallLimit
 
     def stop_y(self):
         self.velY = 0
@@ -79,7 +84,7 @@ class PlayerBody(_BodyBase):
     def fall(self):
         """ This is a simple gravity calculus for player's fall velocity """
         # This avoids the "jumping on air" bug
-        if not self.jumping and self.velY > 0.7:
+        if not self.jumping and self.velY > AIRBORNE_VELOCITY:
             self.jumping = True
 
         self.velY += GRAVITY
@@ -93,106 +98,60 @@ class PlayerBody(_BodyBase):
             d = \/(x_2 - x_1)^2 + (y_2 - y_1)^2
         :param body:
         :return: Distance between central points of the player and other body """
-        x_1 = self.rect.centerx * 1.0
-        y_1 = self.rect.centery * 1.0
-        x_2 = body.centerx * 1.0
-        y_2 = body.centery * 1.0
-        # Calculation time
-        x_operator = (x_2 - x_1) * (x_2 - x_1)
-        y_operator = (y_2 - y_1) * (y_2 - y_1)
+        return sqrt(self.distance_squared(body))
+
+    def distance_squared(self, rect) -> int:
+        """ The squared distance between central points of the player and other bodies, cheaper than 'distance'
+        for comparisons: compare it against the squared limit instead
 
-        return sqrt(x_operator + y_operator)
+        :param rect: The other body's rect
+        :return: (x_2 - x_1)^2 + (y_2 - y_1)^2 """
+        x_operator = rect.centerx - self.rect.centerx
+        y_operator = rect.centery - self.rect.centery
+        return x_operator * x_operator + y_operator * y_operator
 
     # ---------- Internal Methods --------------------------
-    def _do_horizontal_checking(self, solid_boxes, weak_boxes):
+    def _do_horizontal_checking(self, solid_boxes, weak_boxes, tiles):
         self.rect.x += self.velX
-        # We divide all collisions done in two lists (False for avoiding automatic drop)
-        solid_collide_list = spritecollide(self, solid_boxes, False)
-        for body in solid_collide_list:
-            if isinstance(body, FloorBody):
-                dist = self.rect.centerx - body.rect.centerx
-                if 45 > dist > 0:
-                    # Moving to the left
-                    self.rect.left = body.rect.right
-                elif -45 < dist < 0:
-                    # Moving to the right
-                    self.rect.right = body.rect.left
-            elif isinstance(body, PlatformBody):
-                # Moving to the right
-                if self.velX > 0:
-                    self.rect.right = body.rect.left - 0.5
-                # Moving to the left
-                elif self.velX < 0:
-                    self.rect.left = body.rect.right + 0.5
-            elif isinstance(body, HoleBody):
-                if self.distance(body.rect) < body.rect.width * 0.75:
-                    if self.rect.x > body.rect.x:
-                        self.rect.x -= 2
-                    elif self.rect.x < body.rect.x:
-                        self.rect.x += 2
-            elif isinstance(body, SavePointBody):
-                body.react(self)
-            elif isinstance(body, LavaBody):
-                body.react(self)
-
+        self._respond(solid_boxes, tiles, CollisionRegistry.X)
         self._manage_weak_collisions(weak_boxes)
 
-    def _do_vertical_checking(self, solid_boxes, weak_boxes):
+    def _do_vertical_checking(self, solid_boxes, weak_boxes, tiles):
         self.rect.y += self.velY
-        # We divide all collisions done in two lists (False for avoiding automatic drop)
-        solid_collide_list = spritecollide(self, solid_boxes, False)
-        for body in solid_collide_list:
-            if isinstance(body, FloorBody):
-                dist = self.rect.centery - body.rect.centery
-                if -45 < dist < 0:
-                    self._rigid_body_under(body)
-                elif 45 > dist > 0:
-                    self._rigid_body_upon(body)
-            elif isinstance(body, PlatformBody):
-                if self.velY > 0:
-                    self.stop_fall()
-                    self.rect.bottom = body.rect.top - 2
-                elif self.velY < 0:
-                    self.stop_y()
-                    self.rect.top = body.rect.bottom + 2
-            elif isinstance(body, HoleBody):
-                if self.distance(body.rect) < body.rect.width * 0.75:
-                    if self.rect.y > body.rect.y:
-                        self.rect.y -= 2
-                    elif self.rect.y < body.rect.y:
-                        self.rect.y += 2
-            elif isinstance(body, SavePointBody):
-                body.react(self)
-            elif isinstance(body, LavaBody):
-                body.react(self)
-
+        self._respond(solid_boxes, tiles, CollisionRegistry.Y)
         self._manage_weak_collisions(weak_boxes)
 
-    def _rigid_body_under(self, body):
-        self.stop_fall()
-        self.rect.bottom = body.rect.top
+    def _respond(self, solid_boxes, tiles, axis: int):
+        """ Runs the registered responses on an axis, for the static tiles first and then for the solid bodies """
+        handler = CollisionRegistry.handler
+        if tiles is not None:
+            for tile, rect in tiles.collide(self.rect):
+                response = handler(tile, axis)
+                if response is not None:
+                    response(self, rect, None)
 
-    def _rigid_body_upon(self, body):
-        self.stop_y()
-        self.rect.top = body.rect.bottom
+        for body in solid_boxes.collide(self):
+            response = handler(type(body), axis)
+            if response is not None:
+                response(self, body.rect, body)
 
     def _manage_weak_collisions(self, boxes):
-        bodies = spritecollide(self, boxes, True)
+        bodies = boxes.collide(self, True)
         for body in bodies:
             body.react(self)
 
     def _jump(self):
         if not self.jumping:
-            self.velY = -10
+            self.velY = -JUMP_VELOCITY
             self.rect.y -= 0.1
             self.jumping = True
 
     def _calc_vel(self):
         if self.plainLevel:
             if self.direction.up:
-                self.velY = -3
+                self.velY = -PLAYER_SPEED
             elif self.direction.down:
-                self.velY = 3
+                self.velY = PLAYER_SPEED
             else:
                 self.stop_y()
         else:
@@ -202,8 +161,8 @@ class PlayerBody(_BodyBase):
                 self._jump()
 
         if self.direction.right:
-            self.velX = 3
+            self.velX = PLAYER_SPEED
         elif self.direction.left:
-            self.velX = -3
+            self.velX = -PLAYER_SPEED
         else:
             self.velX = 0
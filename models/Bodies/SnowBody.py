@@ -1,20 +1,24 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from ._BodyBase import _BodyBase
+from constants import SNOW_FALL
 
 
 class SnowBody(_BodyBase):
-    def __init__(self, color: [], width: int, height: int, screen_size: tuple, managers):
+    __slots__ = ('level_size', 'firstX', 'acc')
+    name = "Snow"
+    dynamic = True
+
+    def __init__(self, color: [], width: int, height: int, level_size: tuple, managers):
         super().__init__(color, width, height, managers)
-        self.name = "Snow"
-        self.screen_size = screen_size
+        self.level_size = level_size
         self.firstX = 0
         self.acc = 5
 
     # ---------- Methods --------------------------
     def update(self):
-        self.rect.y += 1
-        if self.rect.y > self.screen_size[1]:
+        self.rect.y += SNOW_FALL
+        if self.rect.y > self.level_size[1]:
             self.rect.y = -1
 
     def react(self, player):
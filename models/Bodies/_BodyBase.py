@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import logging
-from pygame import Surface
 from pygame.sprite import Sprite
 from managers import ManagerDataClass
 
 
 class _BodyBase(Sprite):
+    __slots__ = ('_managers', 'velX', 'velY', 'image', 'rect')
+    name = "Block"
+    dynamic = False                 # Bodies which move by themselves must be filed again on every level update
+    always_update = False           # Bodies which must be updated even when they are far from the view
+    logger = logging.getLogger(__name__)
+
     def __init__(self, color: [], width: int, height: int, managers: ManagerDataClass):
         """
         A parent class for all sprites in the game screen, such as the main player, all kind of platforms, enemies
@@ -17,19 +22,13 @@ class _BodyBase(Sprite):
         :param height:
         """
         super().__init__()
-        self.name = "Block"
         self._managers = managers
         self.velX = self.velY = 0
-        # We create the block's surface
-        self.image = Surface([width, height])
-        # We fill this 'surface' with a color
-        self.image.fill(color)
+        # We take the block's surface (don't draw on it: it's shared by all blocks of the same color and size)
+        self.image = managers.image.plain_surface(color, width, height)
         # We get the 'collider' box
         self.rect = self.image.get_rect()
 
-        # We get the logger
-        self.logger = logging.getLogger(__class__.__name__)
-
     # ---------- Methods --------------------------
     def react(self, player):
         """ Generates a reaction against the player when he collides this block
@@ -4,6 +4,10 @@ from ._BodyBase import _BodyBase
 
 
 class _EnemyBody(_BodyBase):
+    __slots__ = ('life', 'isDead', 'firstX')
+    dynamic = True
+    always_update = True
+
     def __init__(self, color: [], width: int, height: int):
         """ Evil army! This class is for all enemy objects (It will extend from _AnimatedBlock in a future; Still lacks
         tiles)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from contextlib import contextmanager
+from pygame import Rect
+
+
+class Camera:
+    def __init__(self, view_size):
+        """ The level's point of view. Bodies always keep their world coordinates: scrolling only moves this view,
+        which is applied at blit time, so it costs the same whatever the level size is.
+
+        :param view_size: The screen size """
+        self.view = Rect((0, 0), view_size)         # Visible level area, in world coordinates
+        self.bounds = Rect((0, 0), view_size)       # Whole level area, in world coordinates
+        self.previous = None                        # View before the latest logic update (None if not kept yet)
+
+    # ---------- Public Methods --------------------------
+    @property
+    def offset(self):
+        """ :return: The translation from world coordinates into screen ones """
+        return -self.view.x, -self.view.y
+
+    def set_bounds(self, bounds: Rect) -> None:
+        """ Sets the level limits the view can't go beyond
+
+        :param bounds: Whole level area """
+        self.bounds = Rect(bounds)
+        self.view.clamp_ip(self.bounds)
+
+    def follow(self, target: Rect) -> None:
+        """ Centers the view on a target without leaving the level limits
+
+        :param target: The followed body's rect """
+        self.view.center = target.center
+        self._clamp_axis('x', 'width')
+        self._clamp_axis('y', 'height')
+
+    def mark(self) -> None:
+        """ Keeps the current view as the previous one, before a logic update moves it """
+        self.previous = self.view.copy()
+
+    @contextmanager
+    def between(self, alpha: float):
+        """ Moves the view somewhere between the previous and the current one while drawing, so rendering can go
+        smoothly between two logic updates
+
+        :param alpha: Progress from the previous view (0) to the current one (1) """
+        if self.previous is None or alpha >= 1:
+            yield self.view
+            return
+
+        current = self.view
+        self.view = current.move(round((current.x - self.previous.x) * (alpha - 1)),
+                                 round((current.y - self.previous.y) * (alpha - 1)))
+        try:
+            yield self.view
+        finally:
+            self.view = current
+
+    def apply(self, rect: Rect) -> Rect:
+        """ :return: The given world rect translated into screen coordinates """
+        return rect.move(-self.view.x, -self.view.y)
+
+    # ---------- Internal Methods --------------------------
+    def _clamp_axis(self, axis: str, dimension: str):
+        # The view keeps stuck to the level corners when the target is close to them
+        limit = getattr(self.bounds, axis) + max(getattr(self.bounds, dimension) - getattr(self.view, dimension), 0)
+        setattr(self.view, axis, min(max(getattr(self.view, axis), getattr(self.bounds, axis)), limit))
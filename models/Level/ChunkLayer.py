@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from pygame import Rect, RLEACCEL, Surface
+from constants import CHUNK_COLORKEY, CHUNK_TILES, FLOOR_SIZE
+
+
+class ChunkLayer:
+    def __init__(self, chunk_size: int = CHUNK_TILES * FLOOR_SIZE):
+        """ Pre-rendered layer for the static level tiles. Those tiles never change, so they are baked into a few
+        big chunk surfaces as the level builds them, and only the chunks overlapping the view are blitted.
+
+        :param chunk_size: Width and height of every chunk, in pixels """
+        self._chunkSize = chunk_size
+        self._chunks = {}               # (Column, Row) -> Chunk surface
+        self._unbaked = set()           # Chunks added since the last bake
+        self.blits = 0                  # Chunks blitted on the last draw
+
+    # ---------- Public Methods --------------------------
+    def add(self, image, rect: Rect) -> None:
+        """ Bakes a static image into all chunks it overlaps
+
+        :param image: The static image
+        :param rect: Where the image is, in world coordinates """
+        first_col, first_row, last_col, last_row = self._span(rect)
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                chunk = self._chunks.get((col, row))
+                if chunk is None:
+                    chunk = self._chunks[(col, row)] = Surface((self._chunkSize, self._chunkSize)).convert()
+                    chunk.fill(CHUNK_COLORKEY)
+                    self._unbaked.add((col, row))
+                chunk.blit(image, (rect.x - col * self._chunkSize, rect.y - row * self._chunkSize))
+
+    def bake(self) -> None:
+        """ Makes the empty spots of the new chunks transparent. Call it once their static bodies are added """
+        for key in self._unbaked:
+            self._chunks[key].set_colorkey(CHUNK_COLORKEY, RLEACCEL)
+        self._unbaked.clear()
+
+    def release(self, key: tuple) -> None:
+        """ Drops a chunk surface
+
+        :param key: The chunk (column, row) """
+        self._chunks.pop(key, None)
+        self._unbaked.discard(key)
+
+    def draw(self, screen, camera) -> None:
+        """ Blits the chunks overlapping the camera view
+
+        :param screen: The main screen
+        :param camera: The level camera """
+        first_col, first_row, last_col, last_row = self._span(camera.view)
+        offset_x, offset_y = camera.offset
+        size = self._chunkSize
+        visible = []
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                chunk = self._chunks.get((col, row))
+                if chunk is not None:
+                    visible.append((chunk, (col * size + offset_x, row * size + offset_y)))
+
+        screen.blits(visible, False)
+        self.blits = len(visible)
+
+    # ---------- Internal Methods --------------------------
+    def _span(self, rect: Rect) -> tuple:
+        size = self._chunkSize
+        return (rect.left // size, rect.top // size,
+                max(rect.right - 1, rect.left) // size, max(rect.bottom - 1, rect.top) // size)
@@ -2,51 +2,47 @@
 # -*- coding: utf-8 -*-
 from random import randrange
 from ._HorizontalLevel import _HorizontalLevel
+from .ParticleSystem import ParticleSystem
 from models.Bodies.SnowBody import SnowBody
-from constants import COLORS
+from constants import COLORS, SNOW_DRIFT, SNOW_FALL, SNOW_FLAKES, SNOW_SWAY
 
 
 class Level1(_HorizontalLevel):
-    def __init__(self, screen, scr_size, managers, player, debug: bool = False):
-        super().__init__(screen, scr_size, managers, player, debug)
+    MAP_NAME = 'doom_valley'
+
+    def __init__(self, screen, scr_size, managers, player, debug: bool = False, preloaded: tuple = None):
+        super().__init__(screen, scr_size, managers, player, debug, preloaded)
         # Level data
         self.ID = "Doom Valley"
         self.levelInit = (56, 900)                     # Initial player position's coordinates (50, 900)
-        # Level map structure
-        self.structure = ["ffffffffffffffffffffffffffffffff",
-                          "fc                            cf",
-                          "ff  fffffffffffffffffff  c  ffff",
-                          "f                      flflf   f",
-                          "f  f                    fff    f",
-                          "f   ff                         f",
-                          "f    f        f                f",
-                          "f    ffff   fff                f",
-                          "f                              f",
-                          "f               p          f c f",
-                          "f                          fffff",
-                          "f              ffff     P      f",
-                          "f   f       f  f               f",
-                          "f     c    ff  f     fff ffff  f",
-                          "f  f ffff fff       f       f  f",
-                          "f c          f            f f  f",
-                          "f fc                c     f    f",
-                          "f  f              fff     f    f",
-                          "f               f              f",
-                          "f                       c f  v f",
-                          "ffffffffllllfffffffffffffffllflf"]
         # Populating level
-        self._fill_level(self.structure)
+        self._load_level()
+
+        # Falling snow flakes: a particle system if NumPy is there, or one body per flake otherwise
+        if ParticleSystem.available:
+            snow = ParticleSystem(self.camera.bounds, SNOW_FLAKES, COLORS['WHITE'], velocity=(0, SNOW_FALL),
+                                  drift=SNOW_DRIFT, sway=SNOW_SWAY)
+            self._add_particles(snow, self._snow_touch)
+        else:
+            self._add_snow_bodies()
+
+        self.musicTheme = 'Doom Valley'
 
+    # ---------- Internal Methods --------------------------
+    @staticmethod
+    def _snow_touch(player, flakes: int):
+        # Every flake hurts as a 'SnowBody' does
+        player.life -= flakes
+
+    def _add_snow_bodies(self):
         # Random location for snow flakes
-        for i in range(50):     # 50
+        for i in range(SNOW_FLAKES):
             # Snow instance
-            flake = SnowBody(COLORS['WHITE'], 2, 2, self.scrSize, self._managers)
+            flake = SnowBody(COLORS['WHITE'], 2, 2, self.camera.bounds.size, self._managers)
             # We create a random placement
-            flake.rect.x = randrange(len(self.structure[0]) * 50)
-            flake.rect.y = randrange(len(self.structure) * 50)
+            flake.rect.x = randrange(self.camera.bounds.width)
+            flake.rect.y = randrange(self.camera.bounds.height)
             # Then we add the flake to the block lists
             flake.firstX = flake.rect.x
             self._weak_group.add(flake)
             self._bodies.add(flake)
-
-        self.musicTheme = 'Doom Valley'
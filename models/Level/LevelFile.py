@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import mmap
+import re
+import struct
+import sys
+
+
+class LevelFile:
+    """ Compiled level map. Level sources are plain text files ('.lvl') where every character is a tile:
+
+        f   Floor               h   Hole                l   Lava                s   Save point
+        c   Coin                p   Platform on Y       P   Platform on X       v   Life power up
+
+    Blanks are empty cells and lines starting with '#' are comments. The compiler turns them into a binary file
+    ('.lvc') holding a grid of one byte per cell plus entity tables for coins, platforms and power-ups; the hole
+    variants and the level corners are solved at compile time. Loaded files are memory-mapped, so a level is built
+    straight from its bytes, without any string parsing.
+
+        python -m models.Level.LevelFile resources/levels/*.lvl """
+    SOURCE_EXTENSION = '.lvl'
+    EXTENSION = '.lvc'
+    MAGIC = b'PRLV'
+    VERSION = 1
+    # Magic, version, columns, rows, corner tiles (column, row) x 2, coins, platforms, power-ups
+    HEADER = struct.Struct('<4sHHHHHHHIII')
+    COIN = struct.Struct('<HH')                 # Column, row
+    PLATFORM = struct.Struct('<HHc')            # Column, row, moving axis
+    POWER_UP = struct.Struct('<HHB')            # Column, row, power up kind
+    # Grid tiles
+    EMPTY, FLOOR, HOLE, HOLE_METAL, HOLE_FLOOR, LAVA, SAVE_POINT = range(7)
+    # Power up kinds
+    LIFE = 0
+
+    _TILES = {' ': EMPTY, 'f': FLOOR, 'h': HOLE, 'l': LAVA, 's': SAVE_POINT,
+              'c': EMPTY, 'p': EMPTY, 'P': EMPTY, 'v': EMPTY}
+    _NOT_EMPTY = re.compile(rb'[^\x00]')
+
+    def __init__(self, file_path: str):
+        """ Opens a compiled level
+
+        :param file_path: The compiled level path """
+        with open(file_path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.columns, self.rows, *corners, coins, platforms, power_ups =\
+            self.HEADER.unpack_from(self._map)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"'{file_path}' isn't a compiled level (version {self.VERSION})")
+
+        self.reference = (tuple(corners[:2]), tuple(corners[2:]))   # Opposite level corners, in tiles
+        self._gridStart = self.HEADER.size
+        offset = self._gridStart + self.columns * self.rows
+        self._tables = {}
+        for name, count, layout in (('coins', coins, self.COIN), ('platforms', platforms, self.PLATFORM),
+                                    ('power_ups', power_ups, self.POWER_UP)):
+            self._tables[name] = (offset, count * layout.size, layout)
+            offset += count * layout.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ---------- Public Methods --------------------------
+    def tile(self, column: int, row: int) -> int:
+        """ :return: The tile in a grid cell """
+        return self._map[self._gridStart + row * self.columns + column]
+
+    def grid(self) -> bytes:
+        """ :return: A copy of the whole grid, one tile per cell in row order """
+        return self._map[self._gridStart:self._gridStart + self.columns * self.rows]
+
+    def tiles(self, span: tuple = None):
+        """ Walks the grid in row order, skipping the empty cells
+
+        :param span: Walked cells, as (first column, first row, last column, last row); the whole grid if None
+        :return: A (column, row, tile) generator """
+        start, columns, grid = self._gridStart, self.columns, self._map
+        if span is None:
+            for match in self._NOT_EMPTY.finditer(grid, start, start + columns * self.rows):
+                row, column = divmod(match.start() - start, columns)
+                yield column, row, grid[match.start()]
+            return
+
+        first_column, first_row, last_column, last_row = span
+        for row in range(first_row, last_row + 1):
+            row_start = start + row * columns
+            for match in self._NOT_EMPTY.finditer(grid, row_start + first_column, row_start + last_column + 1):
+                yield match.start() - row_start, row, grid[match.start()]
+
+    def coins(self) -> list:
+        """ :return: Every coin cell, as (column, row) """
+        return self._table('coins')
+
+    def platforms(self) -> list:
+        """ :return: Every moving platform, as (column, row, axis) """
+        return [(column, row, axis.decode()) for column, row, axis in self._table('platforms')]
+
+    def power_ups(self) -> list:
+        """ :return: Every power up, as (column, row, kind) """
+        return self._table('power_ups')
+
+    def close(self) -> None:
+        self._map.close()
+
+    @classmethod
+    def compile(cls, structure: list) -> bytes:
+        """ Compiles a level map
+
+        :param structure: Level map rows, one character per tile
+        :return: The compiled level """
+        columns = max(len(row) for row in structure)
+        structure = [row.ljust(columns) for row in structure]
+        grid = bytearray(columns * len(structure))
+        coins, platforms, power_ups = [], [], []
+        for row, line in enumerate(structure):
+            for column, char in enumerate(line):
+                if char not in cls._TILES:
+                    raise ValueError(f"Unknown tile '{char}' at row {row + 1}, column {column + 1}")
+                grid[row * columns + column] = cls._hole(structure[row - 1][column]) if char == 'h' \
+                    else cls._TILES[char]
+                if char == 'c':
+                    coins.append(cls.COIN.pack(column, row))
+                elif char in 'pP':
+                    platforms.append(cls.PLATFORM.pack(column, row, b'Y' if char == 'p' else b'X'))
+                elif char == 'v':
+                    power_ups.append(cls.POWER_UP.pack(column, row, cls.LIFE))
+
+        # The opposite level corners set the camera limits, so they must be floor
+        last_column, last_row = columns - 1, len(structure) - 1
+        if structure[0][0] != 'f' or structure[last_row][last_column] != 'f':
+            raise ValueError("The top left and bottom right level corners must be floor tiles")
+
+        header = cls.HEADER.pack(cls.MAGIC, cls.VERSION, columns, len(structure), 0, 0, last_column, last_row,
+                                 len(coins), len(platforms), len(power_ups))
+        return b''.join([header, grid, *coins, *platforms, *power_ups])
+
+    @classmethod
+    def compile_file(cls, source_path: str, target_path: str = None) -> str:
+        """ Compiles a level source file
+
+        :param source_path: The level source path
+        :param target_path: The compiled level path (the source one with the compiled extension if None)
+        :return: The compiled level path """
+        if target_path is None:
+            target_path = source_path[:-len(cls.SOURCE_EXTENSION)] + cls.EXTENSION \
+                if source_path.endswith(cls.SOURCE_EXTENSION) else source_path + cls.EXTENSION
+
+        with open(source_path, encoding='utf-8') as source:
+            structure = [line.rstrip('\r\n') for line in source if not line.startswith('#')]
+        with open(target_path, 'wb') as target:
+            target.write(cls.compile(structure))
+
+        return target_path
+
+    # ---------- Internal Methods --------------------------
+    @classmethod
+    def _hole(cls, above: str) -> int:
+        """ :return: The hole variant fitting the tile above it """
+        if above in (' ', 'c'):
+            return cls.HOLE_METAL
+        elif above == 'f':
+            return cls.HOLE_FLOOR
+        return cls.HOLE
+
+    def _table(self, name: str) -> list:
+        offset, size, layout = self._tables[name]
+        return list(layout.iter_unpack(self._map[offset:offset + size]))
+
+
+if __name__ == '__main__':
+    for source_file in sys.argv[1:]:
+        print(f'{source_file} -> {LevelFile.compile_file(source_file)}')
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from itertools import repeat
+from pygame import Rect, Surface
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ParticleSystem:
+    available = numpy is not None       # Particle systems need NumPy; levels fall back to plain bodies without it
+
+    def __init__(self, bounds: Rect, count: int, color: [], size: int = 2, spawn: Rect = None,
+                 velocity: tuple = (0, 1), jitter: tuple = (0, 0), gravity: float = 0, drift: float = 0,
+                 sway: float = 0.05, lifetime: int = 0, seed: int = None):
+        """ A swarm of tiny particles (snow, embers, sparks...) kept in NumPy arrays, so all of them move in a
+        single vectorized step and are drawn in a single batched blit. Particles are born spread over the whole
+        bounds; when they leave the bounds or grow old they respawn in the spawn area.
+
+        :param bounds: Area where particles live, in world coordinates
+        :param count: Particles in the system
+        :param color: Particles color
+        :param size: Particles width and height
+        :param spawn: Area where particles respawn (the bounds' top edge if None)
+        :param velocity: Base (X, Y) velocity, in pixels per update
+        :param jitter: Random (X, Y) velocity added to the base one, up to these values on any direction
+        :param gravity: Y velocity gained on every update
+        :param drift: Width of the side to side sway, in pixels per update
+        :param sway: Phase change of the side to side sway, in radians per update
+        :param lifetime: Updates a particle lives before respawning (0 for endless)
+        :param seed: Random seed, for repeatable systems """
+        self.bounds = Rect(bounds)
+        self.spawn = Rect(self.bounds.left, self.bounds.top, self.bounds.width, 1) if spawn is None else Rect(spawn)
+        self.velocity = velocity
+        self.jitter = jitter
+        self.gravity = gravity
+        self.drift = drift
+        self.sway = sway
+        self.lifetime = lifetime
+        self._random = numpy.random.default_rng(seed)
+        self._dot = Surface((size, size)).convert()
+        self._dot.fill(color)
+        self._size = size
+        self._position = numpy.empty((count, 2))
+        self._previous = numpy.empty((count, 2))    # Positions before the latest update, to draw between updates
+        self._velocity = numpy.empty((count, 2))
+        self._age = numpy.zeros(count, dtype=numpy.int32)
+        self._phase = numpy.empty(count)
+        self._alive = numpy.ones(count, dtype=bool)
+        self._respawn(numpy.arange(count), self.bounds)
+        self._previous[:] = self._position
+        # Born ages are spread, so the particles don't grow old all at once
+        if lifetime:
+            self._age[:] = self._random.integers(0, lifetime, count)
+
+    # ---------- Public Methods --------------------------
+    def __len__(self):
+        return int(numpy.count_nonzero(self._alive))
+
+    def update(self) -> None:
+        """ Moves all particles one step, respawning those gone out of bounds or too old """
+        position, velocity = self._position, self._velocity
+        self._previous[:] = position
+        self._age += 1
+        velocity[:, 1] += self.gravity
+        position += velocity
+        if self.drift:
+            position[:, 0] += self.drift * numpy.sin(self._phase + self._age * self.sway)
+
+        bounds = self.bounds
+        gone = (position[:, 0] < bounds.left) | (position[:, 0] >= bounds.right) | \
+               (position[:, 1] < bounds.top) | (position[:, 1] >= bounds.bottom)
+        if self.lifetime:
+            gone |= self._age >= self.lifetime
+        gone &= self._alive
+        if gone.any():
+            gone = numpy.flatnonzero(gone)
+            self._respawn(gone, self.spawn)
+            # Respawned particles don't sweep across the level on their way back
+            self._previous[gone] = position[gone]
+
+    def collide(self, rect: Rect) -> int:
+        """ Removes the particles touching an area, for good
+
+        :param rect: The touched area, usually a body rect
+        :return: The removed particle count """
+        position, size = self._position, self._size
+        touched = self._alive & (position[:, 0] + size > rect.left) & (position[:, 0] < rect.right) & \
+            (position[:, 1] + size > rect.top) & (position[:, 1] < rect.bottom)
+        self._alive &= ~touched
+        return int(numpy.count_nonzero(touched))
+
+    def draw(self, screen, camera, alpha: float = 1.0) -> int:
+        """ Blits the particles inside the camera view
+
+        :param screen: The main screen
+        :param camera: The level camera
+        :param alpha: Progress of the particles from their previous positions into their current ones
+        :return: The drawn particle count """
+        view, position = camera.view, self._position
+        if alpha < 1:
+            position = self._previous + (position - self._previous) * alpha
+        visible = self._alive & (position[:, 0] > view.left - self._size) & (position[:, 0] < view.right) & \
+            (position[:, 1] > view.top - self._size) & (position[:, 1] < view.bottom)
+        points = (position[visible] - view.topleft).astype(numpy.int32).tolist()
+        screen.blits(zip(repeat(self._dot), points), False)
+        return len(points)
+
+    # ---------- Internal Methods --------------------------
+    def _respawn(self, indexes, area: Rect):
+        count = len(indexes)
+        random = self._random
+        self._position[indexes, 0] = random.uniform(area.left, area.right, count)
+        self._position[indexes, 1] = random.uniform(area.top, area.bottom, count)
+        self._velocity[indexes] = numpy.asarray(self.velocity, dtype=float) + \
+            random.uniform(-1, 1, (count, 2)) * numpy.asarray(self.jitter, dtype=float)
+        self._phase[indexes] = random.uniform(0, 2 * numpy.pi, count)
+        self._age[indexes] = 0
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from itertools import count
+from pygame import sprite
+from constants import FLOOR_SIZE
+
+
+class SpatialGroup(sprite.Group):
+    def __init__(self, *sprites, cell_size: int = FLOOR_SIZE):
+        """ A sprite group which also files its bodies into a uniform grid of cells, so collision queries only
+        check the bodies near the asked area instead of the whole group. Bodies flagged as 'dynamic' are filed
+        again on every refresh; the rest are filed once, when they join the group.
+
+        :param sprites: Initial bodies
+        :param cell_size: Width and height of every grid cell """
+        self._cellSize = cell_size
+        self._cells = {}                    # (Column, Row) -> Bodies overlapping that cell
+        self._spans = {}                    # Body -> (First column, first row, last column, last row)
+        self._order = {}                    # Body -> Insertion order (keeps queries as ordered as the group)
+        self._counter = count()
+        self._dynamic = set()               # Bodies which move by themselves
+        self.candidates = 0                 # Bodies checked by the collision queries since this was reset
+        super().__init__(*sprites)
+
+    # ---------- Public Methods --------------------------
+    def add_internal(self, body, layer=None):
+        super().add_internal(body, layer)
+        self._order[body] = next(self._counter)
+        self._file(body, self._span(body.rect))
+        if body.dynamic:
+            self._dynamic.add(body)
+
+    def remove_internal(self, body):
+        super().remove_internal(body)
+        self._unfile(body)
+        del self._order[body]
+        self._dynamic.discard(body)
+
+    def refresh(self) -> None:
+        """ Files again the moving bodies whose position has changed of cell """
+        for body in self._dynamic:
+            span = self._span(body.rect)
+            if span != self._spans[body]:
+                self._unfile(body)
+                self._file(body, span)
+
+    def query(self, rect) -> list:
+        """ Gets all bodies filed in the cells overlapped by an area (they may not be touching it)
+
+        :param rect: The asked area
+        :return: Candidate bodies, in the same order they joined the group """
+        first_col, first_row, last_col, last_row = self._span(rect)
+        cells = self._cells
+        found = set()
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                cell = cells.get((col, row))
+                if cell:
+                    found.update(cell)
+
+        return sorted(found, key=self._order.__getitem__)
+
+    def collide(self, body, dokill: bool = False) -> list:
+        """ Works as pygame's 'spritecollide', but only checking the bodies close to the given one
+
+        :param body: The colliding body
+        :param dokill: Removes the collided bodies from all their groups if True
+        :return: All group bodies colliding with the given one """
+        candidates = self.query(body.rect)
+        self.candidates += len(candidates)
+        collided = body.rect.colliderect
+        hits = [candidate for candidate in candidates if collided(candidate.rect)]
+        if dokill:
+            for hit in hits:
+                hit.kill()
+
+        return hits
+
+    # ---------- Internal Methods --------------------------
+    def _span(self, rect) -> tuple:
+        size = self._cellSize
+        return (rect.left // size, rect.top // size,
+                max(rect.right - 1, rect.left) // size, max(rect.bottom - 1, rect.top) // size)
+
+    def _file(self, body, span):
+        self._spans[body] = span
+        first_col, first_row, last_col, last_row = span
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                self._cells.setdefault((col, row), set()).add(body)
+
+    def _unfile(self, body):
+        first_col, first_row, last_col, last_row = self._spans.pop(body)
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self._cells[(col, row)]
+                cell.discard(body)
+                if not cell:
+                    del self._cells[(col, row)]
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from pygame import Rect
+from .LevelFile import LevelFile
+from models.Bodies.CollisionRegistry import CollisionRegistry
+from models.Bodies.FloorBody import FloorBody
+from models.Bodies.HoleBody import HoleBody
+from constants import FLOOR_SIZE
+
+
+class TileGrid:
+    def __init__(self, columns: int, rows: int, tiles: bytes = None, tile_size: int = FLOOR_SIZE):
+        """ Array-backed map of the level tiles which never move, one byte per cell with the compiled map tile IDs.
+        Collisions against those tiles are solved by indexing only the few cells a body overlaps, without keeping
+        any sprite for them.
+
+        :param columns: Tiles per row
+        :param rows: Tiles per column
+        :param tiles: Row ordered tile IDs (an empty grid if None)
+        :param tile_size: Width and height of every tile """
+        self.columns = columns
+        self.rows = rows
+        self.tileSize = tile_size
+        self._grid = bytearray(columns * rows) if tiles is None else bytearray(tiles)
+        self.candidates = 0                 # Cells checked by the collision queries since this was reset
+
+    @classmethod
+    def from_level(cls, level_file: LevelFile, kept: tuple):
+        """ Builds the grid of a compiled map, keeping only some tiles
+
+        :param level_file: The level map
+        :param kept: Tile IDs kept into the grid; the others are left empty
+        :return: The tile grid """
+        table = bytearray(256)
+        for tile in kept:
+            table[tile] = tile
+        return cls(level_file.columns, level_file.rows, level_file.grid().translate(table))
+
+    # ---------- Public Methods --------------------------
+    def get(self, column: int, row: int) -> int:
+        """ :return: The tile in a cell (empty beyond the grid limits) """
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return self._grid[row * self.columns + column]
+        return LevelFile.EMPTY
+
+    def set(self, column: int, row: int, tile: int) -> None:
+        self._grid[row * self.columns + column] = tile
+
+    def collide(self, rect: Rect) -> list:
+        """ Gets the tiles overlapped by an area
+
+        :param rect: The colliding area, usually a body rect
+        :return: (Tile ID, tile rect) of every non-empty overlapped cell, in row order """
+        size = self.tileSize
+        first_col, last_col = max(rect.left // size, 0), min((rect.right - 1) // size, self.columns - 1)
+        first_row, last_row = max(rect.top // size, 0), min((rect.bottom - 1) // size, self.rows - 1)
+        grid, columns = self._grid, self.columns
+        hits = []
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                tile = grid[row * columns + col]
+                if tile:
+                    hits.append((tile, Rect(col * size, row * size, size, size)))
+
+        self.candidates += max(last_col - first_col + 1, 0) * max(last_row - first_row + 1, 0)
+        return hits
+
+
+# The player responds against the grid tiles as against the bodies they stand for
+CollisionRegistry.register(LevelFile.FLOOR, FloorBody.push_x, FloorBody.push_y)
+for _hole in (LevelFile.HOLE, LevelFile.HOLE_METAL, LevelFile.HOLE_FLOOR):
+    CollisionRegistry.register(_hole, HoleBody.suck_x, HoleBody.suck_y)
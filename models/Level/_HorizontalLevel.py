@@ -1,32 +1,32 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from pygame import image
 from ._LevelBase import _LevelBase
-from constants import ROOT
 
 
 class _HorizontalLevel(_LevelBase):
-    def __init__(self, screen, scr_size, managers, player, debug: bool = False):
+    def __init__(self, screen, scr_size, managers, player, debug: bool = False, preloaded: tuple = None):
         """ 2D Horizontal level's type class
 
         :param screen:
         :param scr_size:
         :param sound_manager:
         :param player:
-        :param debug: """
-        super().__init__(screen, scr_size, managers, player, debug)
-        self.backgroundImg = image.load(f'{ROOT}/resources/images/astro.jpg').convert()
+        :param debug:
+        :param preloaded: The level map and tile grid, as read by 'preload' (None reads them now) """
+        super().__init__(screen, scr_size, managers, player, debug, preloaded)
+        with self._managers.image.owned_by(self):
+            self.backgroundImg = self._managers.image.load_image('astro.jpg')
         self.plainLevel = False
 
     # ---------- Methods --------------------------
     def update(self) -> bool:
         # Update all elements in level
-        self._bodies.update()
+        self._update_bodies()
         # Checks the condition for going out the level
         if self.player.isDead:
             return True
         elif self.player.coins < 10:
-            self.player.update(self._solid_group, self._weak_group)
+            self.player.update(self._solid_group, self._weak_group, self._tileGrid)
             self._scroll()
             if self.debug:
                 self._update_player_debug()
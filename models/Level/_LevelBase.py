@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from pygame import font, sprite
+from pygame import Rect, sprite
+from .Camera import Camera
+from .ChunkLayer import ChunkLayer
+from .LevelFile import LevelFile
+from .SpatialGroup import SpatialGroup
+from .TileGrid import TileGrid
 from models.Bodies.LavaBody import LavaBody
 from models.Bodies.FloorBody import FloorBody
 from models.Bodies.HoleBody import HoleBody
@@ -8,11 +13,18 @@ from models.Bodies.SavePointBody import SavePointBody
 from models.Bodies.PlatformBody import PlatformBody
 from models.Bodies.CoinBody import CoinBody
 from models.Bodies.LifePowerUpBody import LifePowerUpBody
-from constants import COLORS, ANTIALIASING, COIN_SIZE, FLOOR_SIZE, LIFE_POWER_UP_SIZE
+from views.HUD import HUD
+from constants import COLORS, ANTIALIASING, CHUNK_TILES, COIN_SIZE, CULL_MARGIN, FLOOR_SIZE, LEVEL_DIR,\
+    LIFE_POWER_UP_SIZE, STREAM_MARGIN
+from dataclasses import dataclass
 
 
 class _LevelBase:
-    def __init__(self, screen, scr_size, managers, player, debug: bool = False):
+    LEVEL_DIR = LEVEL_DIR                       # Compiled level maps folder
+    MAP_NAME = None                             # Compiled map name, without extension, inside the levels folder
+    STATIC_TILES = (LevelFile.FLOOR, LevelFile.HOLE, LevelFile.HOLE_METAL, LevelFile.HOLE_FLOOR)
+
+    def __init__(self, screen, scr_size, managers, player, debug: bool = False, preloaded: tuple = None):
         """ This class manages all in terms of creating level structures and loading graphic and audio resources.
         Every level created has inheritance from this Level class.
 
@@ -20,32 +32,48 @@ class _LevelBase:
         :param scr_size: The screen size
         :param managers:
         :param player:
-        :param debug: Flag for debugging into the game """
+        :param debug: Flag for debugging into the game
+        :param preloaded: The level map and tile grid, as read by 'preload' (None reads them when they're loaded) """
         # -- Attributes -----------------------
         self.debug = debug
         self.screen = screen
         self.scrSize = scr_size
         self._managers = managers
         self.ID = None                              # A level identifier
-        self.structure = []                         # Level structure map
         self.levelInit = [0, 0]                     # Level enter point
-        self.reference = []                         # Level fixed references for scroll
+        self.reference = []                         # Opposite level corners, in tiles
+        self.camera = Camera(scr_size)              # Level point of view
+        self.cullMargin = CULL_MARGIN               # Distance beyond the view where bodies are still active
+        self.cullStats = self.CullStats()           # Active and culled body counts on the last frame
+        self.streamMargin = STREAM_MARGIN           # Distance beyond the view where level chunks are built
+        self.takenItems = {}                        # Chunk -> Item cells already taken (never built again)
+        self.fallLimit = 0                          # Deepest point the player can fall down before dying
         self.backgroundImg = None                   # Background image reference
         # HUD graphic elements
-        self.hud = [self._managers.image.load_image(f'Life.png'),
-                    self._managers.image.load_image(f'Energy.png'),
-                    self._managers.image.load_image(f'Coin_Frames/coin.png')]
-        for x in range(len(self.hud)):
-            self.hud[x].set_colorkey(COLORS['WHITE'])
+        with self._managers.image.owned_by(self):
+            self.hud = [self._managers.image.load_image(f'Life.png', COLORS['WHITE']),
+                        self._managers.image.load_image(f'Energy.png', COLORS['WHITE']),
+                        self._managers.image.load_image(f'Coin_Frames/coin.png', COLORS['WHITE'])]
 
-        self.font = font.SysFont('Calibri', 25, True, False)
+        self.font = self._managers.font.get_font('Calibri', 25, True)
+        self._hud = None                                # Player counters, set up when they're first displayed
         # Sprite lists for the win!
-        self._solid_group = sprite.Group()              # Walls, platforms, floor, enemies, switches...
-        self._weak_group = sprite.Group()               # Coins, ammo, lifepoints...
+        self._solid_group = SpatialGroup()              # Walls, platforms, floor, enemies, switches...
+        self._tileGrid = TileGrid(0, 0)                 # Static tiles (floors and holes), collided by their cells
+        self._tileBodies = {}                           # Static tile ID -> Body drawn on all cells of that tile
+        self._weak_group = SpatialGroup()               # Coins, ammo, lifepoints...
         self.player_display = sprite.Group()            # The player itself
         self.player = player
         self.player_display.add(self.player)
-        self._bodies = sprite.Group()                # All sprites (this is for render on the screen)
+        self._bodies = SpatialGroup(cell_size=FLOOR_SIZE * 4)     # All sprites (this is for render on the screen)
+        self._awake = sprite.Group()                 # Sprites updated even when they're far from the view
+        self._chunks = ChunkLayer()                  # Static sprites, baked for a faster render
+        self._particles = []                         # (Particle system, touch response) pairs
+        self._levelFile = None                       # Compiled level map, streamed by chunks
+        self._preloaded = preloaded                  # Level map and tile grid read beforehand, if any
+        self._streamed = {}                          # Chunk -> (Tile bodies, {Item cell: Item body}) built on it
+        self._items = {}                             # Chunk -> Item cells with their body type
+        self._previous = {}                          # Body -> Its position before the latest update
         # Music
         self.musicTheme = None
         # Debug
@@ -53,149 +81,317 @@ class _LevelBase:
             text = f'X: {self.player.rect.x}; Y: {self.player.rect.y}'
             self.debText = self.font.render(text, ANTIALIASING, COLORS['WHITE'])
 
+    @dataclass
+    class CullStats:
+        updated: int = 0                # Bodies updated
+        drawn: int = 0                  # Bodies drawn
+        culled: int = 0                 # Bodies neither updated nor drawn
+
     # ---------- Public Methods --------------------------
+    @classmethod
+    def preload(cls) -> tuple:
+        """ Reads the compiled map of this level type and its static tile grid. It's only file I/O and parsing,
+        without any pygame work, so it may run on a background thread while another level is played.
+
+        :return: The level map and its tile grid, for the level constructor """
+        level_file = LevelFile(f'{cls.LEVEL_DIR}/{cls.MAP_NAME}{LevelFile.EXTENSION}')
+        return level_file, TileGrid.from_level(level_file, cls.STATIC_TILES)
+
     def update(self) -> bool:
         pass
 
-    def display(self):
+    def display(self, alpha: float = 1.0):
+        """ Draws the level
+
+        :param alpha: Progress between the latest two logic updates, drawing moving bodies and the view somewhere
+                      between their previous and current positions (1 draws them where they are) """
         # We check if the level has a background image and blit it to the screen
         if self.backgroundImg is not None:
             self.screen.blit(self.backgroundImg, [0, 0])
 
-        self._bodies.draw(self.screen)
-        self.player_display.draw(self.screen)
+        with self.camera.between(alpha):
+            self._chunks.draw(self.screen, self.camera)
+            visible = self._active_bodies()
+            self._draw(visible, alpha)
+            for system, on_touch in self._particles:
+                system.draw(self.screen, self.camera, alpha)
+            self._draw(self.player_display, alpha)
+        self.cullStats.drawn = len(visible)
 
-        if self.hud is not None:
-            self.screen.blit(self.hud[0], [50, 50])
-            self.screen.blit(self.hud[1], [50, 80])
-            self.screen.blit(self.hud[2], [50, 110])
-
-        self.screen.blit(self.font.render(f': {self.player.life}', ANTIALIASING, COLORS['WHITE']), [80, 50])
-        self.screen.blit(self.font.render(f': {self.player.energy}', ANTIALIASING, COLORS['WHITE']), [80, 80])
-        self.screen.blit(self.font.render(f': {self.player.coins}', ANTIALIASING, COLORS['WHITE']), [80, 110])
+        # Levels may be built on a background thread, so the HUD glyphs are rendered here, on the main one
+        if self._hud is None:
+            self._hud = HUD(self.font, self.hud)
+        self._hud.display(self.screen, (self.player.life, self.player.energy, self.player.coins))
 
         if self.debug:
             self.screen.blit(self.debText, [50, 560])
 
+        if self._managers.stats is not None:
+            self._report_stats(self._managers.stats)
+
+    def step(self, n_frames: int = 1, render: bool = False) -> bool:
+        """ Runs a number of level updates as fast as the CPU allows, without keeping the frame rate
+
+        :param n_frames: Updates to run
+        :param render: Displays the level after every update if True
+        :return: True if the level asked for leaving it (the remaining updates are not run); False otherwise """
+        for frame in range(n_frames):
+            if self.update():
+                return True
+            if render:
+                self.display()
+
+        return False
+
+    def taken_cells(self) -> list:
+        """ :return: Cells of every item taken on this level so far, as (column, row) """
+        taken = [cell for cells in self.takenItems.values() for cell in cells]
+        for tiles, items in self._streamed.values():
+            taken.extend(cell for cell, item in items.items() if not item.alive())
+
+        return sorted(taken)
+
+    def take_items(self, cells) -> None:
+        """ Marks some items as already taken, so they're never built (call it before the first update)
+
+        :param cells: Cells of the taken items, as (column, row) """
+        for column, row in cells:
+            self.takenItems.setdefault(self._chunk_key(column, row), set()).add((column, row))
+
     def set_theme(self):
         if self.musicTheme is not None:
             self._managers.sound.play_music(self.musicTheme)
 
+    def unload(self):
+        """ Releases all shared resources taken by this level, and lets the player go """
+        self._managers.animation.release(self)
+        self._managers.image.release(self)
+        self.player_display.empty()
+        if self._levelFile is not None:
+            self._levelFile.close()
+            self._levelFile = None
+
     # ---------- Internal Methods --------------------------
-    def _fill_level(self, structure: list):
-        """ It fills all level gaps with elements taking a pattern
-
-        :param structure: A string list which contains all elements available in a level (WIP) """
-        cnt_y = 0  # Initial Y-axis tile grid
-        temp_row = 0
-        for row in structure:
-            cnt_x = 0  # Initial X-axis tile grid
-            temp_col = 0
-            for char in row:
-                if char == "f":  # 'f' stands for 'Floor'
-                    floor = FloorBody(COLORS['BLUE'], FLOOR_SIZE, FLOOR_SIZE, self._managers)
-                    self._set_body(floor, cnt_x, cnt_y, self._solid_group)
-                    # We append the opposite level corners
-                    if cnt_y == 0 and cnt_x == 0:
-                        self.reference.append(floor)
-                    elif cnt_y == (len(structure) - 1) * FLOOR_SIZE and cnt_x == (len(structure[0]) - 1) * FLOOR_SIZE:
-                        self.reference.append(floor)
-                elif char == "h":  # 'h' stands for 'Hole'
-                    if structure[temp_row - 1][temp_col] == ' ' or structure[temp_row - 1][temp_col] == 'c':
-                        hole = HoleBody(COLORS['BLACK'], FLOOR_SIZE, FLOOR_SIZE, self._managers, "hole_metal")
-                    elif structure[temp_row - 1][temp_col] == 'f':
-                        hole = HoleBody(COLORS['BLACK'], FLOOR_SIZE, FLOOR_SIZE, self._managers, "hole_floor")
-                    else:
-                        hole = HoleBody(COLORS['BLACK'], FLOOR_SIZE, FLOOR_SIZE, self._managers)
-                    self._set_body(hole, cnt_x, cnt_y, self._solid_group)
-                elif char == "s":  # 's' stands for 'SavePoint'
-                    save = SavePointBody(COLORS['WHITE'], FLOOR_SIZE, FLOOR_SIZE, self._managers)
-                    self._set_body(save, cnt_x, cnt_y, self._solid_group)
-                elif char == "c":  # 'c' stands for 'Coin'
-                    coin = CoinBody(COLORS['ORANGE'], COIN_SIZE, COIN_SIZE, self._managers)
-                    self._set_body(coin, cnt_x + 10, cnt_y + 10, self._weak_group)
-                elif char == "p":  # 'p' stands for 'Platform on Y'
-                    platform = PlatformBody(COLORS['GREEN'], FLOOR_SIZE, FLOOR_SIZE, self._managers, [cnt_x, cnt_y], 'Y')
-                    self._set_body(platform, cnt_x, cnt_y, self._solid_group)
-                elif char == "P":  # 'p' stands for 'Platform on X'
-                    platform = PlatformBody(COLORS['GREEN'], FLOOR_SIZE, FLOOR_SIZE, self._managers, [cnt_x, cnt_y])
-                    self._set_body(platform, cnt_x, cnt_y, self._solid_group)
-                elif char == "l":  # 'l' stands for 'Lava'
-                    lava = LavaBody(COLORS['RED'], FLOOR_SIZE, FLOOR_SIZE, self._managers)
-                    self._set_body(lava, cnt_x, cnt_y, self._solid_group)
-                elif char == "v":
-                    life_power_up =\
-                        LifePowerUpBody(COLORS['ORANGE'], LIFE_POWER_UP_SIZE, LIFE_POWER_UP_SIZE, self._managers)
-                    self._set_body(life_power_up, cnt_x, cnt_y, self._weak_group)
-
-                # Increment X-axis for the next tile
-                cnt_x += FLOOR_SIZE
-                temp_col += 1
-
-            # Increment Y-axis for the next tile
-            cnt_y += FLOOR_SIZE
-            temp_row += 1
+    def _load_level(self):
+        """ Fills the level from its compiled map, unless it was preloaded """
+        preloaded, self._preloaded = self._preloaded, None
+        self._fill_level(*(self.preload() if preloaded is None else preloaded))
+
+    def _fill_level(self, level_file: LevelFile, tile_grid: TileGrid = None):
+        """ Prepares the level for streaming the bodies of a compiled map: only the moving platforms are built here,
+        as they may travel across chunks. The level keeps the map until it's unloaded.
+
+        :param level_file: The level map
+        :param tile_grid: Its static tile grid (built now if None) """
+        self._levelFile = level_file
+        self.reference = level_file.reference
+        self._tileGrid = TileGrid.from_level(level_file, self.STATIC_TILES) if tile_grid is None else tile_grid
+        # Every image loaded by the level bodies is referenced by this level
+        with self._managers.image.owned_by(self):
+            # Static tiles are only baked into the chunks, so one body per tile is enough
+            self._tileBodies = {
+                LevelFile.FLOOR: FloorBody(COLORS['BLUE'], FLOOR_SIZE, FLOOR_SIZE, self._managers),
+                LevelFile.HOLE: HoleBody(COLORS['BLACK'], FLOOR_SIZE, FLOOR_SIZE, self._managers),
+                LevelFile.HOLE_METAL: HoleBody(COLORS['BLACK'], FLOOR_SIZE, FLOOR_SIZE, self._managers, "hole_metal"),
+                LevelFile.HOLE_FLOOR: HoleBody(COLORS['BLACK'], FLOOR_SIZE, FLOOR_SIZE, self._managers, "hole_floor")}
+            for column, row, axis in level_file.platforms():
+                position = [column * FLOOR_SIZE, row * FLOOR_SIZE]
+                platform = PlatformBody(COLORS['GREEN'], FLOOR_SIZE, FLOOR_SIZE, self._managers, position, axis)
+                self._set_body(platform, *position, self._solid_group)
+
+        for column, row in level_file.coins():
+            self._items.setdefault(self._chunk_key(column, row), []).append((column, row, CoinBody))
+        for column, row, kind in level_file.power_ups():
+            self._items.setdefault(self._chunk_key(column, row), []).append((column, row, LifePowerUpBody))
+
+        # The opposite level corners set the limits for the camera
+        (first_column, first_row), (last_column, last_row) = level_file.reference
+        self.camera.set_bounds(Rect(first_column * FLOOR_SIZE, first_row * FLOOR_SIZE,
+                                    (last_column - first_column + 1) * FLOOR_SIZE,
+                                    (last_row - first_row + 1) * FLOOR_SIZE))
+        self.fallLimit = self.camera.bounds.bottom + self.scrSize[1] / 2
+
+    def _stream_chunks(self):
+        """ Builds the level chunks coming close to the view and the player, and releases those left far away.
+        Chunks already in sight are built at once; the others are prefetched one per update, avoiding stalls. """
+        if self._levelFile is None:
+            return
+
+        area = self.camera.view.union(self.player.rect)
+        first_col, first_row, last_col, last_row = self._chunk_span(area.inflate(self.streamMargin * 4,
+                                                                                 self.streamMargin * 4))
+        for key in [key for key in self._streamed
+                    if not (first_col <= key[0] <= last_col and first_row <= key[1] <= last_row)]:
+            self._release_chunk(key)
+
+        first_col, first_row, last_col, last_row = self._chunk_span(area.inflate(self.streamMargin * 2,
+                                                                                 self.streamMargin * 2))
+        last_col = min(last_col, (self._levelFile.columns - 1) // CHUNK_TILES)
+        last_row = min(last_row, (self._levelFile.rows - 1) // CHUNK_TILES)
+        sight_first_col, sight_first_row, sight_last_col, sight_last_row = self._chunk_span(area)
+        built = prefetched = False
+        for col in range(max(first_col, 0), last_col + 1):
+            for row in range(max(first_row, 0), last_row + 1):
+                if (col, row) in self._streamed:
+                    continue
+                in_sight = sight_first_col <= col <= sight_last_col and sight_first_row <= row <= sight_last_row
+                if in_sight or not prefetched:
+                    self._build_chunk((col, row))
+                    built = True
+                    prefetched = prefetched or not in_sight
+
+        if built:
+            self._chunks.bake()
+
+    def _build_chunk(self, key: tuple):
+        """ Bakes the static tiles of a chunk, and builds its other tile and item bodies but the items already
+        taken """
+        managers = self._managers
+        first_column, first_row = key[0] * CHUNK_TILES, key[1] * CHUNK_TILES
+        span = (first_column, first_row, min(first_column + CHUNK_TILES, self._levelFile.columns) - 1,
+                min(first_row + CHUNK_TILES, self._levelFile.rows) - 1)
+        tiles = []
+        items = {}
+        with managers.image.owned_by(self):
+            for column, row, tile in self._levelFile.tiles(span):
+                if tile in self._tileBodies:
+                    self._chunks.add(self._tileBodies[tile].image,
+                                     Rect(column * FLOOR_SIZE, row * FLOOR_SIZE, FLOOR_SIZE, FLOOR_SIZE))
+                    continue
+                elif tile == LevelFile.SAVE_POINT:
+                    body = SavePointBody(COLORS['WHITE'], FLOOR_SIZE, FLOOR_SIZE, managers)
+                else:
+                    body = LavaBody(COLORS['RED'], FLOOR_SIZE, FLOOR_SIZE, managers)
+                self._set_body(body, column * FLOOR_SIZE, row * FLOOR_SIZE, self._solid_group)
+                tiles.append(body)
+
+            taken = self.takenItems.get(key, ())
+            for column, row, body_type in self._items.get(key, ()):
+                if (column, row) in taken:
+                    continue
+                if body_type is CoinBody:
+                    item = CoinBody(COLORS['ORANGE'], COIN_SIZE, COIN_SIZE, managers)
+                    self._set_body(item, column * FLOOR_SIZE + 10, row * FLOOR_SIZE + 10, self._weak_group)
+                else:
+                    item = LifePowerUpBody(COLORS['ORANGE'], LIFE_POWER_UP_SIZE, LIFE_POWER_UP_SIZE, managers)
+                    self._set_body(item, column * FLOOR_SIZE, row * FLOOR_SIZE, self._weak_group)
+                items[(column, row)] = item
+
+        self._streamed[key] = (tiles, items)
+
+    def _release_chunk(self, key: tuple):
+        """ Drops the bodies of a chunk, remembering which items were taken meanwhile """
+        tiles, items = self._streamed.pop(key)
+        for body in tiles:
+            body.kill()
+        for cell, item in items.items():
+            if item.alive():
+                item.kill()
+            else:
+                self.takenItems.setdefault(key, set()).add(cell)
+        self._chunks.release(key)
 
     def _set_body(self, body, pos_x, pos_y, sprite_group):
         body.rect.x = pos_x
         body.rect.y = pos_y
         sprite_group.add(body)
         self._bodies.add(body)
+        if body.always_update:
+            self._awake.add(body)
+
+    def _update_bodies(self):
+        """ Updates the level bodies close to the view (plus those which must always be updated), keeping the
+        collision grids up to date with those which move """
+        self._stream_chunks()
+        active = [body for body in self._active_bodies() if not body.always_update]
+        self._mark_positions(active)
+        self._managers.animation.update()
+        self._awake.update()
+        self._update_particles()
+        for body in active:
+            body.update()
+
+        self._bodies.refresh()
+        self._solid_group.refresh()
+        self._weak_group.refresh()
+        self.cullStats.updated = len(active) + len(self._awake)
+        self.cullStats.culled = len(self._bodies) - self.cullStats.updated
+
+    def _add_particles(self, system, on_touch=None):
+        """ Adds a particle system to the level
+
+        :param system: The particle system
+        :param on_touch: Response called as 'on_touch(player, particles)' when the player touches some particles,
+                         which are removed (None if they go through the player) """
+        self._particles.append((system, on_touch))
+
+    def _update_particles(self):
+        for system, on_touch in self._particles:
+            system.update()
+            if on_touch is not None:
+                touched = system.collide(self.player.rect)
+                if touched:
+                    on_touch(self.player, touched)
+
+    def _active_bodies(self) -> list:
+        """ :return: Bodies overlapping the view plus its cull margin """
+        area = self.camera.view.inflate(self.cullMargin * 2, self.cullMargin * 2)
+        overlaps = area.colliderect
+        return [body for body in self._bodies.query(area) if overlaps(body.rect)]
+
+    @staticmethod
+    def _chunk_span(rect: Rect) -> tuple:
+        size = CHUNK_TILES * FLOOR_SIZE
+        return rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    @staticmethod
+    def _chunk_key(column: int, row: int) -> tuple:
+        return column // CHUNK_TILES, row // CHUNK_TILES
 
     def _scroll(self):
         """ It manages the level scrolling """
-        self.player.rect.x = \
-            self._scroll_on_corner(self.player.rect.x, self.scrSize[0], self.reference[1].rect.x + FLOOR_SIZE, 'x')
-        self.player.rect.x = self._scroll_axis(self.player.rect.x, self.scrSize[0] / 2, 'x')
-        self.player.rect.y = \
-            self._scroll_on_corner(self.player.rect.y, self.scrSize[1], self.reference[1].rect.y + FLOOR_SIZE, 'y')
-        self.player.rect.y = self._scroll_axis(self.player.rect.y, self.scrSize[1] / 2, 'y')
-
-    def _scroll_on_corner(self, player_coordinate, screen_coordinate, self_ref_coordinate, axis):
-        new_player_coord = player_coordinate
-        if player_coordinate < 0:
-            screen_midpoint = screen_coordinate / 2
-            diff = screen_midpoint - player_coordinate
-            new_player_coord = screen_midpoint
-            self._update_bodies(diff, axis)
-        elif player_coordinate > screen_coordinate:
-            diff = self_ref_coordinate - screen_coordinate
-            new_player_coord -= diff
-            self._update_bodies(-diff, axis)
-
-        return new_player_coord
-
-    def _scroll_axis(self, player_coordinate, screen_midpoint, axis):
-        new_player_coord = player_coordinate
-        if player_coordinate < screen_midpoint:
-            # The player is far from the beginning of the level
-            self_ref = self.reference[0].rect.x if axis == 'x' else self.reference[0].rect.y
-            if player_coordinate - self_ref > screen_midpoint:
-                diff = screen_midpoint - player_coordinate
-                new_player_coord = screen_midpoint
-                self._update_bodies(diff, axis)
-        # The player is located near to the end of the screen (going to the right)
-        elif player_coordinate > screen_midpoint:
-            # The player is far from the beginning of the level
-            self_ref = self.reference[1].rect.x if axis == 'x' else self.reference[1].rect.y
-            if self_ref + FLOOR_SIZE - player_coordinate > screen_midpoint:
-                diff = player_coordinate - screen_midpoint
-                new_player_coord = screen_midpoint
-                self._update_bodies(-diff, axis)
-
-        return new_player_coord
-
-    def _update_bodies(self, diff, axis):
-        if axis == 'x':
-            for body in self._bodies:
-                body.rect.x += diff
-                if isinstance(body, PlatformBody):
-                    body.initPoint[0] += diff
-        elif axis == 'y':
-            for body in self._bodies:
-                body.rect.y += diff
-                if isinstance(body, PlatformBody):
-                    body.initPoint[1] += diff
+        self.camera.follow(self.player.rect)
+
+    def _mark_positions(self, active: list):
+        """ Keeps the view and the positions of the bodies about to be updated, to draw between updates later """
+        self.camera.mark()
+        previous = {body: body.rect.topleft for body in active}
+        previous.update((body, body.rect.topleft) for body in self._awake)
+        previous[self.player] = self.player.rect.topleft
+        self._previous = previous
+
+    def _draw(self, group, alpha: float = 1.0):
+        """ Blits a sprite group, translating its bodies from world coordinates into screen ones
+
+        :param group: The drawn bodies
+        :param alpha: Progress of the bodies from their previous positions into their current ones """
+        offset_x, offset_y = self.camera.offset
+        if alpha >= 1:
+            self.screen.blits([(body.image, body.rect.move(offset_x, offset_y)) for body in group], False)
+            return
+
+        previous, blits = self._previous, []
+        for body in group:
+            x, y = body.rect.topleft
+            old = previous.get(body)
+            if old is not None:
+                x, y = round(old[0] + (x - old[0]) * alpha), round(old[1] + (y - old[1]) * alpha)
+            blits.append((body.image, (x + offset_x, y + offset_y)))
+        self.screen.blits(blits, False)
+
+    def _report_stats(self, stats):
+        """ Reports the sprite and collision candidate counts of the current frame """
+        stats.count('Bodies', len(self._bodies))
+        stats.count('Updated', self.cullStats.updated)
+        stats.count('Drawn', self.cullStats.drawn)
+        stats.count('Culled', self.cullStats.culled)
+        stats.count('Chunks', self._chunks.blits)
+        stats.count('Particles', sum(len(system) for system, on_touch in self._particles))
+        stats.count('Collision candidates', self._solid_group.candidates + self._weak_group.candidates)
+        stats.count('Tile candidates', self._tileGrid.candidates)
+        stats.count('HUD redraws', self._hud.redraws)
+        self._hud.redraws = 0
+        self._solid_group.candidates = self._weak_group.candidates = self._tileGrid.candidates = 0
 
     def _update_player_debug(self):
         player_pos = f'X: {self.player.rect.x}; Y: {self.player.rect.y}; '
@@ -4,22 +4,23 @@ from ._LevelBase import _LevelBase
 
 
 class _PlainLevel(_LevelBase):
-    def __init__(self, screen, scr_size, managers, player, debug: bool = False):
+    def __init__(self, screen, scr_size, managers, player, debug: bool = False, preloaded: tuple = None):
         """ 2D Plain level's type class
 
         :param screen:
         :param scr_size:
         :param sound_manager:
         :param player:
-        :param debug: """
-        super().__init__(screen, scr_size, managers, player, debug)
+        :param debug:
+        :param preloaded: The level map and tile grid, as read by 'preload' (None reads them now) """
+        super().__init__(screen, scr_size, managers, player, debug, preloaded)
         self.plainLevel = True
 
     # ---------- Methods --------------------------
     def update(self) -> bool:
         # Update all elements in level
-        self._bodies.update()
-        self.player.update(self._solid_group, self._weak_group)
+        self._update_bodies()
+        self.player.update(self._solid_group, self._weak_group, self._tileGrid)
         self._scroll()
         if self.debug:
             self._update_player_debug()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from random import Random
+from timeit import default_timer
+from pygame import sprite
+from models.Bodies.FloorBody import FloorBody
+from models.Bodies.PlayerBody import PlayerBody
+from models.Bodies._BodyBase import _BodyBase
+from models.Level.LevelFile import LevelFile
+from models.Level.SpatialGroup import SpatialGroup
+from models.Level.TileGrid import TileGrid
+from constants import COLORS, COIN_SIZE, FLOOR_SIZE, PLAYER_SIZE
+
+""" Per-frame player collision cost as the level area grows, comparing the spatial grid queries and the tile grid
+    (for the static tiles) against the former linear scans over whole sprite groups. Run it from the game root:
+
+        python -m tests.benchmarks.collision_benchmark """
+
+MAP_SIDES = (32, 64, 128, 256)                  # Square maps, in tiles per side
+FRAMES = 2000
+
+
+def build_map(side: int, seed: int = 0):
+    """ Generates a closed square map sprinkled with floor tiles and coins
+
+    :param side: Tiles per side
+    :param seed: Random seed, so every run tests the same map
+    :return: Solid and weak body lists """
+    rand = Random(seed)
+    solid, weak = [], []
+    for row in range(side):
+        for col in range(side):
+            border = row in (0, side - 1) or col in (0, side - 1)
+            if border or rand.random() < 0.3:
+                body = FloorBody(COLORS['BLUE'], FLOOR_SIZE, FLOOR_SIZE, None)
+                solid.append(body)
+            elif rand.random() < 0.05:
+                # A plain body stands for the coins, which would need the image manager
+                body = _BodyBase(COLORS['ORANGE'], COIN_SIZE, COIN_SIZE, None)
+                weak.append(body)
+            else:
+                continue
+            body.rect.topleft = (col * FLOOR_SIZE, row * FLOOR_SIZE)
+
+    return solid, weak
+
+
+def linear_frame(player, solid, weak):
+    """ The four whole-group scans done per frame before the spatial grid """
+    sprite.spritecollide(player, solid, False)
+    sprite.spritecollide(player, weak, False)
+    sprite.spritecollide(player, solid, False)
+    sprite.spritecollide(player, weak, False)
+
+
+def grid_frame(player, solid, weak):
+    """ The same four queries through the spatial grid """
+    solid.collide(player)
+    weak.collide(player)
+    solid.collide(player)
+    weak.collide(player)
+
+
+def tile_frame(player, tiles, weak):
+    """ The same four queries, solving the static tiles through the tile grid """
+    tiles.collide(player.rect)
+    weak.collide(player)
+    tiles.collide(player.rect)
+    weak.collide(player)
+
+
+def build_tile_grid(side: int, solid: list) -> TileGrid:
+    tiles = TileGrid(side, side)
+    for body in solid:
+        tiles.set(body.rect.x // FLOOR_SIZE, body.rect.y // FLOOR_SIZE, LevelFile.FLOOR)
+    return tiles
+
+
+def time_frames(frame, player, solid, weak, frames: int = FRAMES) -> float:
+    """ :return: Average seconds per frame """
+    start = default_timer()
+    for i in range(frames):
+        player.rect.x += 1 if i % 200 < 100 else -1
+        frame(player, solid, weak)
+
+    return (default_timer() - start) / frames
+
+
+def run(map_sides=MAP_SIDES, frames: int = FRAMES) -> list:
+    """ :return: One result dict per map size """
+    results = []
+    for side in map_sides:
+        solid, weak = build_map(side)
+        player = PlayerBody(COLORS['RED'], PLAYER_SIZE, PLAYER_SIZE, None)
+        player.rect.center = (side * FLOOR_SIZE // 2, side * FLOOR_SIZE // 2)
+        linear = time_frames(linear_frame, player, sprite.Group(solid), sprite.Group(weak), frames)
+        grid = time_frames(grid_frame, player, SpatialGroup(*solid), SpatialGroup(*weak), frames)
+        tiles = time_frames(tile_frame, player, build_tile_grid(side, solid), SpatialGroup(*weak), frames)
+        results.append({'side': side, 'bodies': len(solid) + len(weak), 'linear': linear, 'grid': grid,
+                        'tiles': tiles})
+
+    return results
+
+
+def main():
+    print(f'{"Map":>9} {"Bodies":>8} {"Linear (us)":>12} {"Grid (us)":>10} {"Tiles (us)":>11}')
+    for result in run():
+        print(f'{result["side"]:>4}x{result["side"]:<4} {result["bodies"]:>8} '
+              f'{result["linear"] * 1e6:>12.1f} {result["grid"] * 1e6:>10.1f} {result["tiles"] * 1e6:>11.1f}')
+
+
+if __name__ == "__main__":
+    main()
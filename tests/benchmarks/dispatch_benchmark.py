@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from random import Random
+from timeit import default_timer
+from models.Bodies import CollisionResponses     # Registers the responses against the body types
+from models.Bodies.CollisionRegistry import CollisionRegistry
+from models.Bodies.FloorBody import FloorBody
+from models.Bodies.HoleBody import HoleBody
+from models.Bodies.LavaBody import LavaBody
+from models.Bodies.PlatformBody import PlatformBody
+from models.Bodies.SavePointBody import SavePointBody
+from models.Level.LevelFile import LevelFile
+from models.Level import TileGrid                # Registers the responses against the tile IDs
+
+""" Per-collision cost of choosing the player's response, comparing the collision registry against the former
+    'isinstance' chain. Both sides call the same empty response, so only the dispatch is measured. Run it from the
+    game root:
+
+        python -m tests.benchmarks.dispatch_benchmark """
+
+CHAIN = (FloorBody, PlatformBody, HoleBody, SavePointBody, LavaBody)   # Former check order
+TILES = (LevelFile.FLOOR, LevelFile.HOLE, LevelFile.HOLE_METAL, LevelFile.HOLE_FLOOR)
+COLLISIONS = 100000
+
+
+def respond(player, rect, body):
+    pass
+
+
+def build_collisions(count: int = COLLISIONS, seed: int = 0) -> list:
+    """ :return: Colliding bodies, of every type in the former chain (not initialized: only their type matters) """
+    rand = Random(seed)
+    return [body_type.__new__(body_type) for body_type in (rand.choice(CHAIN) for i in range(count))]
+
+
+def chain_dispatch(bodies: list):
+    for body in bodies:
+        if isinstance(body, FloorBody):
+            respond(None, None, body)
+        elif isinstance(body, PlatformBody):
+            respond(None, None, body)
+        elif isinstance(body, HoleBody):
+            respond(None, None, body)
+        elif isinstance(body, SavePointBody):
+            respond(None, None, body)
+        elif isinstance(body, LavaBody):
+            respond(None, None, body)
+
+
+def registry_dispatch(bodies: list):
+    handler = CollisionRegistry.handler
+    for body in bodies:
+        response = handler(type(body), CollisionRegistry.X)
+        if response is not None:
+            respond(None, None, body)
+
+
+def tile_dispatch(tiles: list):
+    handler = CollisionRegistry.handler
+    for tile in tiles:
+        response = handler(tile, CollisionRegistry.X)
+        if response is not None:
+            respond(None, None, None)
+
+
+def time_dispatch(dispatch, collisions: list, repeat: int = 5) -> float:
+    """ :return: Best seconds per collision """
+    best = None
+    for i in range(repeat):
+        start = default_timer()
+        dispatch(collisions)
+        elapsed = (default_timer() - start) / len(collisions)
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def main():
+    bodies = build_collisions()
+    tiles = [Random(0).choice(TILES) for i in range(COLLISIONS)]
+    print(f'{"Dispatch":>12} {"ns/collision":>13}')
+    for name, dispatch, collisions in (('isinstance', chain_dispatch, bodies), ('registry', registry_dispatch, bodies),
+                                       ('tile ID', tile_dispatch, tiles)):
+        print(f'{name:>12} {time_dispatch(dispatch, collisions) * 1e9:>13.1f}')
+
+
+if __name__ == "__main__":
+    main()
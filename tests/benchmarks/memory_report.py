@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import gc
+import tracemalloc
+from Headless import init_headless
+from managers.AnimationManager import AnimationManager
+from managers.ImageManager import ImageManager
+from managers.ManagerDataClass import ManagerDataClass
+from models.Bodies.CoinBody import CoinBody
+from models.Bodies.FloorBody import FloorBody
+from models.Bodies.HoleBody import HoleBody
+from models.Bodies.LavaBody import LavaBody
+from models.Bodies.LifePowerUpBody import LifePowerUpBody
+from models.Bodies.PlatformBody import PlatformBody
+from models.Bodies.SavePointBody import SavePointBody
+from models.Bodies.SnowBody import SnowBody
+from tests.benchmarks.suite import GAME_ROOT
+from constants import COLORS, COIN_SIZE, FLOOR_SIZE, LIFE_POWER_UP_SIZE
+
+""" Memory held by every level body, per body type: the Python objects (traced allocations) plus the pixels of the
+    surfaces which only that body uses (shared surfaces are split among all bodies using them). Run it from the game
+    root:
+
+        python -m tests.benchmarks.memory_report """
+
+BODIES = 1000                               # Bodies built per type
+
+FACTORIES = {
+    'FloorBody': lambda managers: FloorBody(COLORS['BLUE'], FLOOR_SIZE, FLOOR_SIZE, managers),
+    'HoleBody': lambda managers: HoleBody(COLORS['BLACK'], FLOOR_SIZE, FLOOR_SIZE, managers, "hole_metal"),
+    'LavaBody': lambda managers: LavaBody(COLORS['RED'], FLOOR_SIZE, FLOOR_SIZE, managers),
+    'SavePointBody': lambda managers: SavePointBody(COLORS['WHITE'], FLOOR_SIZE, FLOOR_SIZE, managers),
+    'PlatformBody': lambda managers: PlatformBody(COLORS['GREEN'], FLOOR_SIZE, FLOOR_SIZE, managers, [0, 0]),
+    'CoinBody': lambda managers: CoinBody(COLORS['ORANGE'], COIN_SIZE, COIN_SIZE, managers),
+    'LifePowerUpBody': lambda managers: LifePowerUpBody(COLORS['ORANGE'], LIFE_POWER_UP_SIZE, LIFE_POWER_UP_SIZE,
+                                                        managers),
+    'SnowBody': lambda managers: SnowBody(COLORS['WHITE'], 2, 2, (FLOOR_SIZE, FLOOR_SIZE), managers),
+}
+
+
+def measure(factory, managers, count: int = BODIES) -> dict:
+    """ :return: Python and surface pixel bytes per body """
+    # A first body loads the shared images, so they don't count as the bodies' own memory
+    factory(managers)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    bodies = [factory(managers) for i in range(count)]
+    python_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # Every surface holds its pixels out of the Python heap
+    surfaces = {id(body.image): body.image for body in bodies}
+    pixel_bytes = sum(surface.get_pitch() * surface.get_height() for surface in surfaces.values())
+    return {'python': python_bytes / count, 'pixels': pixel_bytes / count,
+            'dict': sum(len(getattr(body, '__dict__', ())) for body in bodies) / count}
+
+
+def main():
+    init_headless()
+    managers = ManagerDataClass()
+    managers.image = ImageManager(f'{GAME_ROOT}/resources/images/')
+    managers.animation = AnimationManager(managers.image)
+    print(f'{"Body":>16} {"Python (B)":>11} {"Pixels (B)":>11} {"Dict keys":>10}')
+    for name, factory in FACTORIES.items():
+        result = measure(factory, managers)
+        print(f'{name:>16} {result["python"]:>11.0f} {result["pixels"]:>11.0f} {result["dict"]:>10.1f}')
+
+
+if __name__ == "__main__":
+    main()
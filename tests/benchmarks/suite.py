@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from os import environ, path
+from random import Random
+from statistics import median
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+from Headless import init_headless
+from managers.AnimationManager import AnimationManager
+from managers.FontManager import FontManager
+from managers.ImageManager import ImageManager
+from managers.ManagerDataClass import ManagerDataClass
+from models.Bodies.PlayerBody import PlayerBody
+from models.Level.Level1 import Level1
+from models.Level.Level2 import Level2
+from models.Level.Camera import Camera
+from models.Level.LevelFile import LevelFile
+from models.Level.ParticleSystem import ParticleSystem
+from models.Level._LevelBase import _LevelBase
+from models.Level._PlainLevel import _PlainLevel
+from constants import COLORS, FLOOR_SIZE, PLAYER_SIZE, SCR_HEIGHT, SCR_WIDTH
+
+""" Benchmark suite for the level build, physics, rendering and startup costs. Every benchmark reports the median
+    seconds per operation over some repetitions. Run it from the game root:
+
+        python -m tests.benchmarks.suite [--output results.json] [--baseline baseline.json] [--threshold 0.25]
+        python -m tests.benchmarks.suite --save-baseline baseline.json
+
+    Results slower than their baseline beyond the threshold (a ratio; 0.25 means 25% slower) are reported as
+    regressions, and benchmarks which failed or are missing against the baseline are reported as failures; both
+    make the suite exit with an error code. A baseline file may override the threshold for any
+    benchmark through its "thresholds" dict. The in-process benchmarks don't need any sound device, as they only
+    drive levels. """
+
+GAME_ROOT = path.dirname(path.dirname(path.dirname(path.realpath(__file__))))
+LARGE_MAPS = ((128, 40), (256, 40), (640, 200))     # Generated maps, in (columns, rows) tiles
+PARTICLES = 5000                                    # Particles in the particle system benchmarks
+REPEAT = 5
+BENCHMARKS = {}                                     # Benchmark name -> Function returning seconds per operation
+
+
+def benchmark(name: str):
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+
+    return register
+
+
+# ---------------------------- FIXTURES ----------------------------
+class _Fixture:
+    screen = None
+    managers = None
+    levelDir = None                     # Generated maps folder
+
+    @classmethod
+    def get(cls):
+        """ Starts the headless game once for all in-process benchmarks """
+        if cls.screen is None:
+            _LevelBase.LEVEL_DIR = f'{GAME_ROOT}/resources/levels/'
+            cls.levelDir = TemporaryDirectory()
+            cls.screen = init_headless()
+            cls.managers = ManagerDataClass()
+            cls.managers.image = ImageManager(f'{GAME_ROOT}/resources/images/')
+            cls.managers.animation = AnimationManager(cls.managers.image)
+            cls.managers.font = FontManager()
+
+        return cls.screen, cls.managers
+
+
+def generate_level(columns: int, rows: int, seed: int = 0) -> str:
+    """ Generates and compiles a closed level map with floor, hole and lava tiles, and moving platforms (no items,
+    so the player never needs the sound manager)
+
+    :param columns: Tiles per row
+    :param rows: Tiles per column
+    :param seed: Random seed, so every run builds the same map
+    :return: The compiled level path """
+    rand = Random(seed)
+    structure = []
+    for row in range(rows):
+        if row in (0, rows - 1):
+            structure.append('f' * columns)
+            continue
+        tiles = ['f']
+        for col in range(1, columns - 1):
+            roll = rand.random()
+            tiles.append('f' if roll < 0.25 else 'h' if roll < 0.3 else 'l' if roll < 0.32
+                         else 'P' if roll < 0.325 else ' ')
+        tiles.append('f')
+        structure.append(''.join(tiles))
+
+    # Free room for the player to start
+    structure[1] = 'f' + ' ' * 4 + structure[1][5:]
+    _Fixture.get()
+    level_path = path.join(_Fixture.levelDir.name, f'{columns}x{rows}_{seed}{LevelFile.EXTENSION}')
+    with open(level_path, 'wb') as level_file:
+        level_file.write(LevelFile.compile(structure))
+
+    return level_path
+
+
+def build_level(level_type, level_path: str = None):
+    screen, managers = _Fixture.get()
+    player = PlayerBody(COLORS['RED'], PLAYER_SIZE, PLAYER_SIZE, managers)
+    level = level_type(screen, (SCR_WIDTH, SCR_HEIGHT), managers, player)
+    if level_path is not None:
+        level._fill_level(LevelFile(level_path))
+        level.levelInit = (FLOOR_SIZE + 5, FLOOR_SIZE + 5)
+
+    player.rect.topleft = level.levelInit
+    player.plainLevel = level.plainLevel
+    player.fallLimit = level.fallLimit
+    # Builds the chunks around the player, as the first level update would
+    level._stream_chunks()
+    return level
+
+
+def time_it(operation, number: int = 1, repeat: int = REPEAT, setup=None) -> float:
+    """ :return: Median seconds per operation """
+    samples = []
+    for i in range(repeat):
+        if setup is not None:
+            setup()
+        start = default_timer()
+        for n in range(number):
+            operation()
+        samples.append((default_timer() - start) / number)
+
+    return median(samples)
+
+
+# ---------------------------- BENCHMARKS ----------------------------
+@benchmark('fill_level.Level1')
+def fill_level_1():
+    return time_it(lambda: build_level(Level1).unload())
+
+
+@benchmark('fill_level.Level2')
+def fill_level_2():
+    return time_it(lambda: build_level(Level2).unload())
+
+
+def _fill_large(columns: int, rows: int):
+    def fill_large():
+        # The map is generated when the benchmark runs, never on import
+        level_path = generate_level(columns, rows)
+        return time_it(lambda: build_level(_PlainLevel, level_path).unload(), repeat=3)
+
+    return fill_large
+
+
+for _columns, _rows in LARGE_MAPS:
+    benchmark(f'fill_level.large_{_columns}x{_rows}')(_fill_large(_columns, _rows))
+
+
+def _player_update(level, frames: int = 600) -> float:
+    player = level.player
+
+    def frame():
+        # The player goes back and forth, to keep colliding against the same zone
+        player.direction.right = frame.count % 240 < 120
+        player.direction.left = not player.direction.right
+        player.update(level._solid_group, level._weak_group, level._tileGrid)
+        frame.count += 1
+
+    frame.count = 0
+    return time_it(frame, frames)
+
+
+@benchmark('player_update.Level2')
+def player_update_level_2():
+    return _player_update(build_level(Level2))
+
+
+@benchmark('player_update.large')
+def player_update_large():
+    columns, rows = LARGE_MAPS[-1]
+    return _player_update(build_level(_PlainLevel, generate_level(columns, rows)))
+
+
+@benchmark('display.Level1')
+def display_level_1():
+    level = build_level(Level1)
+    level.step(10)
+    return time_it(level.display, 200)
+
+
+@benchmark('display.Level2')
+def display_level_2():
+    level = build_level(Level2)
+    level.step(10)
+    return time_it(level.display, 200)
+
+
+@benchmark('scroll.large')
+def scroll_large():
+    columns, rows = LARGE_MAPS[-1]
+    level = build_level(_PlainLevel, generate_level(columns, rows))
+    player = level.player
+
+    def scroll():
+        # A long walk across the level, scrolling (and streaming its chunks) on every step
+        player.rect.x = (player.rect.x + 7) % level.camera.bounds.width
+        level._scroll()
+        level._stream_chunks()
+
+    return time_it(scroll, 2000)
+
+
+def _particle_system():
+    screen, managers = _Fixture.get()
+    level_area = (0, 0, SCR_WIDTH * 2, SCR_HEIGHT * 2)
+    return screen, ParticleSystem(level_area, PARTICLES, COLORS['WHITE'], jitter=(0.5, 0.5), drift=0.3, seed=0)
+
+
+@benchmark(f'particles.update_{PARTICLES}')
+def particles_update():
+    screen, particles = _particle_system()
+    return time_it(particles.update, 200)
+
+
+@benchmark(f'particles.display_{PARTICLES}')
+def particles_display():
+    screen, particles = _particle_system()
+    camera = Camera(screen.get_size())
+    return time_it(lambda: particles.draw(screen, camera), 200)
+
+
+@benchmark('fonts.cold')
+def fonts_cold():
+    """ Font lookups with an empty cache, as every screen did before sharing them """
+    _Fixture.get()
+    return time_it(lambda: FontManager().get_font('Calibri', 25, True), 20)
+
+
+@benchmark('fonts.warm')
+def fonts_warm():
+    screen, managers = _Fixture.get()
+    managers.font.get_font('Calibri', 25, True)
+    return time_it(lambda: managers.font.get_font('Calibri', 25, True), 1000)
+
+
+@benchmark('startup.title')
+def startup_title():
+    """ Cold startup in a fresh interpreter, following 'PrimalRing.main' until the first title frame """
+    code = ("from Headless import init_headless\n"
+            "from managers import managers\n"
+            "from SaveGame import SaveGame\n"
+            "from PrimalRing import configuration_preset, set_game_window\n"
+            "from views.Title.TitleScreen import TitleScreen\n"
+            "from constants import SCR_HEIGHT, SCR_WIDTH\n"
+            "init_headless(managers)\n"
+            "config = SaveGame.load_config()\n"
+            "screen = configuration_preset(config, (SCR_WIDTH, SCR_HEIGHT), managers)\n"
+            "set_game_window(managers.image)\n"
+            "TitleScreen(screen, (SCR_WIDTH, SCR_HEIGHT), managers, config).display_frame()\n")
+    env = dict(environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+
+    def start():
+        process = subprocess.run([sys.executable, '-c', code], cwd=GAME_ROOT, env=env, capture_output=True, text=True)
+        if process.returncode != 0:
+            raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    return time_it(start, repeat=3)
+
+
+# ---------------------------- RUNNER ----------------------------
+def run(names=None) -> dict:
+    """ :return: Benchmark name -> Seconds per operation (or the error which stopped it) """
+    results = {}
+    for name, function in BENCHMARKS.items():
+        if not _selected(name, names):
+            continue
+        try:
+            results[name] = function()
+        except Exception as e:
+            results[name] = {'error': f'{type(e).__name__}: {e}'}
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float, names=None) -> tuple:
+    """ :return: (Name, current seconds, baseline seconds, ratio) for every regression found, and (name, reason) for
+             every benchmark which failed or, being selected, is missing against the baseline """
+    thresholds = baseline.get('thresholds', {})
+    regressions = []
+    failures = [(name, result['error']) for name, result in results.items() if not isinstance(result, float)]
+    for name, reference in baseline.get('results', {}).items():
+        if not _selected(name, names) or not isinstance(reference, float):
+            continue
+        current = results.get(name)
+        if current is None:
+            failures.append((name, "missing from the results"))
+        elif isinstance(current, float):
+            ratio = current / reference
+            if ratio > 1 + thresholds.get(name, threshold):
+                regressions.append((name, current, reference, ratio))
+
+    return regressions, failures
+
+
+def _selected(name: str, names) -> bool:
+    """ :return: True if a benchmark is asked for by the name filter (all of them if there's no filter) """
+    return not names or any(name.startswith(prefix) for prefix in names)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Primal Ring benchmark suite")
+    parser.add_argument('names', nargs='*', help="Only run the benchmarks starting with these names")
+    parser.add_argument('--output', help="Writes the results into this JSON file")
+    parser.add_argument('--baseline', help="Compares the results against this JSON file")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Default slowdown ratio allowed")
+    parser.add_argument('--save-baseline', help="Stores the results as a new baseline in this JSON file")
+    options = parser.parse_args(args)
+
+    results = run(options.names)
+    for name, result in results.items():
+        if isinstance(result, float):
+            print(f'{name:<32} {result * 1e3:>12.4f} ms')
+        else:
+            print(f'{name:<32} {result["error"]}')
+
+    document = {'python': platform.python_version(), 'machine': platform.machine(), 'results': results}
+    for file_name in (options.output, options.save_baseline):
+        if file_name:
+            with open(file_name, 'w') as file:
+                json.dump(document, file, indent=2)
+
+    baseline = {}
+    if options.baseline:
+        with open(options.baseline) as file:
+            baseline = json.load(file)
+    regressions, failures = compare(results, baseline, options.threshold, options.names)
+    for name, current, reference, ratio in regressions:
+        print(f'REGRESSION {name}: {current * 1e3:.4f} ms vs {reference * 1e3:.4f} ms ({ratio:.2f}x)')
+    for name, reason in failures:
+        print(f'FAILURE {name}: {reason}')
+
+    return 1 if regressions or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
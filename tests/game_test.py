@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import builtins
+import pytest
+import pygame
+from os import path
+from types import SimpleNamespace
+from Headless import init_headless, ScriptedInput
+from managers.AnimationManager import AnimationManager
+from managers.FontManager import FontManager
+from managers.ImageManager import ImageManager
+from managers.LocalizationManager import LocalizationManager
+from managers.ManagerDataClass import ManagerDataClass
+from managers.StatsManager import StatsManager
+from models.Level._LevelBase import _LevelBase
+from Game import Game
+from constants import COLORS, SCR_HEIGHT, SCR_WIDTH
+
+GAME_ROOT = path.dirname(path.dirname(path.realpath(__file__)))
+
+
+@pytest.fixture()
+def managers(monkeypatch) -> ManagerDataClass:
+    monkeypatch.setattr(_LevelBase, 'LEVEL_DIR', f'{GAME_ROOT}/resources/levels/')
+    init_headless()
+    managers = ManagerDataClass()
+    managers.image = ImageManager(f'{GAME_ROOT}/resources/images/')
+    managers.animation = AnimationManager(managers.image)
+    managers.font = FontManager()
+    managers.localization = LocalizationManager(f'{GAME_ROOT}/resources/localization')
+    managers.localization.set_lang('en')
+    # The game music and sound effects aren't shipped along with the game sources
+    managers.sound = SimpleNamespace(play_music=lambda *args: None, stop_music=lambda: None,
+                                     pause_music=lambda *args: None, play_fx=lambda name: None, panic=lambda: None)
+    yield managers
+    builtins.__dict__.pop('_', None)
+    pygame.quit()
+
+
+@pytest.fixture()
+def game_sut(managers: ManagerDataClass) -> Game:
+    return Game(pygame.display.get_surface(), (SCR_WIDTH, SCR_HEIGHT), managers, event_source=ScriptedInput())
+
+
+def test_unload(game_sut: Game, managers: ManagerDataClass):
+    # Test values
+    game_sut.step(5)
+    game_sut._prebuilds["The RING"].join()
+    levels = list(game_sut._builtLevels.values())
+    preloaded_file, tile_grid = game_sut._preloads["The RING"]
+
+    # Execution
+    game_sut.unload()
+
+    # Validation
+    assert [level.ID for level in levels] == ["Doom Valley"]
+    assert not managers.image._owners and not managers.animation._owners
+    assert managers.image.ref_count('Lava_Frames/Lava1.png', COLORS['BLACK']) == 0
+    assert all(level._levelFile is None for level in levels)
+    assert preloaded_file._map.closed
+    assert not game_sut._builtLevels and not game_sut._prebuilds and not game_sut._preloads
+
+
+def test_preload_next_level(game_sut: Game):
+    # Test values
+    game_sut._prebuilds["The RING"].join()
+    preloaded_file, tile_grid = game_sut._preloads["The RING"]
+
+    # Execution
+    game_sut._enter_level("The RING")
+
+    # Validation
+    assert game_sut._level.ID == "The RING"
+    assert game_sut._level._levelFile is preloaded_file and game_sut._level._tileGrid is tile_grid
+    assert game_sut.player in game_sut._level.player_display
+    assert list(game_sut._builtLevels) == ["The RING"] and not game_sut._preloads
+
+
+def test_pause_freezes_frame(game_sut: Game, monkeypatch):
+    # Test values
+    game_sut._eventSource.press(2, pygame.K_p).press(5, pygame.K_p)
+    displays = []
+    monkeypatch.setattr(game_sut._level, 'display', lambda alpha=1.0: displays.append(alpha))
+
+    # Execution
+    game_sut.step(3)
+    paused, frozen, backdrop = game_sut._pause.flag, game_sut._frozenFrame, game_sut._pause.screen.backdrop
+    displays_when_paused = len(displays)
+    game_sut.step(2)
+    displays_while_paused = len(displays)
+    game_sut.step(1)
+
+    # Validation
+    assert paused and frozen is not None and frozen is backdrop
+    assert displays_when_paused == 3            # Two game frames, and the frame frozen when the game was paused
+    assert displays_while_paused == 3
+    assert not game_sut._pause.flag and game_sut._frozenFrame is None
+    assert len(displays) == 4
+
+
+def test_stats_collection(game_sut: Game, managers: ManagerDataClass):
+    # Test values
+    managers.stats = StatsManager(window=100)
+
+    # Execution
+    game_sut.step(5)
+
+    # Validation
+    assert len(managers.stats.frames) == 5
+    assert set(managers.stats.frames[-1].phases) == {'events', 'logic', 'display'}
+    counters = managers.stats.summary()['counters']
+    assert counters['Bodies'] > 0 and counters['Chunks'] > 0
+    assert 'HUD redraws' in counters and 'Culled' in counters
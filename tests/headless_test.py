@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+import pygame
+from os import path
+from Headless import init_headless, ScriptedInput
+from managers.AnimationManager import AnimationManager
+from managers.FontManager import FontManager
+from managers.ImageManager import ImageManager
+from managers.ManagerDataClass import ManagerDataClass
+from models.Bodies.PlayerBody import PlayerBody
+from models.Level.Level1 import Level1
+from models.Level._LevelBase import _LevelBase
+from constants import COLORS, PLAYER_SIZE, SCR_HEIGHT, SCR_WIDTH
+
+
+@pytest.fixture()
+def level_sut(monkeypatch) -> Level1:
+    game_root = path.dirname(path.dirname(path.realpath(__file__)))
+    monkeypatch.setattr(_LevelBase, 'LEVEL_DIR', f'{game_root}/resources/levels/')
+    screen = init_headless()
+    managers = ManagerDataClass()
+    managers.image = ImageManager(f'{game_root}/resources/images/')
+    managers.animation = AnimationManager(managers.image)
+    managers.font = FontManager()
+    player = PlayerBody(COLORS['RED'], PLAYER_SIZE, PLAYER_SIZE, managers)
+    level = Level1(screen, (SCR_WIDTH, SCR_HEIGHT), managers, player)
+    player.rect.topleft = level.levelInit
+    player.fallLimit = level.fallLimit
+    yield level
+    pygame.quit()
+
+
+def test_scripted_input():
+    # Test values
+    script = ScriptedInput().hold(1, 3, pygame.K_RIGHT).quit(3)
+
+    # Execution
+    frames = [script() for _ in range(5)]
+
+    # Validation
+    assert frames[0] == [] and frames[2] == [] and frames[4] == []
+    assert frames[1][0].type == pygame.KEYDOWN and frames[1][0].key == pygame.K_RIGHT
+    assert [event.type for event in frames[3]] == [pygame.KEYUP, pygame.QUIT]
+
+
+def test_level_step(level_sut: Level1):
+    # Execution
+    left = level_sut.step(3000, True)
+
+    # Validation
+    assert not left
+    assert not level_sut.player.isDead
+    assert level_sut.player.rect.bottom == level_sut.camera.bounds.bottom - 50
+
+
+def test_chunk_streaming(level_sut: Level1):
+    # Test values
+    level_sut.streamMargin = 0
+    level_sut.step(1)
+    coins = [body for body in level_sut._weak_group if body.rect.topleft == (60, 60)]
+
+    # Execution
+    coins[0].kill()
+    level_sut.player.rect.topleft = (1500, 950)
+    level_sut.step(2)
+    taken = dict(level_sut.takenItems)
+    level_sut.player.rect.topleft = level_sut.levelInit
+    level_sut.step(1)
+
+    # Validation
+    assert len(coins) == 1
+    assert taken == {(0, 0): {(1, 1)}}
+    assert not [body for body in level_sut._weak_group if body.rect.topleft == (60, 60)]
+
+
+def test_taken_items(level_sut: Level1):
+    # Test values
+    level_sut.take_items([(1, 1)])
+    level_sut.step(1)
+    coins = [body for body in level_sut._weak_group if body.rect.topleft == (60, 60)]
+
+    # Execution
+    cell, item = next((cell, item) for tiles, items in level_sut._streamed.values() for cell, item in items.items())
+    item.kill()
+
+    # Validation
+    assert not coins
+    assert level_sut.taken_cells() == sorted([(1, 1), cell])
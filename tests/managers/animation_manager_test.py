@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import gc
+import pytest
+from os import environ, path
+from pygame import display
+from managers.AnimationManager import AnimationManager
+from managers.ImageManager import ImageManager
+
+
+class Owner:
+    """ Any level, as far as the managers are concerned """
+
+
+@pytest.fixture()
+def image_manager() -> ImageManager:
+    environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    display.init()
+    display.set_mode((1, 1))
+    yield ImageManager(f'{path.dirname(path.dirname(path.dirname(path.realpath(__file__))))}/resources/images/')
+    display.quit()
+
+
+@pytest.fixture()
+def animation_manager_sut(image_manager: ImageManager) -> AnimationManager:
+    return AnimationManager(image_manager)
+
+
+def test_get_shared(animation_manager_sut: AnimationManager):
+    # Execution
+    first = animation_manager_sut.get('Lava_Frames/Lava', 10)
+    second = animation_manager_sut.get('Lava_Frames/Lava', 10)
+
+    # Validation
+    assert first is second
+    assert len(first.frames) == 10
+    assert first.frame.get_colorkey() is not None
+
+
+def test_update(animation_manager_sut: AnimationManager):
+    # Test values
+    animation = animation_manager_sut.get('Lava_Frames/Lava', 10)
+
+    # Execution
+    for _ in range(3):
+        animation_manager_sut.update()
+
+    # Validation
+    assert animation.index == 1
+    assert animation.frame is animation.frames[1]
+
+
+def test_release(animation_manager_sut: AnimationManager, image_manager: ImageManager):
+    # Test values
+    level = Owner()
+
+    # Execution
+    with image_manager.owned_by(level):
+        animation = animation_manager_sut.get('SP_Frames/save_point', 12)
+    animation_manager_sut.release(level)
+
+    # Validation
+    assert animation_manager_sut.get('SP_Frames/save_point', 12) is not animation
+
+
+def test_collected_owner(animation_manager_sut: AnimationManager, image_manager: ImageManager):
+    # Test values
+    level = Owner()
+    with image_manager.owned_by(level):
+        animation = animation_manager_sut.get('SP_Frames/save_point', 12)
+
+    # Execution
+    del level
+    gc.collect()
+
+    # Validation
+    assert animation_manager_sut.get('SP_Frames/save_point', 12) is not animation
+    assert image_manager.ref_count('SP_Frames/save_point1.png', [0x00, 0x00, 0x00]) == 1
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pygame
+import pytest
+from os import path
+from managers.FontManager import FontManager
+
+
+@pytest.fixture()
+def font_manager_sut() -> FontManager:
+    pygame.font.init()
+    # pygame ships its default font file, which stands for any font resource here
+    yield FontManager(f'{path.dirname(pygame.__file__)}/')
+    pygame.font.quit()
+
+
+def test_get_font_shared(font_manager_sut: FontManager):
+    # Execution
+    first = font_manager_sut.get_font('Calibri', 25, True)
+    second = font_manager_sut.get_font('Calibri', 25, True)
+    other = font_manager_sut.get_font('Calibri', 16, True)
+
+    # Validation
+    assert first is second
+    assert other is not first
+    assert (font_manager_sut.stats.hits, font_manager_sut.stats.misses) == (1, 2)
+    assert font_manager_sut.stats.cold_mean() > 0
+
+
+def test_get_font_file(font_manager_sut: FontManager):
+    # Execution
+    font = font_manager_sut.get_font('freesansbold.ttf', 30, italic=True)
+
+    # Validation
+    assert font.get_italic() and not font.get_bold()
+    assert font_manager_sut.get_font('freesansbold.ttf', 30, italic=True) is font
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import gc
 import pytest
-from pygame import error
+from os import environ, path
+from pygame import display, error
 from managers.ImageManager import ImageManager
 
 
+class Owner:
+    """ Any level, as far as the managers are concerned """
+
+
 @pytest.fixture()
 def image_manager_sut() -> ImageManager:
     return ImageManager()
@@ -25,4 +31,90 @@ def test_load_image(image_manager_sut: ImageManager):
 
     # Execution
     with pytest.raises(error):
-        image_manager_sut.load_image(bad_image_dir)
\ No newline at end of file
+        image_manager_sut.load_image(bad_image_dir)
+
+@pytest.fixture()
+def cached_image_manager_sut() -> ImageManager:
+    environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    display.init()
+    display.set_mode((1, 1))
+    yield ImageManager(f'{path.dirname(path.dirname(path.dirname(path.realpath(__file__))))}/resources/images/')
+    display.quit()
+
+
+def test_load_image_shared(cached_image_manager_sut: ImageManager):
+    # Execution
+    first = cached_image_manager_sut.load_image("Coin_Frames/coin.png")
+    second = cached_image_manager_sut.load_image("Coin_Frames/coin.png")
+
+    # Validation
+    assert first is second
+    assert cached_image_manager_sut.stats.misses == 1
+    assert cached_image_manager_sut.stats.hits == 1
+    assert cached_image_manager_sut.stats.bytes == first.get_pitch() * first.get_height()
+
+
+def test_load_image_colorkey(cached_image_manager_sut: ImageManager):
+    # Execution
+    plain = cached_image_manager_sut.load_image("Coin_Frames/coin.png")
+    keyed = cached_image_manager_sut.load_image("Coin_Frames/coin.png", [0xFF, 0xFF, 0xFF])
+
+    # Validation
+    assert plain is not keyed
+    assert plain.get_colorkey() is None
+    assert keyed.get_colorkey()[:3] == (0xFF, 0xFF, 0xFF)
+
+
+def test_release(cached_image_manager_sut: ImageManager):
+    # Test values
+    first_level, second_level = Owner(), Owner()
+
+    # Execution
+    with cached_image_manager_sut.owned_by(first_level):
+        cached_image_manager_sut.load_image("Life.png")
+        cached_image_manager_sut.load_image("Energy.png")
+    with cached_image_manager_sut.owned_by(second_level):
+        cached_image_manager_sut.load_image("Life.png")
+    cached_image_manager_sut.release(first_level)
+
+    # Validation
+    assert cached_image_manager_sut.ref_count("Life.png") == 1
+    assert cached_image_manager_sut.ref_count("Energy.png") == 0
+    assert cached_image_manager_sut.stats.evictions == 1
+
+    cached_image_manager_sut.release(second_level)
+    assert cached_image_manager_sut.stats.bytes == 0
+
+
+def test_collected_owner(cached_image_manager_sut: ImageManager):
+    # Test values
+    level = Owner()
+    with cached_image_manager_sut.owned_by(level):
+        cached_image_manager_sut.load_image("Life.png")
+
+    # Execution
+    del level
+    gc.collect()
+
+    # Validation
+    assert cached_image_manager_sut.ref_count("Life.png") == 0
+    assert cached_image_manager_sut.stats.evictions == 1
+    assert cached_image_manager_sut.stats.bytes == 0
+
+
+def test_plain_surface_release(image_manager_sut: ImageManager):
+    # Test values
+    level = Owner()
+
+    # Execution
+    with image_manager_sut.owned_by(level):
+        first = image_manager_sut.plain_surface([0x00, 0x00, 0xFF], 50, 50)
+        second = image_manager_sut.plain_surface([0x00, 0x00, 0xFF], 50, 50)
+    shared = image_manager_sut.stats.hits, image_manager_sut.stats.misses
+    image_manager_sut.release(level)
+
+    # Validation
+    assert first is second and shared == (1, 1)
+    assert first.get_at((10, 10))[:3] == (0x00, 0x00, 0xFF)
+    assert not image_manager_sut._cache and image_manager_sut.stats.bytes == 0
+    assert image_manager_sut.stats.evictions == 1
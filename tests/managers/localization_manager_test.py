@@ -1,13 +1,60 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import builtins
+import pygame
 import pytest
+from os import path
 from managers.LocalizationManager import LocalizationManager
 
 
 @pytest.fixture()
 def localization_manager_sut() -> LocalizationManager:
-    return LocalizationManager()
+    yield LocalizationManager(f'{path.dirname(path.dirname(path.dirname(path.realpath(__file__))))}'
+                              f'/resources/localization')
+    builtins.__dict__.pop('_', None)
 
 
 def test_set_lang(localization_manager_sut: LocalizationManager):
-    pass
+    # Validation
+    assert list(localization_manager_sut.languages) == ['en', 'es']
+    assert not localization_manager_sut._catalogs
+
+    # Execution
+    localization_manager_sut.set_lang('es')
+
+    # Validation
+    assert list(localization_manager_sut._catalogs) == ['es']
+    assert _("New Game") == "Nuevo Juego"
+    assert _("Not translated") == "Not translated"
+
+
+def test_unload(localization_manager_sut: LocalizationManager):
+    # Test values
+    localization_manager_sut.set_lang('es')
+    localization_manager_sut.set_lang('en')
+
+    # Execution & validation
+    assert not localization_manager_sut.unload('en')
+    assert localization_manager_sut.unload('es')
+    assert list(localization_manager_sut._catalogs) == ['en']
+    localization_manager_sut.set_lang('es')
+    assert _("Options") == "Opciones"
+
+
+def test_render_cache():
+    # Test values
+    pygame.font.init()
+    localization = LocalizationManager(text_cache_size=2)
+    font = pygame.font.Font(None, 20)
+
+    # Execution
+    first = localization.render(font, "New Game", [0xFF, 0xFF, 0xFF])
+    again = localization.render(font, "New Game", [0xFF, 0xFF, 0xFF])
+    localization.render(font, "New Game", [0x80, 0x80, 0x80])
+    localization.render(font, "Options", [0xFF, 0xFF, 0xFF])
+    evicted = localization.render(font, "New Game", [0xFF, 0xFF, 0xFF])
+
+    # Validation
+    assert again is first and evicted is not first
+    assert localization.textStats == LocalizationManager.CacheStats(hits=1, misses=4, evictions=2)
+    assert localization.textStats.hit_rate() == 0.2
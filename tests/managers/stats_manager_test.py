@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from managers.StatsManager import StatsManager
+
+
+@pytest.fixture()
+def stats_manager_sut() -> StatsManager:
+    return StatsManager(window=100)
+
+
+def test_phases(stats_manager_sut: StatsManager):
+    # Execution
+    stats_manager_sut.begin_frame()
+    with stats_manager_sut.phase('logic'):
+        pass
+    with stats_manager_sut.phase('display'):
+        pass
+    stats_manager_sut.count('Bodies', 10)
+    stats_manager_sut.end_frame()
+
+    # Validation
+    frame = stats_manager_sut.frames[-1]
+    assert set(frame.phases) == {'logic', 'display'}
+    assert frame.time == sum(frame.phases.values())
+    assert stats_manager_sut.summary()['counters'] == {'Bodies': 10}
+
+
+def test_outside_frame(stats_manager_sut: StatsManager):
+    # Execution
+    with stats_manager_sut.phase('logic'):
+        pass
+    stats_manager_sut.count('Bodies', 10)
+    stats_manager_sut.end_frame()
+
+    # Validation
+    assert stats_manager_sut.frames == []
+    assert stats_manager_sut.summary()['p99'] == 0
+
+
+def test_percentile(stats_manager_sut: StatsManager):
+    # Test values
+    for time in range(1, 101):
+        stats_manager_sut._frames.append(StatsManager.FrameRecord(time=time / 1000))
+
+    # Validation
+    assert stats_manager_sut.percentile(50) == 0.05
+    assert stats_manager_sut.percentile(95) == 0.095
+    assert stats_manager_sut.percentile(99) == 0.099
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+import subprocess
+import sys
+from os import path
+from models.Bodies.CollisionRegistry import CollisionRegistry
+from models.Bodies.FloorBody import FloorBody
+from models.Bodies.HoleBody import HoleBody
+from models.Level.LevelFile import LevelFile
+from models.Level.TileGrid import TileGrid
+
+GAME_ROOT = path.dirname(path.dirname(path.dirname(path.dirname(path.realpath(__file__)))))
+
+
+class _TestFloorBody(FloorBody):
+    pass
+
+
+@pytest.fixture()
+def registry_sut() -> CollisionRegistry:
+    yield CollisionRegistry
+    CollisionRegistry.unregister(_TestFloorBody)
+
+
+def test_registered_bodies(registry_sut: CollisionRegistry):
+    # Validation
+    assert registry_sut.handler(FloorBody, registry_sut.X) is FloorBody.push_x
+    assert registry_sut.handler(LevelFile.FLOOR, registry_sut.Y) is FloorBody.push_y
+    assert registry_sut.handler(LevelFile.HOLE_METAL, registry_sut.Y) is HoleBody.suck_y
+    assert registry_sut.handler(LevelFile.EMPTY, registry_sut.X) is None
+
+
+def test_inherited_handlers(registry_sut: CollisionRegistry):
+    # Execution & validation
+    assert registry_sut.handler(_TestFloorBody, registry_sut.X) is FloorBody.push_x
+
+    registry_sut.register(_TestFloorBody, on_y=HoleBody.suck_y)
+    assert registry_sut.handler(_TestFloorBody, registry_sut.X) is None
+    assert registry_sut.handler(_TestFloorBody, registry_sut.Y) is HoleBody.suck_y
+
+    registry_sut.unregister(_TestFloorBody)
+    assert registry_sut.handler(_TestFloorBody, registry_sut.Y) is FloorBody.push_y
+
+
+def test_registered_on_import():
+    # Test values
+    code = ("from models.Bodies.PlayerBody import PlayerBody\n"
+            "from models.Bodies.CollisionRegistry import CollisionRegistry\n"
+            "from models.Bodies.FloorBody import FloorBody\n"
+            "from models.Bodies.LavaBody import LavaBody\n"
+            "assert CollisionRegistry.handler(FloorBody, CollisionRegistry.Y) is FloorBody.push_y\n"
+            "assert CollisionRegistry.handler(LavaBody, CollisionRegistry.X) is not None\n"
+            "from models.Level.TileGrid import TileGrid\n"
+            "from models.Level.LevelFile import LevelFile\n"
+            "assert CollisionRegistry.handler(LevelFile.FLOOR, CollisionRegistry.Y) is FloorBody.push_y\n")
+
+    # Execution
+    process = subprocess.run([sys.executable, '-c', code], cwd=GAME_ROOT, capture_output=True, text=True)
+
+    # Validation
+    assert process.returncode == 0, process.stderr
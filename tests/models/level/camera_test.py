@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from pygame import Rect
+from models.Level.Camera import Camera
+
+
+@pytest.fixture()
+def camera_sut() -> Camera:
+    camera = Camera((800, 600))
+    camera.set_bounds(Rect(0, 0, 3200, 1000))
+    return camera
+
+
+def test_follow(camera_sut: Camera):
+    # Execution
+    camera_sut.follow(Rect(1500, 500, 40, 40))
+
+    # Validation
+    assert camera_sut.view.center == (1520, 520)
+    assert camera_sut.offset == (-1120, -220)
+
+
+def test_follow_on_corners(camera_sut: Camera):
+    # Execution & validation
+    camera_sut.follow(Rect(10, 10, 40, 40))
+    assert camera_sut.view.topleft == (0, 0)
+
+    camera_sut.follow(Rect(3150, 950, 40, 40))
+    assert camera_sut.view.bottomright == (3200, 1000)
+
+
+def test_apply(camera_sut: Camera):
+    # Execution
+    camera_sut.follow(Rect(1500, 500, 40, 40))
+
+    # Validation
+    assert camera_sut.apply(Rect(1500, 500, 40, 40)).center == (400, 300)
+
+
+def test_between(camera_sut: Camera):
+    # Test values
+    camera_sut.follow(Rect(1500, 500, 40, 40))
+    camera_sut.mark()
+    camera_sut.follow(Rect(1600, 500, 40, 40))
+
+    # Execution & validation
+    with camera_sut.between(0.25) as view:
+        assert view.topleft == (1145, 220)
+        assert camera_sut.offset == (-1145, -220)
+    assert camera_sut.view.topleft == (1220, 220)
+    with camera_sut.between(1.0) as view:
+        assert view.topleft == (1220, 220)
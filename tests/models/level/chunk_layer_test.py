@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from pygame import Rect, Surface
+from Headless import init_headless
+from models.Level.Camera import Camera
+from models.Level.ChunkLayer import ChunkLayer
+from constants import CHUNK_COLORKEY
+
+
+@pytest.fixture()
+def chunk_layer_sut() -> ChunkLayer:
+    init_headless()
+    return ChunkLayer(chunk_size=100)
+
+
+@pytest.fixture()
+def tile() -> Surface:
+    tile = Surface((50, 50)).convert()
+    tile.fill((0x00, 0x00, 0xFF))
+    return tile
+
+
+def test_add_across_chunks(chunk_layer_sut: ChunkLayer, tile: Surface):
+    # Execution
+    chunk_layer_sut.add(tile, Rect(75, 25, 50, 50))
+    chunk_layer_sut.bake()
+
+    # Validation
+    assert set(chunk_layer_sut._chunks) == {(0, 0), (1, 0)}
+    first, second = chunk_layer_sut._chunks[(0, 0)], chunk_layer_sut._chunks[(1, 0)]
+    assert first.get_at((80, 30))[:3] == (0x00, 0x00, 0xFF)
+    assert second.get_at((20, 70))[:3] == (0x00, 0x00, 0xFF)
+    assert first.get_colorkey()[:3] == tuple(CHUNK_COLORKEY)
+    assert first.get_at((10, 10))[:3] == tuple(CHUNK_COLORKEY)
+
+
+def test_draw_visible_chunks(chunk_layer_sut: ChunkLayer, tile: Surface):
+    # Test values
+    camera = Camera((200, 200))
+    camera.set_bounds(Rect(0, 0, 1000, 1000))
+    for left in range(0, 1000, 50):
+        chunk_layer_sut.add(tile, Rect(left, 950, 50, 50))
+    chunk_layer_sut.bake()
+    screen = init_headless(scr_size=(200, 200))
+
+    # Execution
+    camera.follow(Rect(500, 900, 40, 40))
+    screen.fill((0x00, 0x00, 0x00))
+    chunk_layer_sut.draw(screen, camera)
+
+    # Validation
+    assert len(chunk_layer_sut._chunks) == 10
+    assert chunk_layer_sut.blits == 3
+    assert screen.get_at((100, 175))[:3] == (0x00, 0x00, 0xFF)
+    assert screen.get_at((100, 100))[:3] == (0x00, 0x00, 0x00)
+
+
+def test_release(chunk_layer_sut: ChunkLayer, tile: Surface):
+    # Test values
+    chunk_layer_sut.add(tile, Rect(0, 0, 50, 50))
+    chunk_layer_sut.add(tile, Rect(100, 0, 50, 50))
+
+    # Execution
+    chunk_layer_sut.release((1, 0))
+    chunk_layer_sut.bake()
+
+    # Validation
+    assert set(chunk_layer_sut._chunks) == {(0, 0)}
+    assert chunk_layer_sut._chunks[(0, 0)].get_colorkey() is not None
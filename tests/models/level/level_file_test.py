@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from glob import glob
+from os import path
+from models.Level.LevelFile import LevelFile
+
+LEVEL_DIR = f'{path.dirname(path.dirname(path.dirname(path.dirname(path.realpath(__file__)))))}/resources/levels'
+
+
+@pytest.fixture()
+def level_file_sut(tmp_path) -> LevelFile:
+    level_path = tmp_path / f'test{LevelFile.EXTENSION}'
+    level_path.write_bytes(LevelFile.compile(["fffff",
+                                              "fc hf",
+                                              "fhpvf",
+                                              "f  Pf",
+                                              "fffff"]))
+    level_file = LevelFile(str(level_path))
+    yield level_file
+    level_file.close()
+
+
+def test_tiles(level_file_sut: LevelFile):
+    # Execution
+    tiles = {(column, row): tile for column, row, tile in level_file_sut.tiles()}
+
+    # Validation
+    assert (level_file_sut.columns, level_file_sut.rows) == (5, 5)
+    assert level_file_sut.reference == ((0, 0), (4, 4))
+    assert tiles[(3, 1)] == LevelFile.HOLE_FLOOR
+    assert tiles[(1, 2)] == LevelFile.HOLE_METAL
+    assert level_file_sut.tile(0, 2) == LevelFile.FLOOR
+    assert (2, 1) not in tiles and level_file_sut.tile(2, 1) == LevelFile.EMPTY
+    assert len(tiles) == 18
+
+
+def test_entities(level_file_sut: LevelFile):
+    # Validation
+    assert level_file_sut.coins() == [(1, 1)]
+    assert level_file_sut.platforms() == [(2, 2, 'Y'), (3, 3, 'X')]
+    assert level_file_sut.power_ups() == [(3, 2, LevelFile.LIFE)]
+
+
+def test_compile_wrong_level():
+    # Execution & validation
+    with pytest.raises(ValueError):
+        LevelFile.compile(["ff", "fx"])
+    with pytest.raises(ValueError):
+        LevelFile.compile(["ff", "f "])
+
+
+@pytest.mark.parametrize('source_path', glob(f'{LEVEL_DIR}/*{LevelFile.SOURCE_EXTENSION}'))
+def test_compiled_levels_up_to_date(source_path: str, tmp_path):
+    # Execution
+    compiled_path = LevelFile.compile_file(source_path, str(tmp_path / 'level'))
+
+    # Validation
+    with open(compiled_path, 'rb') as compiled, open(source_path[:-4] + LevelFile.EXTENSION, 'rb') as shipped:
+        assert compiled.read() == shipped.read()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+import pygame
+from os import path
+from Headless import init_headless
+from managers.AnimationManager import AnimationManager
+from managers.FontManager import FontManager
+from managers.ImageManager import ImageManager
+from managers.ManagerDataClass import ManagerDataClass
+from models.Bodies.PlayerBody import PlayerBody
+from models.Bodies._BodyBase import _BodyBase
+from models.Level.Level1 import Level1
+from models.Level.ParticleSystem import ParticleSystem
+from models.Level._LevelBase import _LevelBase
+from constants import COLORS, FLOOR_SIZE, PLAYER_SIZE, SCR_HEIGHT, SCR_WIDTH, SNOW_FLAKES
+
+GAME_ROOT = path.dirname(path.dirname(path.dirname(path.dirname(path.realpath(__file__)))))
+
+
+class CountedBody(_BodyBase):
+    """ A body counting its own updates """
+    __slots__ = ('updates',)
+
+    def __init__(self, managers):
+        super().__init__(COLORS['GREEN'], FLOOR_SIZE, FLOOR_SIZE, managers)
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+
+@pytest.fixture()
+def level_sut(monkeypatch) -> Level1:
+    monkeypatch.setattr(_LevelBase, 'LEVEL_DIR', f'{GAME_ROOT}/resources/levels/')
+    screen = init_headless()
+    managers = ManagerDataClass()
+    managers.image = ImageManager(f'{GAME_ROOT}/resources/images/')
+    managers.animation = AnimationManager(managers.image)
+    managers.font = FontManager()
+    player = PlayerBody(COLORS['RED'], PLAYER_SIZE, PLAYER_SIZE, managers)
+    level = Level1(screen, (SCR_WIDTH, SCR_HEIGHT), managers, player)
+    player.rect.topleft = level.levelInit
+    player.fallLimit = level.fallLimit
+    yield level
+    pygame.quit()
+
+
+def test_cull_far_bodies(level_sut: Level1):
+    # Test values
+    level_sut.camera.follow(level_sut.player.rect)
+    near, far = CountedBody(level_sut._managers), CountedBody(level_sut._managers)
+    level_sut._set_body(near, *level_sut.levelInit, level_sut._solid_group)
+    level_sut._set_body(far, level_sut.camera.bounds.right - FLOOR_SIZE, 0, level_sut._solid_group)
+
+    # Execution
+    level_sut.step(10)
+    level_sut.display()
+
+    # Validation
+    assert near.updates == 10
+    assert far.updates == 0
+    assert far not in level_sut._active_bodies()
+    assert level_sut.cullStats.culled >= 1
+    assert level_sut.cullStats.updated + level_sut.cullStats.culled == len(level_sut._bodies)
+    assert level_sut.cullStats.drawn < len(level_sut._bodies)
+
+
+def test_snow_particles(level_sut: Level1):
+    # Test values
+    if not ParticleSystem.available:
+        pytest.skip("The snow falls as plain bodies without NumPy")
+    snow, on_touch = level_sut._particles[0]
+    start, life = snow._position.copy(), level_sut.player.life
+
+    # Execution
+    level_sut.step(5)
+
+    # Validation
+    assert (snow._position[:, 1] != start[:, 1]).any()
+    # Flakes falling on the player hurt it and melt away
+    assert life - level_sut.player.life == SNOW_FLAKES - len(snow)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from pygame import Rect
+from Headless import init_headless
+from models.Level.Camera import Camera
+from models.Level.ParticleSystem import ParticleSystem
+
+pytest.importorskip('numpy')
+
+
+@pytest.fixture()
+def particle_system_sut() -> ParticleSystem:
+    init_headless()
+    return ParticleSystem(Rect(0, 0, 1000, 1000), 500, [0xFF, 0xFF, 0xFF], seed=0)
+
+
+def test_update_respawn(particle_system_sut: ParticleSystem):
+    # Execution
+    for i in range(1000):
+        particle_system_sut.update()
+
+    # Validation
+    assert len(particle_system_sut) == 500
+    assert particle_system_sut.bounds.collidepoint(particle_system_sut._position.min(axis=0).tolist())
+    assert particle_system_sut.bounds.collidepoint(particle_system_sut._position.max(axis=0).tolist())
+
+
+def test_lifetime():
+    # Test values
+    init_headless()
+    sparks = ParticleSystem(Rect(0, 0, 1000, 1000), 100, [0xFF, 0x00, 0x00], spawn=Rect(500, 900, 10, 10),
+                            velocity=(0, -2), jitter=(1, 1), gravity=0.05, lifetime=20, seed=0)
+
+    # Execution
+    for i in range(20):
+        sparks.update()
+
+    # Validation
+    assert (sparks._age < 20).all()
+    assert Rect(480, 0, 50, 1000).collidepoint(sparks._position.mean(axis=0).tolist())
+
+
+def test_collide_and_draw(particle_system_sut: ParticleSystem):
+    # Test values
+    screen = init_headless()
+    camera = Camera(screen.get_size())
+
+    # Execution
+    touched = particle_system_sut.collide(Rect(0, 0, 500, 1000))
+    drawn = particle_system_sut.draw(screen, camera)
+
+    # Validation
+    assert 200 < touched < 300
+    assert len(particle_system_sut) == 500 - touched
+    assert 0 < drawn < len(particle_system_sut)
+
+
+def test_draw_between_updates():
+    # Test values
+    screen = init_headless()
+    camera = Camera(screen.get_size())
+    flake = ParticleSystem(Rect(0, 0, 1000, 1000), 1, [0xFF, 0xFF, 0xFF], velocity=(0, 10), seed=0)
+    flake._position[:] = flake._previous[:] = (100, 100)
+
+    # Execution
+    flake.update()
+    screen.fill((0x00, 0x00, 0x00))
+    flake.draw(screen, camera, 0.5)
+
+    # Validation
+    assert flake._previous.tolist() == [[100, 100]] and flake._position.tolist() == [[100, 110]]
+    assert screen.get_at((100, 105))[:3] == (0xFF, 0xFF, 0xFF)
+    assert screen.get_at((100, 110))[:3] == (0x00, 0x00, 0x00)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from pygame import Rect
+from managers.ImageManager import ImageManager
+from managers.ManagerDataClass import ManagerDataClass
+from models.Bodies.FloorBody import FloorBody
+from models.Bodies.PlatformBody import PlatformBody
+from models.Level.SpatialGroup import SpatialGroup
+from constants import COLORS, FLOOR_SIZE
+
+
+MANAGERS = ManagerDataClass()
+MANAGERS.image = ImageManager()
+
+
+def _body(body_type, x: int, y: int, *args):
+    body = body_type(COLORS['BLUE'], FLOOR_SIZE, FLOOR_SIZE, MANAGERS, *args)
+    body.rect.topleft = (x, y)
+    return body
+
+
+@pytest.fixture()
+def spatial_group_sut() -> SpatialGroup:
+    return SpatialGroup(*[_body(FloorBody, x * FLOOR_SIZE, 0) for x in range(100)])
+
+
+def test_query(spatial_group_sut: SpatialGroup):
+    # Execution
+    candidates = spatial_group_sut.query(Rect(120, 10, 40, 40))
+
+    # Validation
+    assert [body.rect.x for body in candidates] == [100, 150]
+
+
+def test_collide_kill(spatial_group_sut: SpatialGroup):
+    # Test values
+    player = _body(FloorBody, 120, 10)
+
+    # Execution
+    hits = spatial_group_sut.collide(player, True)
+
+    # Validation
+    assert len(hits) == 2
+    assert spatial_group_sut.candidates == 2
+    assert len(spatial_group_sut) == 98
+    assert spatial_group_sut.query(player.rect) == []
+
+
+def test_refresh_dynamic_bodies(spatial_group_sut: SpatialGroup):
+    # Test values
+    platform = _body(PlatformBody, 0, 500, [0, 500])
+    spatial_group_sut.add(platform)
+
+    # Execution
+    platform.rect.x = 1000
+    spatial_group_sut.refresh()
+
+    # Validation
+    assert platform not in spatial_group_sut.query(Rect(0, 500, 10, 10))
+    assert platform in spatial_group_sut.query(Rect(1000, 500, 10, 10))
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from pygame import Rect
+from models.Level.LevelFile import LevelFile
+from models.Level.TileGrid import TileGrid
+
+
+@pytest.fixture()
+def tile_grid_sut(tmp_path) -> TileGrid:
+    level_path = tmp_path / f'test{LevelFile.EXTENSION}'
+    level_path.write_bytes(LevelFile.compile(["ffff",
+                                              "f hf",
+                                              "fl f",
+                                              "ffff"]))
+    with LevelFile(str(level_path)) as level_file:
+        return TileGrid.from_level(level_file, (LevelFile.FLOOR, LevelFile.HOLE_FLOOR))
+
+
+def test_from_level(tile_grid_sut: TileGrid):
+    # Validation
+    assert tile_grid_sut.get(0, 0) == LevelFile.FLOOR
+    assert tile_grid_sut.get(2, 1) == LevelFile.HOLE_FLOOR
+    assert tile_grid_sut.get(1, 2) == LevelFile.EMPTY
+    assert tile_grid_sut.get(-1, 0) == tile_grid_sut.get(0, 4) == LevelFile.EMPTY
+
+
+def test_collide(tile_grid_sut: TileGrid):
+    # Execution
+    hits = tile_grid_sut.collide(Rect(80, 80, 40, 40))
+
+    # Validation
+    assert hits == [(LevelFile.HOLE_FLOOR, Rect(100, 50, 50, 50))]
+    assert tile_grid_sut.candidates == 4
+
+
+def test_collide_beyond_limits(tile_grid_sut: TileGrid):
+    # Execution
+    hits = tile_grid_sut.collide(Rect(-20, 190, 40, 40))
+
+    # Validation
+    assert hits == [(LevelFile.FLOOR, Rect(0, 150, 50, 50))]
+    assert tile_grid_sut.candidates == 1
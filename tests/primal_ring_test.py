@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from PrimalRing import run_logic_steps
+from constants import MAX_CATCH_UP, TICK_RATE
+
+STEP = 1 / TICK_RATE
+
+
+class CountedScene:
+    """ A scene counting its own logic updates """
+
+    def __init__(self):
+        self.updates = 0
+
+    def run_logic(self):
+        self.updates += 1
+
+
+@pytest.fixture()
+def scene_sut() -> CountedScene:
+    return CountedScene()
+
+
+def test_run_logic_steps(scene_sut: CountedScene):
+    # Test values
+    lag = 2.5 * STEP
+
+    # Execution
+    lag, steps = run_logic_steps(scene_sut, lag, STEP)
+
+    # Validation
+    assert steps == scene_sut.updates == 2
+    assert lag == pytest.approx(0.5 * STEP)
+
+
+def test_run_logic_steps_catch_up(scene_sut: CountedScene):
+    # Test values
+    lag = (MAX_CATCH_UP + 10.5) * STEP
+
+    # Execution
+    lag, steps = run_logic_steps(scene_sut, lag, STEP)
+
+    # Validation
+    assert steps == scene_sut.updates == MAX_CATCH_UP
+    # The time left behind is dropped: the next frame won't run more updates to catch up with it
+    assert lag == STEP
+    assert run_logic_steps(scene_sut, lag, STEP) == (0, 1)
+
+
+@pytest.mark.parametrize('lag', [0, 0.3 * STEP, STEP, 4.9 * STEP, 100 * STEP])
+def test_run_logic_steps_alpha(scene_sut: CountedScene, lag: float):
+    # Execution
+    lag, steps = run_logic_steps(scene_sut, lag, STEP)
+
+    # Validation
+    assert 0 <= lag / STEP <= 1
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+import pickle
+import pytest
+import zlib
+from SaveFile import SaveFile
+
+
+@pytest.fixture()
+def save_file_sut() -> dict:
+    return {"Name": "Player", "Life": [3, 100], "Energy": [40, 100], "Coins": [12, 100],
+            "Level": {'ID': 'Doom Valley', 'PositionX': 1500, 'PositionY': -20},
+            "TakenItems": {'Doom Valley': [(column, 30) for column in range(0, 600, 3)], 'The RING': []}}
+
+
+def test_encode_decode(save_file_sut: dict):
+    # Execution
+    compressed = SaveFile.encode(save_file_sut)
+    plain = SaveFile.encode(save_file_sut, compress=False)
+
+    # Validation
+    assert len(compressed) < len(plain)
+    assert SaveFile.decode(compressed) == save_file_sut
+    assert SaveFile.decode(plain) == save_file_sut
+    assert list(SaveFile.sections(plain)) == [SaveFile.PLAYER, SaveFile.TAKEN_ITEMS]
+
+
+def test_decode_unknown_section(save_file_sut: dict):
+    # Test values
+    header = SaveFile.HEADER
+    payload = SaveFile.encode(save_file_sut, compress=False)[header.size:] + SaveFile._section(b'NEWS', b'1234')
+    data = header.pack(SaveFile.MAGIC, SaveFile.VERSION, 0, zlib.crc32(payload), len(payload)) + payload
+
+    # Execution & validation
+    assert SaveFile.decode(data) == save_file_sut
+
+
+def test_decode_damaged(save_file_sut: dict):
+    # Test values
+    data = bytearray(SaveFile.encode(save_file_sut))
+    data[-1] ^= 0xFF
+
+    # Execution & validation
+    with pytest.raises(ValueError):
+        SaveFile.decode(bytes(data))
+    with pytest.raises(ValueError):
+        SaveFile.decode(SaveFile.MAGIC + b'\x01')
+
+
+def test_migrate(save_file_sut: dict):
+    # Test values
+    del save_file_sut['TakenItems']
+
+    # Execution
+    migrated = SaveFile.decode(pickle.dumps(save_file_sut))
+
+    # Validation
+    assert migrated == dict(save_file_sut, TakenItems={})
+
+
+def test_migrate_refuses_globals():
+    # Execution & validation
+    with pytest.raises(ValueError):
+        SaveFile.migrate(pickle.dumps({"Name": os.system}))
+
+
+@pytest.mark.parametrize('damage', [{"Name": None}, {"Life": "3/100"}, {"Coins": [12]},
+                                    {"Level": {'ID': None, 'PositionX': 1500, 'PositionY': -20}},
+                                    {"Level": {'ID': 'Doom Valley', 'PositionX': '1500', 'PositionY': -20}},
+                                    {"TakenItems": [(3, 30)]}, {"TakenItems": {'Doom Valley': [(3, '30')]}}])
+def test_migrate_damaged(save_file_sut: dict, damage: dict):
+    # Test values
+    save_file_sut.update(damage)
+
+    # Execution & validation
+    with pytest.raises(ValueError):
+        SaveFile.migrate(pickle.dumps(save_file_sut))
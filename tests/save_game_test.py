@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import builtins
+import os
+import pickle
+import pytest
+from os import path
+from types import SimpleNamespace
+from pygame import Rect
+from Headless import init_headless
+from managers.FontManager import FontManager
+from managers.LocalizationManager import LocalizationManager
+from managers.ManagerDataClass import ManagerDataClass
+from SaveFile import SaveFile
+from SaveGame import SaveGame
+
+GAME_ROOT = path.dirname(path.dirname(path.realpath(__file__)))
+
+
+@pytest.fixture()
+def save_game_sut(monkeypatch, tmp_path) -> SaveGame:
+    monkeypatch.setattr(SaveGame, 'SAVE_DIR', f'{tmp_path}/saves/')
+    screen = init_headless()
+    managers = ManagerDataClass()
+    managers.font = FontManager()
+    managers.localization = LocalizationManager(f'{GAME_ROOT}/resources/localization')
+    managers.localization.set_lang('en')
+    player = SimpleNamespace(name='Player', life=3, maxLife=5, energy=1, maxEnergy=5, coins=7, maxWallet=99,
+                             rect=Rect(120, 80, 40, 40))
+    level = SimpleNamespace(ID='Doom Valley', player=player, taken_cells=lambda: [(1, 1), (20, 3)])
+    yield SaveGame(screen, screen.get_size(), managers, level)
+    builtins.__dict__.pop('_', None)
+
+
+def test_save_file(save_game_sut: SaveGame):
+    # Execution
+    save_game_sut.save_file().join()
+
+    # Validation
+    assert save_game_sut.game_saved and not save_game_sut.save_failed
+    game_data = SaveGame.load_file('Player')
+    assert game_data['Level'] == {'ID': 'Doom Valley', 'PositionX': 120, 'PositionY': 80}
+    assert game_data['TakenItems'] == {'Doom Valley': [(1, 1), (20, 3)]}
+    assert SaveGame.load_files() == ['Player.sv']
+
+
+def test_save_file_keeps_other_levels(save_game_sut: SaveGame):
+    # Test values
+    save_game_sut.takenItems = {'The RING': [(5, 5)], 'Doom Valley': [(9, 9)]}
+
+    # Execution
+    save_game_sut.save_file().join()
+
+    # Validation
+    assert SaveGame.load_file('Player')['TakenItems'] == {'The RING': [(5, 5)], 'Doom Valley': [(1, 1), (20, 3)]}
+
+
+def test_save_file_unexpected_error(save_game_sut: SaveGame, monkeypatch):
+    # Test values
+    def encode(player_status):
+        raise ValueError("Unexpected")
+    monkeypatch.setattr(SaveFile, 'encode', encode)
+
+    # Execution
+    save_game_sut.save_file().join()
+
+    # Validation
+    assert save_game_sut.save_failed and not save_game_sut.game_saved
+    assert save_game_sut._saver is None
+    assert SaveGame.load_files() is None
+
+
+def test_write_atomically_keeps_old_file(tmp_path):
+    # Test values
+    file_path = str(tmp_path / 'Player.sv')
+    SaveGame.write_atomically(file_path, pickle.dumps({'Life': 1}))
+
+    # Execution
+    with pytest.raises(TypeError):
+        SaveGame.write_atomically(file_path, {'Life': 2})
+
+    # Validation
+    with open(file_path, 'rb') as game_file:
+        assert pickle.load(game_file) == {'Life': 1}
+    assert os.listdir(tmp_path) == ['Player.sv']
+
+
+def test_load_old_file(monkeypatch, tmp_path):
+    # Test values
+    monkeypatch.setattr(SaveGame, 'SAVE_DIR', f'{tmp_path}/')
+    game_data = {"Name": "Player", "Life": [3, 5], "Energy": [1, 5], "Coins": [7, 99],
+                 "Level": {'ID': 'The RING', 'PositionX': 10, 'PositionY': 20}}
+    (tmp_path / 'Player.sv').write_bytes(pickle.dumps(game_data))
+
+    # Execution
+    loaded = SaveGame.load_file('Player')
+
+    # Validation
+    assert loaded == dict(game_data, TakenItems={})
+    assert (tmp_path / 'Player.sv').read_bytes().startswith(SaveFile.MAGIC)
+    assert SaveGame.load_file('Player') == loaded
+
+
+def test_load_damaged_old_file(monkeypatch, tmp_path):
+    # Test values
+    monkeypatch.setattr(SaveGame, 'SAVE_DIR', f'{tmp_path}/')
+    game_data = pickle.dumps({"Name": "Player", "Life": [3, 5], "Energy": [1, 5], "Coins": [7, 99],
+                              "Level": {'ID': None, 'PositionX': 10, 'PositionY': 20}})
+    (tmp_path / 'Player.sv').write_bytes(game_data)
+
+    # Execution
+    loaded = SaveGame.load_file('Player')
+
+    # Validation
+    assert loaded is None
+    assert (tmp_path / 'Player.sv').read_bytes() == game_data
+
+
+def test_load_old_file_upgrade_error(monkeypatch, tmp_path):
+    # Test values
+    monkeypatch.setattr(SaveGame, 'SAVE_DIR', f'{tmp_path}/')
+    game_data = {"Name": "Player", "Life": [3, 5], "Energy": [1, 5], "Coins": [7, 99],
+                 "Level": {'ID': 'The RING', 'PositionX': 10, 'PositionY': 20}}
+    (tmp_path / 'Player.sv').write_bytes(pickle.dumps(game_data))
+
+    def encode(player_status: dict):
+        raise RuntimeError("Unexpected encoding error")
+
+    monkeypatch.setattr(SaveFile, 'encode', encode)
+
+    # Execution
+    loaded = SaveGame.load_file('Player')
+
+    # Validation
+    assert loaded == dict(game_data, TakenItems={})
+    assert (tmp_path / 'Player.sv').read_bytes() == pickle.dumps(game_data)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from pygame import Rect, Surface
+from Headless import init_headless
+from views.DirtyRenderer import DirtyRenderer
+
+
+@pytest.fixture()
+def dirty_renderer_sut() -> DirtyRenderer:
+    return DirtyRenderer(init_headless())
+
+
+def test_render(dirty_renderer_sut: DirtyRenderer):
+    # Test values
+    background, cursor = Surface((800, 600)), Surface((20, 20))
+    cursor.fill([0xFF, 0xFF, 0xFF])
+
+    # Execution & validation
+    assert dirty_renderer_sut.render([(background, (0, 0)), (cursor, (100, 100))]) == [Rect(0, 0, 800, 600)]
+    assert dirty_renderer_sut.render([(background, (0, 0)), (cursor, (100, 100))]) == []
+    assert sorted(dirty_renderer_sut.render([(background, (0, 0)), (cursor, (102, 100))])) == \
+        [Rect(100, 100, 20, 20), Rect(102, 100, 20, 20)]
+    assert dirty_renderer_sut.screen.get_at((100, 100))[:3] == (0, 0, 0)
+    assert dirty_renderer_sut.screen.get_at((102, 100))[:3] == (0xFF, 0xFF, 0xFF)
+
+    cursor.set_alpha(128)
+    assert dirty_renderer_sut.render([(background, (0, 0)), (cursor, (102, 100))]) == [Rect(102, 100, 20, 20)]
+
+    dirty_renderer_sut.invalidate()
+    assert dirty_renderer_sut.render([(background, (0, 0)), (cursor, (102, 100))]) == [Rect(0, 0, 800, 600)]
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from pygame import Surface, font
+from Headless import init_headless
+from views.HUD import HUD
+
+
+@pytest.fixture()
+def hud_sut() -> HUD:
+    init_headless()
+    return HUD(font.SysFont('Calibri', 25, True, False), [Surface((20, 20)), Surface((20, 20))])
+
+
+def test_display(hud_sut: HUD):
+    # Test values
+    screen = init_headless()
+
+    # Execution
+    hud_sut.display(screen, (3, 10))
+    first = hud_sut._counters[0].text
+    hud_sut.display(screen, (3, 10))
+    hud_sut.display(screen, (3, 9))
+
+    # Validation
+    assert hud_sut.redraws == 3
+    assert hud_sut._counters[0].text is first
+    assert hud_sut._counters[1].text.get_width() == hud_sut.atlas.width(': 9')
+
+
+def test_render_missing_glyph(hud_sut: HUD):
+    # Execution & validation
+    assert hud_sut.atlas.render(': -10').get_height() == hud_sut.atlas.height
+    with pytest.raises(ValueError):
+        hud_sut.atlas.render('x')
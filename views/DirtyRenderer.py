@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pygame
+from pygame import Rect
+
+
+class DirtyRenderer:
+    MAX_RECTS = 8           # Dirty areas repainted one by one; beyond this, their bounding box is repainted at once
+
+    def __init__(self, screen):
+        """ Repaints only the screen areas which changed since the previous frame. Screens describe every frame
+        as a list of layers, (surface, position) pairs from the bottom to the top, and this compares them with the
+        previous ones: a layer is taken as unchanged while it's the same surface, at the same place and with the
+        same alpha. Areas where some layer appeared, moved or left are repainted with all the layers over them.
+
+        :param screen: A reference for the main screen """
+        self.screen = screen
+        self._drawn = None          # Layers on the screen, as (surface, rect, alpha); None repaints everything
+
+    # ---------- Public Methods --------------------------
+    def render(self, layers: list) -> list:
+        """ Draws the changed areas of a frame. The bottom layer must be opaque and cover the whole screen, so any
+        area may be repainted from scratch.
+
+        :param layers: (Surface, position) pairs, from the bottom to the top
+        :return: The repainted screen areas (empty if nothing changed) """
+        frame = [(surface, tuple(Rect(position, surface.get_size())), surface.get_alpha())
+                 for surface, position in layers]
+        screen_rect = self.screen.get_rect()
+        if self._drawn is None:
+            dirty = [screen_rect]
+        else:
+            changed = set(self._drawn).symmetric_difference(frame)
+            dirty = [screen_rect.clip(rect) for rect in {rect for surface, rect, alpha in changed}]
+            dirty = [rect for rect in dirty if rect.width and rect.height]
+            if len(dirty) > self.MAX_RECTS:
+                dirty = [dirty[0].unionall(dirty[1:])]
+
+        for area in dirty:
+            self.screen.set_clip(area)
+            self.screen.blits([(surface, rect[:2]) for surface, rect, alpha in frame if area.colliderect(rect)],
+                              False)
+        self.screen.set_clip(None)
+        self._drawn = frame
+        return dirty
+
+    def invalidate(self) -> None:
+        """ Repaints the whole screen on the next frame (after anything else drew on it, or some layer surface
+        changed its content) """
+        self._drawn = None
+
+    @staticmethod
+    def present(rects: list) -> None:
+        """ Sends some repainted screen areas to the display
+
+        :param rects: The repainted areas """
+        if rects:
+            pygame.display.update(rects)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pygame
+from pygame import Rect, Surface
+from constants import ANTIALIASING
+
+
+class GlyphAtlas:
+    DIGITS = '0123456789'
+
+    def __init__(self, font, characters: str, color: [], antialiasing: bool = ANTIALIASING):
+        """ A fixed set of characters rasterized once into a single surface. Texts made only of those characters
+        are composed by copying their glyphs, without going through the font renderer again.
+
+        :param font: The font the glyphs are rendered with
+        :param characters: Characters kept into the atlas
+        :param color: Glyphs color
+        :param antialiasing: Smooths the glyphs if True """
+        glyphs = {char: font.render(char, antialiasing, color).convert_alpha() for char in dict.fromkeys(characters)}
+        self.height = font.get_height()
+        self.surface = Surface((sum(glyph.get_width() for glyph in glyphs.values()), self.height), pygame.SRCALPHA)
+        self._areas = {}            # Character -> Its glyph area into the atlas surface
+        left = 0
+        for char, glyph in glyphs.items():
+            # The atlas is fully transparent, so the glyphs are copied as they are instead of blended
+            self.surface.blit(glyph, (left, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._areas[char] = Rect(left, 0, glyph.get_width(), self.height)
+            left += glyph.get_width()
+
+    # ---------- Public Methods --------------------------
+    def __contains__(self, char: str) -> bool:
+        return char in self._areas
+
+    def width(self, text: str) -> int:
+        """ :return: The width of a text composed from the atlas glyphs """
+        return sum(self._areas[char].width for char in text)
+
+    def render(self, text: str) -> Surface:
+        """ Composes a text from the atlas glyphs
+
+        :param text: The text, made only of characters kept into the atlas
+        :return: A new surface with the text """
+        missing = [char for char in text if char not in self._areas]
+        if missing:
+            raise ValueError(f"Characters {''.join(missing)!r} aren't in the glyph atlas")
+
+        surface = Surface((max(self.width(text), 1), self.height), pygame.SRCALPHA)
+        left = 0
+        for char in text:
+            area = self._areas[char]
+            surface.blit(self.surface, (left, 0), area, pygame.BLEND_RGBA_MAX)
+            left += area.width
+
+        return surface
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .GlyphAtlas import GlyphAtlas
+from constants import COLORS
+
+
+class HUD:
+    def __init__(self, font, icons: list, position: tuple = (50, 50), spacing: int = 30, color: [] = None):
+        """ Player counters (life, energy, coins...) drawn as an icon followed by its value. Numbers are composed
+        from a glyph atlas, and every counter keeps its last text: it's only composed again when its value changes.
+
+        :param font: The counters font
+        :param icons: One icon per counter, from the top to the bottom
+        :param position: Top left corner of the first counter
+        :param spacing: Distance between two counters, from the top of one to the top of the next one
+        :param color: Counters text color (white if None) """
+        self.atlas = GlyphAtlas(font, f': -{GlyphAtlas.DIGITS}', COLORS['WHITE'] if color is None else color)
+        self.icons = icons
+        self.position = position
+        self.spacing = spacing
+        self.redraws = 0                    # Counter texts composed since this was reset
+        self._counters = [HUD._Counter() for icon in icons]
+
+    # ---------- Public Methods --------------------------
+    def display(self, screen, values: list) -> None:
+        """ Blits every counter
+
+        :param screen: The main screen
+        :param values: One integer value per counter, in the icons order """
+        left, top = self.position
+        blits = []
+        for icon, counter, value in zip(self.icons, self._counters, values):
+            if counter.value != value:
+                counter.value = value
+                counter.text = self.atlas.render(f': {value}')
+                self.redraws += 1
+            blits.append((icon, (left, top)))
+            blits.append((counter.text, (left + 30, top)))
+            top += self.spacing
+
+        screen.blits(blits, False)
+
+    # ---------- Helpers --------------------------
+    class _Counter:
+        __slots__ = ('value', 'text')
+
+        def __init__(self):
+            self.value = None               # Last displayed value
+            self.text = None                # Its composed text
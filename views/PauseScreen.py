@@ -2,11 +2,11 @@
 # -*- coding: utf-8 -*-
 import pygame
 from ._Screen import _Screen
-from constants import COLORS, SURFACE_MID_ALPHA, ANTIALIASING
+from constants import COLORS, SURFACE_MID_ALPHA
 
 
 class PauseScreen(_Screen):
-    def __init__(self, screen, scr_size, managers, player, debug: bool = False):
+    def __init__(self, screen, scr_size, managers, player, backdrop=None, debug: bool = False):
         """ This class will display our status and let us check, select and use items, save our progress,
         checking our tasks and more things I haven't thought yet. There's a minimal chance of including this
         class on the Level file, so beware of it if you dare to contribute to this project development!
@@ -15,6 +15,7 @@ class PauseScreen(_Screen):
         :param scr_size: The screen size (Default: 600 * 800)
         :param managers:
         :param player: A reference to the player and his statistics
+        :param backdrop: The game frame shown behind this screen (what the screen shows now if None)
         :param debug: Flag for debugging into the game """
         super().__init__(screen, scr_size, managers, debug)
         self._managers.sound.pause_music()
@@ -24,6 +25,8 @@ class PauseScreen(_Screen):
         self.resume = False
         # We make our background transparent
         self.background.set_alpha(SURFACE_MID_ALPHA)
+        # The game frame behind this screen doesn't change while it's open
+        self.backdrop = self.screen.copy() if backdrop is None else backdrop
         # Cursor elements
         self.cursorSurface = pygame.Surface((170, 25))     # Pause Screen' highlight cursor
         self.cursorSurface.fill(COLORS['GREEN'])
@@ -32,22 +35,22 @@ class PauseScreen(_Screen):
         self.cursor.x = self.scrSize[0] * 0.6
         self.cursor.y = self.scrSize[1] * 0.3
         # Setting the text font for the pause menu
-        self.font = pygame.font.SysFont('Calibri', 25, True, False)
+        self.font = self._managers.font.get_font('Calibri', 25, True)
         # Pause interface text (will include images on next versions)
         self.pauseText = self._init_pause_text()
         self.menuList = self._init_menu_list()
         self.currentMenu = 0
 
         for x in self.menuList:
-            self.pauseText.append(self.font.render(x['Name'], ANTIALIASING, COLORS['WHITE']))
+            self.pauseText.append(self._managers.localization.render(self.font, x['Name'], COLORS['WHITE']))
 
         # Debug
         if self.debug:
             pass
 
     # --------------- MAIN FLOW ---------------------
-    def event_handler(self):
-        for event in pygame.event.get():                    # User did something
+    def event_handler(self, events: list = None):
+        for event in pygame.event.get() if events is None else events:     # User did something
             if event.type == pygame.QUIT:                   # If user clicked close
                 self.quit_all = True
                 return True                                 # We are done so we exit this loop
@@ -80,22 +83,29 @@ class PauseScreen(_Screen):
         self.cursor.x = self.menuList[self.currentMenu]['Position'][0]
         self.cursor.y = self.menuList[self.currentMenu]['Position'][1]
 
-    def display(self):
-        # Background attached to all the window surface
-        self.screen.blit(self.background, [0, 0])
-        # Cursor
-        self.screen.blit(self.cursorSurface, [self.cursor.x, self.cursor.y])
-        # Pause text
-        self.screen.blit(self.pauseText[0], [self.scrSize[0] * 0.45, self.scrSize[1] * 0.1])
-        self.screen.blit(self.pauseText[1], [self.scrSize[0] * 0.2, self.scrSize[1] * 0.3])
-        self.screen.blit(self.pauseText[2], [self.scrSize[0] * 0.2, self.scrSize[1] * 0.4])
-        self.screen.blit(self.pauseText[3], [self.scrSize[0] * 0.2, self.scrSize[1] * 0.5])
-        for x in range(len(self.menuList)):
-            self.screen.blit(self.pauseText[x+4], self.menuList[x]['Position'])
+    def display(self) -> list:
+        """ Draws the pause screen over the game frame it was opened on, repainting only what changed since the
+        previous frame
+
+        :return: The repainted screen areas """
+        layers = [
+            # Frozen game frame, with the background attached to all the window surface
+            (self.backdrop, (0, 0)),
+            (self.background, (0, 0)),
+            # Cursor
+            (self.cursorSurface, (self.cursor.x, self.cursor.y)),
+            # Pause text
+            (self.pauseText[0], (self.scrSize[0] * 0.45, self.scrSize[1] * 0.1)),
+            (self.pauseText[1], (self.scrSize[0] * 0.2, self.scrSize[1] * 0.3)),
+            (self.pauseText[2], (self.scrSize[0] * 0.2, self.scrSize[1] * 0.4)),
+            (self.pauseText[3], (self.scrSize[0] * 0.2, self.scrSize[1] * 0.5))]
+        layers.extend((self.pauseText[x+4], self.menuList[x]['Position']) for x in range(len(self.menuList)))
         # Debug
         if self.debug:
             pass
 
+        return self._renderer.render(layers)
+
     # --------------- METHODS ---------------------
     def _init_menu_list(self) -> []:
         return [{'Name': _("- Inventory"), 'Position': [self.scrSize[0] * 0.6, self.scrSize[1] * 0.3]},
@@ -110,7 +120,7 @@ class PauseScreen(_Screen):
             _("Energy: {0}/{1}").format(self.player.energy, self.player.maxEnergy),
             _("Coins: {0}/{1}").format(self.player.coins, self.player.maxWallet),
         ]
-        return [self.font.render(texts[i], ANTIALIASING, COLORS['WHITE']) for i in range(len(texts))]
+        return [self._managers.localization.render(self.font, text, COLORS['WHITE']) for text in texts]
 
     def _go_down(self) -> None:
         """ Moves the pause screen cursor to the immediate inferior position """
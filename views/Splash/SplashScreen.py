@@ -2,10 +2,13 @@
 # -*- coding: utf-8 -*-
 import pygame
 from ._StageEnum import _StageEnum
-from constants import COLORS, FPS
+from views.DirtyRenderer import DirtyRenderer
+from constants import COLORS, FADE_STEP, TICK_RATE
 
 
 class SplashScreen:
+    HOLD_UPDATES = 2 * TICK_RATE            # Logic updates every image is held for (two seconds), between its fades
+
     def __init__(self, screen, scr_size, managers, debug: bool = False):
         """ This class holds the initial splash window, in which I put my fictional game dev studio
         and some partners and tools involved into this development.
@@ -17,7 +20,6 @@ class SplashScreen:
         """
         self.screen = screen
         self.debug = debug
-        self.fps = FPS
         # Opacity for fade in and fade out effects (254)
         self.opacity = 255
         # Animation flags
@@ -32,6 +34,8 @@ class SplashScreen:
         # Let's create another surface, which will go on the previous
         self.cover = pygame.Surface(scr_size)
         self.cover.set_alpha(self.opacity)
+        # Only fades repaint the screen; the still images are drawn once
+        self._renderer = DirtyRenderer(self.screen)
         # We set and play the main theme
         self._managers.sound.play_music('Main Theme')
 
@@ -65,36 +69,36 @@ class SplashScreen:
         else:
             self._fade_out(self._second_fade_out_complete)
 
-    def display_frame(self):
-        self.screen.blit(self.background, [0, 0])
-        self.screen.blit(self.cover, [0, 0])
+    def display_frame(self, alpha: float = 1.0):
+        rects = self._renderer.render([(self.background, (0, 0)), (self.cover, (0, 0))])
         if self.debug:
             pass
 
-        pygame.display.flip()
+        DirtyRenderer.present(rects)
 
     # -------- Internal Methods --------
     def _fade_in(self, callback, color_tag: str, stage_value):
         if self.opacity >= 0:
-            self._change_opacity(-2)
+            self._change_opacity(-FADE_STEP)
         else:
             self._hold(callback, color_tag, stage_value)
 
     def _hold(self, callback, color_tag: str, stage_value):
-        if self.ticker < self.fps:
-            self.ticker += self.fps / 120
+        if self.ticker < self.HOLD_UPDATES:
+            self.ticker += 1
         else:
             self.ticker = 0
             callback(color_tag, stage_value)
 
     def _fade_out(self, callback):
         if self.opacity <= 255:
-            self._change_opacity(2)
+            self._change_opacity(FADE_STEP)
         else:
             callback()
 
     def _start_fade_out(self, color_tag, stage_value):
         self.cover.fill(COLORS[color_tag])
+        self._renderer.invalidate()
         self._currentStage = stage_value
 
     def _first_fade_out_complete(self):
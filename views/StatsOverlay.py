@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pygame
+from constants import COLORS, SURFACE_MID_ALPHA, ANTIALIASING
+
+
+class StatsOverlay:
+    def __init__(self, screen, stats, font, refresh: int = 15):
+        """ Debug overlay showing the frame statistics: FPS, frame time percentiles, phase times and counters
+
+        :param screen: A reference for the main screen
+        :param stats: The stats manager
+        :param font: The text font
+        :param refresh: Frames between text updates (rendering text isn't free either) """
+        self.screen = screen
+        self._stats = stats
+        self._refresh = refresh
+        self._ticks = 0
+        self.font = font
+        self._lines = []
+        self._background = None
+
+    def display(self):
+        if self._ticks % self._refresh == 0:
+            self._lines = [self.font.render(text, ANTIALIASING, COLORS['WHITE']) for text in self._texts()]
+            self._background = pygame.Surface((max(line.get_width() for line in self._lines) + 10,
+                                               sum(line.get_height() for line in self._lines) + 10))
+            self._background.set_alpha(SURFACE_MID_ALPHA)
+        self._ticks += 1
+
+        left = self.screen.get_width() - self._background.get_width()
+        self.screen.blit(self._background, [left, 0])
+        top = 5
+        for line in self._lines:
+            self.screen.blit(line, [left + 5, top])
+            top += line.get_height()
+
+    def _texts(self) -> list:
+        summary = self._stats.summary()
+        texts = [f"FPS: {summary['fps']:.1f}",
+                 f"Frame p50/p95/p99: {summary['p50'] * 1e3:.2f} / {summary['p95'] * 1e3:.2f} / "
+                 f"{summary['p99'] * 1e3:.2f} ms"]
+        texts += [f"{name}: {seconds * 1e3:.2f} ms" for name, seconds in summary['phases'].items()]
+        texts += [f"{name}: {value}" for name, value in summary['counters'].items()]
+        return texts
@@ -19,7 +19,7 @@ class OptionsScreen(_Screen):
         # Volume interface
         self._init_volume_ui(VOLUME_BAR, SLIDER, COLORS["GREY"], COLORS["GREY"])
         # Language interface
-        self.langUtils = OptionsScreen._LangUIUtils(self.font)
+        self.langUtils = OptionsScreen._LangUIUtils(self.font, self._managers.localization)
         # Flag for complete game exit
         self.quit_all = False
         # Setting GUI controls
@@ -78,7 +78,7 @@ class OptionsScreen(_Screen):
                 'Position': [self.scrSize[0] * 0.2, self.scrSize[1] * 0.62]
             }]
 
-        options_txt = [font.render(option['Name'], ANTIALIASING, COLORS['WHITE']) for option in options]
+        options_txt = [self._managers.localization.render(font, option['Name'], COLORS['WHITE']) for option in options]
 
         if not refresh:
             current_menu = 0
@@ -179,32 +179,33 @@ class OptionsScreen(_Screen):
                                               + f'Effects slider x = {self.fxSliderPoint[0]}',
                                               ANTIALIASING, COLORS['WHITE'])
 
-    def display(self):
-        # Background attached to all the window surface
-        self.screen.blit(self.background, [0, 0])
-        # Cursor
-        self.screen.blit(self.cursorSurface, [self.cursor.x, self.cursor.y])
-        # Full screen interface
-        self.screen.blit(self.fullScreenTickBox,
-                         [self.optionList[0]['Position'][0] + 220, self.optionList[0]['Position'][1] + 8])
-        self.screen.blit(self.fullScreenTick,
-                         [self.optionList[0]['Position'][0] + 222, self.optionList[0]['Position'][1] + 10])
-        # Volume interface
-        self.screen.blit(self.volBar,
-                         [self.optionList[1]['Position'][0] + 220, self.optionList[1]['Position'][1] + 15])
-        self.screen.blit(self.volBar,
-                         [self.optionList[2]['Position'][0] + 220, self.optionList[2]['Position'][1] + 15])
-        self.screen.blit(self.fxSlider, self.fxSliderPoint)
-        self.screen.blit(self.musicSlider, self.musicSliderPoint)
-        # Language interface
-        self.screen.blit(self.langUtils.get_text(self.currentLang),
-                         [self.optionList[3]["Position"][0] + 220, self.optionList[3]["Position"][1]])
+    def display(self) -> list:
+        """ Draws the options screen, repainting only what changed since the previous frame
+
+        :return: The repainted screen areas """
+        layers = [
+            # Background attached to all the window surface
+            (self.background, (0, 0)),
+            # Cursor
+            (self.cursorSurface, (self.cursor.x, self.cursor.y)),
+            # Full screen interface
+            (self.fullScreenTickBox, (self.optionList[0]['Position'][0] + 220, self.optionList[0]['Position'][1] + 8)),
+            (self.fullScreenTick, (self.optionList[0]['Position'][0] + 222, self.optionList[0]['Position'][1] + 10)),
+            # Volume interface
+            (self.volBar, (self.optionList[1]['Position'][0] + 220, self.optionList[1]['Position'][1] + 15)),
+            (self.volBar, (self.optionList[2]['Position'][0] + 220, self.optionList[2]['Position'][1] + 15)),
+            (self.fxSlider, tuple(self.fxSliderPoint)),
+            (self.musicSlider, tuple(self.musicSliderPoint)),
+            # Language interface
+            (self.langUtils.get_text(self.currentLang),
+             (self.optionList[3]["Position"][0] + 220, self.optionList[3]["Position"][1]))]
         # Option text
-        for x in range(len(self.optText)):
-            self.screen.blit(self.optText[x], self.optionList[x]['Position'])
+        layers.extend((self.optText[x], self.optionList[x]['Position']) for x in range(len(self.optText)))
         # Debug
         if self.debug:
-            self.screen.blit(self.debugText, [100, 50])
+            layers.append((self.debugText, (100, 50)))
+
+        return self._renderer.render(layers)
 
     # ----------------------------- METHODS -----------------------------
     def _go_down(self):
@@ -270,17 +271,15 @@ class OptionsScreen(_Screen):
 
     # ---------------------------- HELPERS ----------------------------
     class _LangUIUtils:
-        def __init__(self, font):
+        def __init__(self, font, localization):
             self.current = 0
-            self.langTexts = {
-                0: {"ID": "en", "Text": font.render(_("English"), ANTIALIASING, COLORS["WHITE"])},
-                1: {"ID": "es", "Text": font.render(_("Spanish"), ANTIALIASING, COLORS["WHITE"])}
-            }
+            self._localization = localization
+            self.refresh(font)
 
         def refresh(self, font):
             self.langTexts = {
-                0: {"ID": "en", "Text": font.render(_("English"), ANTIALIASING, COLORS["WHITE"])},
-                1: {"ID": "es", "Text": font.render(_("Spanish"), ANTIALIASING, COLORS["WHITE"])}
+                0: {"ID": "en", "Text": self._localization.render(font, _("English"), COLORS["WHITE"])},
+                1: {"ID": "es", "Text": self._localization.render(font, _("Spanish"), COLORS["WHITE"])}
             }
 
         def get_id(self, index: int):
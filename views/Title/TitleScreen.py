@@ -3,8 +3,9 @@
 import pygame
 from views._Screen import _Screen
 from views._ScreenHolder import _ScreenHolder
+from views.DirtyRenderer import DirtyRenderer
 from .OptionsScreen import OptionsScreen
-from constants import COLORS, ANTIALIASING, ROOT
+from constants import COLORS, CURSOR_SPEED, FADE_STEP
 from SaveGame import SaveGame
 
 
@@ -23,9 +24,8 @@ class TitleScreen(_Screen):
         super().__init__(screen, scr_size, managers, debug)
         self._config = config
         # Setting the text fonts (set your own)
-        fonts_dir = f'{ROOT}/resources/fonts/'
-        self._font = pygame.font.Font(f'{fonts_dir}AceRecords.ttf', 30)
-        self._titleFont = pygame.font.Font(f'{fonts_dir}AceRecords.ttf', 100)
+        self._font = self._managers.font.get_font('AceRecords.ttf', 30)
+        self._titleFont = self._managers.font.get_font('AceRecords.ttf', 100)
         # Saved games list (or None)
         self._savedFiles = SaveGame.load_files()
         self._musicTheme = 'Main Theme'
@@ -45,19 +45,18 @@ class TitleScreen(_Screen):
         # Menu
         self.menuList, self.titleText, self.currentMenu = self._init_ui_text(self._font, self._titleFont)
         # Cursor elements
-        self.cursorSurface = self._managers.image.load_image(f"Cursor.png")
-        self.cursorSurface.set_colorkey(COLORS['WHITE'])
+        self.cursorSurface = self._managers.image.load_image(f"Cursor.png", COLORS['WHITE'])
         # Setting initial cursor's position
         self.cursor = self.cursorSurface.get_rect()
-        self.cursorDespl = self.cursor.x = self.menuList[0]['Position'][0] - 35
+        self.cursorDespl = self.cursorX = self.cursor.x = self.menuList[0]['Position'][0] - 35
         # Cursor direction and velocity (positive = right; negative = left)
-        self.cursorDir = 1
+        self.cursorDir = CURSOR_SPEED
         # If there are saved files, you'll be able to access the 'Load Game' menu
         if self._savedFiles is not None:
             self.flags['LoadGame'][1] = True
 
         if not self.flags['LoadGame'][1]:
-            self.titleText[1] = self._font.render(self.menuList[1]['Name'], ANTIALIASING, COLORS['GREY'])
+            self.titleText[1] = self._managers.localization.render(self._font, self.menuList[1]['Name'], COLORS['GREY'])
 
         if self.debug:
             pass
@@ -133,33 +132,36 @@ class TitleScreen(_Screen):
 
     def run_logic(self):
         # Cursor wiggles
-        self.cursor.x = self._wiggle(self.cursor.x)
+        # Kept apart from its rect, which rounds the slower wiggles to whole pixels
+        self.cursorX = self._wiggle(self.cursorX)
+        self.cursor.x = self.cursorX
         self.cursor.y = self.menuList[self.currentMenu]['Position'][1] + 3
         # We init the fade out animation if we start a game, new or loaded
         if self.initGame:
-            self._opacity += 2
+            self._opacity += FADE_STEP
             self._cover.set_alpha(self._opacity)
         elif self._options.flag:
             self._options.screen.update()
 
-    def display_frame(self):
-        if self._newGame.flag:
-            self._newGame.screen.display()
-        elif self._loadGame.flag:
-            self._loadGame.screen.display()
+    def display_frame(self, alpha: float = 1.0):
+        if self._newGame.flag or self._loadGame.flag:
+            (self._newGame if self._newGame.flag else self._loadGame).screen.display()
+            self.invalidate()
+            pygame.display.flip()
         elif self._options.flag:
-            self._options.screen.display()
+            # Sub-screens paint over the title, so it's repainted whole when they're closed
+            DirtyRenderer.present(self._options.screen.display())
+            self.invalidate()
         else:
-            self.screen.blit(self.background, [0, 0])
-            self.screen.blit(self.titleText[len(self.titleText) - 1], [150, 100])
-            self.screen.blit(self.cursorSurface, [self.cursor.x, self.cursor.y])
-            for x in range(len(self.menuList)):
-                self.screen.blit(self.titleText[x], self.menuList[x]['Position'])
-            self.screen.blit(self._cover, [0, 0])
+            layers = [(self.background, (0, 0)),
+                      (self.titleText[len(self.titleText) - 1], (150, 100)),
+                      (self.cursorSurface, (self.cursor.x, self.cursor.y))]
+            layers.extend((self.titleText[x], self.menuList[x]['Position']) for x in range(len(self.menuList)))
+            layers.append((self._cover, (0, 0)))
             if self.debug:
                 pass
 
-        pygame.display.flip()
+            DirtyRenderer.present(self._renderer.render(layers))
 
     # ---------- Public Methods --------------------
     def reset_opacity(self):
@@ -191,8 +193,9 @@ class TitleScreen(_Screen):
         }]
 
         # Title interface text
-        menu_txt = [font.render(x['Name'], ANTIALIASING, COLORS['WHITE']) for x in menu_list]
-        menu_txt.append(title_font.render("Primal Ring", ANTIALIASING, COLORS['WHITE']))
+        render = self._managers.localization.render
+        menu_txt = [render(font, x['Name'], COLORS['WHITE']) for x in menu_list]
+        menu_txt.append(render(title_font, "Primal Ring", COLORS['WHITE']))
         current_menu = self.currentMenu if refresh else 0
 
         return menu_list, menu_txt, current_menu
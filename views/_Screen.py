@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import pygame
+from views.DirtyRenderer import DirtyRenderer
 from constants import COLORS
 
 
@@ -20,6 +21,8 @@ class _Screen:
         # Setting a plane black background
         self.background = pygame.Surface(self.scrSize)
         self.background.fill(COLORS['BLACK'])
+        # Repaints only what changed between frames
+        self._renderer = DirtyRenderer(self.screen)
 
     def event_handler(self):
         pass
@@ -29,3 +32,7 @@ class _Screen:
 
     def display(self):
         pass
+
+    def invalidate(self):
+        """ Repaints the whole screen on the next frame, after something else drew on it """
+        self._renderer.invalidate()